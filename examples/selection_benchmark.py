@@ -0,0 +1,42 @@
+import timeit
+
+import numpy as np
+
+from golem.core.adapter import DirectAdapter
+from golem.core.dag.linked_graph_node import LinkedGraphNode
+from golem.core.optimisers.fitness import MultiObjFitness
+from golem.core.optimisers.genetic.operators.selection import _spea2_selection_loop, spea2_selection
+from golem.core.optimisers.graph import OptGraph
+from golem.core.optimisers.opt_history_objects.individual import Individual
+
+
+def get_population(size: int, num_of_objectives: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    adapter = DirectAdapter()
+    population = []
+    for values in rng.random((size, num_of_objectives)):
+        ind = Individual(adapter.adapt(OptGraph(LinkedGraphNode('node'))))
+        ind.set_evaluation_result(MultiObjFitness(tuple(values), weights=-1.))
+        population.append(ind)
+    return population
+
+
+def run_spea2_benchmark(sizes=(50, 100, 200, 400), num_of_objectives: int = 2, repeats: int = 3):
+    """Compares vectorized SPEA-II selection with the original one on random populations
+    (of doubled size, as in the optimizer) and checks that they select the same individuals."""
+    print(f'{"Population":>10} | {"Original, s":>11} | {"Vectorized, s":>13} | {"Speedup":>7}')
+    for size in sizes:
+        population = get_population(size * 2, num_of_objectives)
+        selected = spea2_selection(population, size)
+        assert selected == _spea2_selection_loop(population, size), 'Selected individuals differ'
+
+        original_time = min(timeit.repeat(lambda: _spea2_selection_loop(population, size),
+                                          number=1, repeat=repeats))
+        vectorized_time = min(timeit.repeat(lambda: spea2_selection(population, size),
+                                            number=1, repeat=repeats))
+        print(f'{size:>10} | {original_time:>11.4f} | {vectorized_time:>13.4f} | '
+              f'{original_time / vectorized_time:>7.1f}')
+
+
+if __name__ == '__main__':
+    run_spea2_benchmark()
@@ -0,0 +1,29 @@
+import timeit
+
+from golem.core.optimisers.opt_history_objects.opt_history import OptHistory
+from golem.core.paths import project_root
+from golem.serializers.serializer import SERIALIZATION_BACKENDS
+
+
+def run_serialization_benchmark(history_path=project_root() / 'test' / 'data' / 'history_composite_bn_healthcare.json',
+                                backends=SERIALIZATION_BACKENDS, repeats: int = 3):
+    """Measures round-trip of the history through the serialization backends
+    and checks that the loaded history is the same for all of them."""
+    history = OptHistory.load(history_path)
+    reference = history.save()
+
+    print(f'{"Backend":>12} | {"Size, KB":>8} | {"Save, s":>7} | {"Load, s":>7} | {"Round-trip speedup":>18}')
+    reference_time = None
+    for backend in backends:
+        saved = history.save(backend=backend)
+        assert OptHistory.load(saved, backend=backend).save() == reference, f'History differs for {backend}'
+
+        save_time = min(timeit.repeat(lambda: history.save(backend=backend), number=1, repeat=repeats))
+        load_time = min(timeit.repeat(lambda: OptHistory.load(saved, backend=backend), number=1, repeat=repeats))
+        reference_time = reference_time or save_time + load_time
+        print(f'{backend:>12} | {len(saved) / 1024:>8.0f} | {save_time:>7.3f} | {load_time:>7.3f} | '
+              f'{reference_time / (save_time + load_time):>18.1f}')
+
+
+if __name__ == '__main__':
+    run_serialization_benchmark()
@@ -108,24 +108,14 @@ class ExperimentAnalyzer:
                 if ind.fitness.values[i] < best_fitness_per_objective[i]:
                     best_fitness_per_objective[i] = ind.fitness.values[i]
 
+        table = history.to_table()
         total_time_to_get_best_fitness_per_objective = []
         for j, best_fitness in enumerate(best_fitness_per_objective):
-            first_gen_with_best_fitness = history.generations_count
-            # since if objective is not multi-modal than historical_fitness[j] is 1d list
-            historical_fitness = history.historical_fitness[j]
-            if not history.objective.is_multi_objective:
-                historical_fitness = [history.historical_fitness[j]]
-
-            for i, gen_fitnesses in enumerate(historical_fitness):
-                if best_fitness in gen_fitnesses:
-                    first_gen_with_best_fitness = i
-                    break
-            total_time_to_get_best_fitness = 0
-            for i, gen in enumerate(history.individuals):
-                if i == first_gen_with_best_fitness:
-                    break
-                for ind in gen.data:
-                    total_time_to_get_best_fitness += ind.metadata['computation_time_in_seconds']
+            generations_with_best_fitness = table.generation[table.fitness[:, j] == best_fitness]
+            first_gen_with_best_fitness = generations_with_best_fitness[0] \
+                if len(generations_with_best_fitness) else history.generations_count
+            total_time_to_get_best_fitness = \
+                float(np.nansum(table.computation_time[table.generation < first_gen_with_best_fitness]))
             total_time_to_get_best_fitness_per_objective.append(total_time_to_get_best_fitness)
         return total_time_to_get_best_fitness_per_objective
 
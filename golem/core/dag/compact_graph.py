@@ -0,0 +1,165 @@
+import pickle
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple, Type, Union
+from uuid import UUID
+
+import numpy as np
+
+from golem.core.dag.graph import Graph
+from golem.core.dag.graph_delegate import GraphDelegate
+from golem.core.dag.linked_graph import LinkedGraph
+from golem.core.dag.linked_graph_node import LinkedGraphNode
+from golem.core.dag.structure_tracker import TrackedUniqueList
+
+# size of uid of the node in the binary form
+UID_BYTES_SIZE = 16
+
+
+class CompactGraph:
+    """Compact array-based encoding of :class:`LinkedGraph` for transferring graphs between processes.
+
+    Instead of the nodes with their parent lists and content dicts it keeps:
+
+    - table of node types (class of the node and its name) and index of the type for each node;
+    - interned blobs of the node content other than name (e.g. parameters) and index of the blob for each node;
+    - integer array of edges (index of the parent, index of the child) in the order of parents of each node;
+    - binary uids of the nodes.
+
+    Only plain graphs are supported (see :meth:`is_encodable`), graphs with the additional state
+    must be transferred as they are. Use :func:`encode_graph` & :func:`decode_graph`
+    that handle both cases.
+    """
+    __slots__ = ('graph_cls', 'operator_cls', 'postprocess_nodes', 'node_types', 'node_type_ids',
+                 'content_blobs', 'content_ids', 'edges', 'uids')
+
+    # attributes of graphs and nodes that are encoded
+    _delegate_attributes = {'operator'}
+    _linked_graph_attributes = {'_nodes', '_postprocess_nodes'}
+    _node_attributes = {'content', '_nodes_from', 'uid'}
+
+    def __init__(self, graph: Graph):
+        operator = graph.operator if isinstance(graph, GraphDelegate) else graph
+        nodes = operator.nodes
+        self.graph_cls: Type[Graph] = type(graph)
+        self.operator_cls: Optional[Type[LinkedGraph]] = type(operator) if operator is not graph else None
+        self.postprocess_nodes = vars(operator).get('_postprocess_nodes')
+
+        node_types: Dict[Hashable, int] = {}
+        content_blobs: Dict[bytes, int] = {}
+        self.node_types: List[Tuple[Type[LinkedGraphNode], Any]] = []
+        node_type_ids = []
+        content_ids = []
+        for node in nodes:
+            content = dict(node.content)
+            node_type = (type(node), content.pop('name', None))
+            try:
+                type_id = node_types.setdefault(node_type, len(self.node_types))
+            except TypeError:
+                # unhashable names are not interned
+                type_id = len(self.node_types)
+            if type_id == len(self.node_types):
+                self.node_types.append(node_type)
+            node_type_ids.append(type_id)
+            content_ids.append(content_blobs.setdefault(pickle.dumps(content), len(content_blobs)))
+        self.node_type_ids = np.array(node_type_ids, dtype=np.int32).tobytes()
+        self.content_blobs: List[bytes] = list(content_blobs)
+        self.content_ids = np.array(content_ids, dtype=np.int32).tobytes()
+
+        node_ids = {id(node): idx for idx, node in enumerate(nodes)}
+        edges = [(node_ids[id(parent)], child_idx)
+                 for child_idx, node in enumerate(nodes)
+                 for parent in node.nodes_from]
+        self.edges = np.array(edges, dtype=np.int32).tobytes()
+        self.uids = _encode_uids([node.uid for node in nodes])
+
+    @classmethod
+    def is_encodable(cls, graph: Graph) -> bool:
+        """Checks that the graph has no state other than its nodes, so it can be encoded without losses."""
+        operator = graph
+        if isinstance(graph, GraphDelegate):
+            if vars(graph).keys() != cls._delegate_attributes:
+                return False
+            operator = graph.operator
+        if not isinstance(operator, LinkedGraph) or not vars(operator).keys() <= cls._linked_graph_attributes:
+            return False
+        node_ids = {id(node) for node in operator.nodes}
+        return all(isinstance(node, LinkedGraphNode) and
+                   vars(node).keys() <= cls._node_attributes and
+                   all(id(parent) in node_ids for parent in node.nodes_from)
+                   for node in operator.nodes)
+
+    def to_graph(self) -> Graph:
+        """Restores the encoded graph."""
+        node_type_ids = np.frombuffer(self.node_type_ids, dtype=np.int32).tolist()
+        content_ids = np.frombuffer(self.content_ids, dtype=np.int32).tolist()
+        uids = _decode_uids(self.uids, len(node_type_ids))
+        nodes = []
+        for type_id, content_id, uid in zip(node_type_ids, content_ids, uids):
+            node_cls, name = self.node_types[type_id]
+            node = node_cls.__new__(node_cls)
+            # each node gets its own copy of the content
+            content = pickle.loads(self.content_blobs[content_id])
+            node.content = {'name': name, **content} if name is not None else content
+            node._nodes_from = TrackedUniqueList()
+            node.uid = uid
+            nodes.append(node)
+        for parent_idx, child_idx in np.frombuffer(self.edges, dtype=np.int32).reshape(-1, 2).tolist():
+            list.append(nodes[child_idx]._nodes_from, nodes[parent_idx])
+
+        operator_cls = self.operator_cls or self.graph_cls
+        operator = operator_cls.__new__(operator_cls)
+        operator.nodes = nodes
+        if self.postprocess_nodes is not None:
+            operator._postprocess_nodes = self.postprocess_nodes
+        if self.operator_cls is None:
+            return operator
+        graph = self.graph_cls.__new__(self.graph_cls)
+        graph.operator = operator
+        return graph
+
+    def has_same_structure(self, other: 'CompactGraph') -> bool:
+        """Checks that both encodings represent the same graph ignoring the uids of the nodes."""
+        return (self.graph_cls is other.graph_cls and
+                self.operator_cls is other.operator_cls and
+                self.edges == other.edges and
+                self.content_ids == other.content_ids and
+                self.content_blobs == other.content_blobs and
+                self.node_type_ids == other.node_type_ids and
+                self.node_types == other.node_types)
+
+    def __getstate__(self):
+        return tuple(getattr(self, attr) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        for attr, value in zip(self.__slots__, state):
+            setattr(self, attr, value)
+
+
+def encode_graph(graph: Graph) -> Union[CompactGraph, Graph]:
+    """Returns compact encoding of the graph for transferring between processes
+    or the graph itself if it can't be encoded."""
+    return CompactGraph(graph) if CompactGraph.is_encodable(graph) else graph
+
+
+def decode_graph(encoded: Union[CompactGraph, Graph]) -> Graph:
+    """Restores graph returned by :func:`encode_graph`."""
+    return encoded.to_graph() if isinstance(encoded, CompactGraph) else encoded
+
+
+def _encode_uids(uids: Sequence[str]) -> Union[bytes, List[str]]:
+    encoded = []
+    for uid in uids:
+        try:
+            uuid = UUID(uid)
+        except (ValueError, TypeError, AttributeError):
+            return list(uids)
+        if str(uuid) != uid:
+            # keep uids that are not in the canonical form of uuid as they are
+            return list(uids)
+        encoded.append(uuid.bytes)
+    return b''.join(encoded)
+
+
+def _decode_uids(uids: Union[bytes, List[str]], nodes_num: int) -> List[str]:
+    if not isinstance(uids, bytes):
+        return uids
+    return [str(UUID(bytes=uids[i * UID_BYTES_SIZE:(i + 1) * UID_BYTES_SIZE])) for i in range(nodes_num)]
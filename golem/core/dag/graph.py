@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from copy import deepcopy
 from enum import Enum
 from os import PathLike
 from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple, TypeVar, Union
@@ -6,6 +7,8 @@ from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple
 import networkx as nx
 
 from golem.core.dag.graph_node import GraphNode
+from golem.core.dag.graph_utils import StructuralFacts, graph_has_cycle, graph_structural_facts, \
+    graph_structural_hash
 from golem.visualisation.graph_viz import GraphVisualizer, NodeColorType
 
 NodeType = TypeVar('NodeType', bound=GraphNode, covariant=False, contravariant=False)
@@ -195,6 +198,15 @@ class Graph(ABC):
         """
         raise NotImplementedError()
 
+    @property
+    def has_cycle(self) -> bool:
+        """Checks if the graph contains a cycle
+
+        Returns:
+            True if the graph contains a cycle and False otherwise
+        """
+        return graph_has_cycle(self)
+
     @property
     def length(self) -> int:
         """Return size of the graph (number of nodes)
@@ -273,6 +285,36 @@ class Graph(ABC):
         else:
             return sorted(self.nodes, key=lambda x: x.uid)[0].descriptive_id
 
+    def clone(self) -> 'Graph':
+        """Returns copy of the graph that can be modified independently of this graph.
+        Implementations can share immutable data between the copies to make it faster than ``deepcopy``.
+
+        Returns:
+            Graph: copy of the graph
+        """
+        return deepcopy(self)
+
+    @property
+    def structural_hash(self) -> str:
+        """Returns canonical hash of the graph structure and content of its nodes.
+        Unlike ``descriptive_id`` it is computed in linear time,
+        so it is preferred for checking structural identity of graphs.
+
+        Returns:
+            str: hex digest that is the same for structurally identical graphs
+        """
+        return graph_structural_hash(self)
+
+    @property
+    def structural_facts(self) -> StructuralFacts:
+        """Returns structural properties of the graph (e.g. topological order, roots, connected components)
+        computed together in a single pass. Used by the verification rules to avoid repeated traversals.
+
+        Returns:
+            StructuralFacts: structural properties of the graph
+        """
+        return graph_structural_facts(self)
+
     def __str__(self):
         return str(self.graph_description)
 
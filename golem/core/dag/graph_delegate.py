@@ -1,7 +1,9 @@
+from copy import deepcopy
 from typing import Union, Sequence, List, Optional, Tuple, Type
 
 from golem.core.dag.graph import Graph, ReconnectType
 from golem.core.dag.graph_node import GraphNode
+from golem.core.dag.graph_utils import StructuralFacts
 from golem.core.dag.linked_graph import LinkedGraph
 
 
@@ -80,3 +82,23 @@ class GraphDelegate(Graph):
     @property
     def depth(self) -> int:
         return self.operator.depth
+
+    @property
+    def has_cycle(self) -> bool:
+        return self.operator.has_cycle
+
+    @property
+    def structural_hash(self) -> str:
+        return self.operator.structural_hash
+
+    @property
+    def structural_facts(self) -> StructuralFacts:
+        return self.operator.structural_facts
+
+    def clone(self) -> 'GraphDelegate':
+        if vars(self).keys() != {'operator'}:
+            # delegate has some additional state
+            return deepcopy(self)
+        cloned = self.__class__.__new__(self.__class__)
+        cloned.operator = self.operator.clone()
+        return cloned
@@ -1,4 +1,6 @@
-from typing import Sequence, List, TYPE_CHECKING, Callable, Union
+import hashlib
+from dataclasses import dataclass
+from typing import Dict, Sequence, List, Optional, TYPE_CHECKING, Callable, Tuple, Union
 
 from golem.utilities.data_structures import ensure_wrapped_in_sequence
 
@@ -28,7 +30,7 @@ def distance_to_root_level(graph: 'Graph', node: 'GraphNode') -> int:
             else:
                 return height
 
-    if graph_has_cycle(graph):
+    if graph.has_cycle:
         return -1
     height = child_height(node)
     return height
@@ -200,3 +202,114 @@ def graph_has_cycle(graph: 'Graph') -> bool:
                 elif on_stack[parent.uid]:
                     return True
     return False
+
+
+@dataclass(frozen=True)
+class StructuralFacts:
+    """Structural properties of the graph computed together in a single pass over its nodes and edges.
+
+    Args:
+        topological_order: nodes ordered from the sources to the roots or None if the graph has cycles
+        root_nodes: nodes without children
+        isolated_nodes: nodes without parents and children
+        self_cycled_nodes: nodes that are parents of themselves
+        components_num: number of weakly connected components
+    """
+    topological_order: Optional[Tuple['GraphNode', ...]]
+    root_nodes: Tuple['GraphNode', ...]
+    isolated_nodes: Tuple['GraphNode', ...]
+    self_cycled_nodes: Tuple['GraphNode', ...]
+    components_num: int
+
+    @property
+    def has_cycle(self) -> bool:
+        return self.topological_order is None
+
+
+def graph_structural_facts(graph: 'Graph') -> StructuralFacts:
+    """Computes structural properties of the graph that are required by the verification rules.
+    Implements Kahn's algorithm for topological sorting and union-find for connected components.
+
+    Returns:
+        StructuralFacts: structural properties of the graph
+    """
+    nodes = graph.nodes
+    index = {id(node): i for i, node in enumerate(nodes)}
+    children_num = [0] * len(nodes)
+    components = list(range(len(nodes)))
+
+    def find_component(i: int) -> int:
+        while components[i] != i:
+            components[i] = components[components[i]]
+            i = components[i]
+        return i
+
+    for i, node in enumerate(nodes):
+        for parent in node.nodes_from:
+            j = index[id(parent)]
+            children_num[j] += 1
+            components[find_component(i)] = find_component(j)
+
+    # sources are visited first, node is visited after all its parents
+    parents_left = [len(node.nodes_from) for node in nodes]
+    children = [[] for _ in nodes]
+    for i, node in enumerate(nodes):
+        for parent in node.nodes_from:
+            children[index[id(parent)]].append(i)
+    order = [i for i, num in enumerate(parents_left) if num == 0]
+    for i in order:
+        for child in children[i]:
+            parents_left[child] -= 1
+            if parents_left[child] == 0:
+                order.append(child)
+
+    return StructuralFacts(
+        topological_order=tuple(nodes[i] for i in order) if len(order) == len(nodes) else None,
+        root_nodes=tuple(node for node, num in zip(nodes, children_num) if num == 0),
+        isolated_nodes=tuple(node for node, num in zip(nodes, children_num) if num == 0 and not node.nodes_from),
+        self_cycled_nodes=tuple(node for node in nodes if any(parent is node for parent in node.nodes_from)),
+        components_num=len({find_component(i) for i in range(len(nodes))}),
+    )
+
+
+def graph_structural_hash(graph: 'Graph') -> str:
+    """Returns canonical hash of the graph that is the same for structurally identical graphs.
+
+    Implements Merkle-style hashing: digest of each node is computed from its description and sorted digests
+    of its parents, so the hash doesn't depend on the order of nodes and edges and takes linear time.
+    Graphs with cycles are hashed by their descriptive id.
+
+    Returns:
+        str: hex digest of the graph
+    """
+    if not graph.nodes:
+        return _digest('EMPTY').hex()
+    if graph.has_cycle:
+        return _digest(graph.descriptive_id).hex()
+
+    digests: Dict[int, bytes] = {}
+    for node in graph.nodes:
+        # iterative post-order traversal computes parents' digests before the children's ones
+        stack = [(node, False)]
+        while stack:
+            current_node, parents_ready = stack.pop()
+            if id(current_node) in digests:
+                continue
+            if parents_ready:
+                parent_digests = sorted(digests[id(parent)] for parent in current_node.nodes_from)
+                digests[id(current_node)] = _digest(current_node.description(), *parent_digests)
+            else:
+                stack.append((current_node, True))
+                stack.extend((parent, False) for parent in current_node.nodes_from
+                             if id(parent) not in digests)
+    root_digests = sorted(digests[id(root)] for root in graph.root_nodes())
+    return _digest('', *root_digests).hex()
+
+
+def _digest(description: str, *parent_digests: bytes) -> bytes:
+    encoded_description = description.encode()
+    hash_obj = hashlib.blake2b(len(encoded_description).to_bytes(8, 'little'), digest_size=16)
+    hash_obj.update(encoded_description)
+    for parent_digest in parent_digests:
+        hash_obj.update(parent_digest)
+    return hash_obj.digest()
@@ -1,6 +1,7 @@
-from typing import Sequence, Optional, Callable
+from collections import OrderedDict
+from typing import Sequence, Optional, Callable, Tuple
 
-from golem.core.adapter import BaseOptimizationAdapter
+from golem.core.adapter import AdaptRegistry, BaseOptimizationAdapter
 from golem.core.adapter.adapter import IdentityAdapter
 from golem.core.dag.graph import Graph
 from golem.core.log import default_log
@@ -8,36 +9,85 @@ from golem.core.log import default_log
 # Validation rule can either return False or raise a ValueError to signal a failed check
 VerifierRuleType = Callable[..., bool]
 
+# result of the verification: flag of success and the error message of the failed rule (if any)
+VerificationResult = Tuple[bool, Optional[str]]
+
 
 class VerificationError(ValueError):
     pass
 
 
 class GraphVerifier:
+    """Checks graphs with the sequence of rules, stops on the first failed rule.
+
+    The graph is restored to the domain form only once per check and only if some rule isn't native.
+    Optionally results are cached by the structural hash of the graph, so structurally identical graphs
+    (e.g. repeatedly produced by the evolutionary operators) are checked only once.
+
+    Args:
+        rules: verification rules, each rule either returns False or raises ValueError on failure
+        adapter: adapter used to restore the graph for the rules that aren't native
+        raise_on_failure: if True then raises VerificationError on failure, otherwise returns False
+        cache_size: max number of cached results, 0 (by default) disables the cache.
+         The cache can be enabled only if the rules depend on nothing besides the graph structure
+         and the names & parameters of its nodes, since only they define the structural hash.
+    """
+
     def __init__(self, rules: Sequence[VerifierRuleType] = (),
                  adapter: Optional[BaseOptimizationAdapter] = None,
-                 raise_on_failure: bool = False):
+                 raise_on_failure: bool = False,
+                 cache_size: int = 0):
         self._adapter = adapter or IdentityAdapter()
         self._rules = rules
         self._log = default_log(self)
         self._raise = raise_on_failure
+        self._cache_size = cache_size
+        self._cache: 'OrderedDict[str, VerificationResult]' = OrderedDict()
 
     def __call__(self, graph: Graph) -> bool:
         return self.verify(graph)
 
     def verify(self, graph: Graph) -> bool:
+        if self._cache_size > 0:
+            key = graph.structural_hash
+            result = self._cache.get(key)
+            if result is None:
+                result = self._check_rules(graph)
+                self._cache[key] = result
+                if len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+            else:
+                self._cache.move_to_end(key)
+        else:
+            result = self._check_rules(graph)
+
+        is_correct, msg = result
+        if msg is not None:
+            if self._raise:
+                raise VerificationError(msg)
+            self._log.debug(msg)
+        return is_correct
+
+    def _check_rules(self, graph: Graph) -> VerificationResult:
         # Check if all rules pass
-        adapt = self._adapter.adapt_func
+        domain_graph = None
         for rule in self._rules:
+            if AdaptRegistry.is_native(rule):
+                rule_graph = graph
+            else:
+                if domain_graph is None:
+                    domain_graph = self._adapter.restore(graph)
+                rule_graph = domain_graph
             try:
-                if adapt(rule)(graph) is False:
-                    return False
+                if rule(rule_graph) is False:
+                    return False, None
             except ValueError as err:
-                msg = f'Graph verification failed with error <{err}> '\
-                      f'for rule={rule} on graph={graph.descriptive_id}.'
-                if self._raise:
-                    raise VerificationError(msg)
-                else:
-                    self._log.debug(msg)
-                    return False
-        return True
+                return False, (f'Graph verification failed with error <{err}> '
+                               f'for rule={rule} on graph={graph.descriptive_id}.')
+        return True, None
+
+    def __getstate__(self):
+        # cached results aren't sent to other processes
+        state = self.__dict__.copy()
+        state['_cache'] = OrderedDict()
+        return state
@@ -1,4 +1,5 @@
 from copy import deepcopy
+from functools import partial
 from typing import Any, Dict, List, Optional, Tuple, Union, Callable, Sequence
 
 from networkx import graph_edit_distance, set_node_attributes
@@ -6,7 +7,10 @@ from networkx import graph_edit_distance, set_node_attributes
 from golem.core.dag.convert import graph_structure_as_nx_graph
 from golem.core.dag.graph import Graph, ReconnectType
 from golem.core.dag.graph_node import GraphNode
-from golem.core.dag.graph_utils import ordered_subnodes_hierarchy, node_depth, graph_has_cycle
+from golem.core.dag.graph_utils import ordered_subnodes_hierarchy, node_depth, graph_has_cycle, \
+    graph_structural_hash, graph_structural_facts, StructuralFacts
+from golem.core.dag.linked_graph_node import LinkedGraphNode
+from golem.core.dag.structure_tracker import StructureTracker, TrackedDict, TrackedList, TrackedUniqueList
 from golem.core.paths import copy_doc
 from golem.utilities.data_structures import ensure_wrapped_in_sequence, Copyable, remove_items
 
@@ -21,10 +25,13 @@ class LinkedGraph(Graph, Copyable):
         nodes: nodes of the Graph
         postprocess_nodes: nodes postprocessing function used after their modification
     """
+    # cache of the structural properties is kept out of the instance dict,
+    # so it isn't copied or serialized with the graph
+    __slots__ = ('_structure_cache',)
 
     def __init__(self, nodes: Union[GraphNode, Sequence[GraphNode]] = (),
                  postprocess_nodes: Optional[NodePostprocessCallable] = None):
-        self._nodes = []
+        self._nodes = TrackedList()
         for node in ensure_wrapped_in_sequence(nodes):
             self.add_node(node)
         self._postprocess_nodes = postprocess_nodes or self._empty_postprocess
@@ -59,7 +66,7 @@ class LinkedGraph(Graph, Copyable):
     @copy_doc(Graph.delete_subtree)
     def delete_subtree(self, subtree: GraphNode):
         subtree_nodes = ordered_subnodes_hierarchy(subtree)
-        self._nodes = remove_items(self._nodes, subtree_nodes)
+        self.nodes = remove_items(self._nodes, subtree_nodes)
         # prune all edges coming from the removed subtree
         for subtree in self._nodes:
             subtree.nodes_from = remove_items(subtree.nodes_from, subtree_nodes)
@@ -75,7 +82,7 @@ class LinkedGraph(Graph, Copyable):
 
     @copy_doc(Graph.update_subtree)
     def update_subtree(self, old_subtree: GraphNode, new_subtree: GraphNode):
-        new_subtree = deepcopy(new_subtree)
+        new_subtree = clone_nodes([new_subtree])[0]
         self.actualise_old_node_children(old_subtree, new_subtree)
         self.delete_subtree(old_subtree)
         self.add_node(new_subtree)
@@ -101,15 +108,51 @@ class LinkedGraph(Graph, Copyable):
 
     def sort_nodes(self):
         """ Layer by layer sorting """
-        if not isinstance(self.root_node, Sequence) and not graph_has_cycle(self):
-            self._nodes = ordered_subnodes_hierarchy(self.root_node)
+        if not isinstance(self.root_node, Sequence) and not self.has_cycle:
+            self.nodes = ordered_subnodes_hierarchy(self.root_node)
 
     @copy_doc(Graph.node_children)
     def node_children(self, node: GraphNode) -> List[Optional[GraphNode]]:
         """ Returns list of children of specified node. """
-        return [other_node for other_node in self._nodes
-                if other_node.nodes_from and
-                node in other_node.nodes_from]
+        return list(self._get_children_index().get(node, ()))
+
+    def _get_cached(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Returns structural property of the graph computed by ``compute``.
+        The property is recomputed only if the graph was modified since the last call
+        (see :class:`~golem.core.dag.structure_tracker.StructureTracker`)."""
+        values = getattr(self, '_structure_cache', None)
+        if values is None:
+            values = {}
+            if self._track_structure():
+                self._structure_cache = values
+        if key not in values:
+            values[key] = compute()
+        return values[key]
+
+    def _track_structure(self) -> bool:
+        """Makes the graph be notified about the modifications of its nodes.
+        Returns False if the modifications can't be tracked, so the structural properties can't be cached."""
+        if not isinstance(self._nodes, TrackedList) or \
+                not all(isinstance(node, StructureTracker) for node in self._nodes):
+            return False
+        self._nodes.add_holder(self)
+        for node in self._nodes:
+            node.add_holder(self)
+        return True
+
+    def _modified(self):
+        self._structure_cache = None
+
+    def _get_children_index(self) -> Dict[GraphNode, List[GraphNode]]:
+        """Returns mapping of the nodes to their children (in the order of graph nodes)."""
+        return self._get_cached('children_index', self._build_children_index)
+
+    def _build_children_index(self) -> Dict[GraphNode, List[GraphNode]]:
+        children_index = {}
+        for node in self._nodes:
+            for parent in node.nodes_from:
+                children_index.setdefault(parent, []).append(node)
+        return children_index
 
     @copy_doc(Graph.connect_nodes)
     def connect_nodes(self, node_parent: GraphNode, node_child: GraphNode):
@@ -143,7 +186,11 @@ class LinkedGraph(Graph, Copyable):
         self._postprocess_nodes(self, self._nodes)
 
     def root_nodes(self) -> Sequence[GraphNode]:
-        return [node for node in self._nodes if not any(self.node_children(node))]
+        return list(self._get_cached('root_nodes', self._find_root_nodes))
+
+    def _find_root_nodes(self) -> List[GraphNode]:
+        children_index = self._get_children_index()
+        return [node for node in self._nodes if not children_index.get(node)]
 
     @property
     def nodes(self) -> List[GraphNode]:
@@ -151,7 +198,22 @@ class LinkedGraph(Graph, Copyable):
 
     @nodes.setter
     def nodes(self, new_nodes: List[GraphNode]):
-        self._nodes = new_nodes
+        self._nodes = TrackedList(new_nodes)
+        self._modified()
+
+    @copy_doc(Graph.clone)
+    def clone(self) -> 'LinkedGraph':
+        if not vars(self).keys() <= {'_nodes', '_postprocess_nodes'}:
+            # graph has some additional state
+            return deepcopy(self)
+        cloned = self.__class__.__new__(self.__class__)
+        cloned.__dict__.update(self.__dict__)
+        cloned._nodes = TrackedList(clone_nodes(self._nodes))
+        return cloned
+
+    def __getstate__(self):
+        # don't pickle the cache of the structural properties
+        return self.__dict__
 
     @copy_doc(Graph.__eq__)
     def __eq__(self, other_graph: Graph) -> bool:
@@ -162,6 +224,9 @@ class LinkedGraph(Graph, Copyable):
     @copy_doc(Graph.descriptive_id)
     @property
     def descriptive_id(self) -> str:
+        return self._get_cached('descriptive_id', self._compute_descriptive_id)
+
+    def _compute_descriptive_id(self) -> str:
         if self.length == 0:
             return 'EMPTY'
         elif self.root_nodes():
@@ -172,14 +237,32 @@ class LinkedGraph(Graph, Copyable):
     @copy_doc(Graph.depth)
     @property
     def depth(self) -> int:
+        return self._get_cached('depth', self._compute_depth)
+
+    def _compute_depth(self) -> int:
         if not self._nodes:
             return 0
-        elif not self.root_nodes() or graph_has_cycle(self):
+        elif not self.root_nodes() or self.has_cycle:
             return -1
         else:
             depths = node_depth(self.root_nodes())
             return max(ensure_wrapped_in_sequence(depths))
 
+    @copy_doc(Graph.has_cycle)
+    @property
+    def has_cycle(self) -> bool:
+        return self._get_cached('has_cycle', partial(graph_has_cycle, self))
+
+    @copy_doc(Graph.structural_hash)
+    @property
+    def structural_hash(self) -> str:
+        return self._get_cached('structural_hash', partial(graph_structural_hash, self))
+
+    @copy_doc(Graph.structural_facts)
+    @property
+    def structural_facts(self) -> StructuralFacts:
+        return self._get_cached('structural_facts', partial(graph_structural_facts, self))
+
     @copy_doc(Graph.get_edges)
     def get_edges(self) -> Sequence[Tuple[GraphNode, GraphNode]]:
         edges = []
@@ -190,6 +273,46 @@ class LinkedGraph(Graph, Copyable):
         return edges
 
 
+def clone_nodes(nodes: Sequence[GraphNode]) -> List[GraphNode]:
+    """Copies the nodes together with all their ancestors.
+
+    Unlike ``deepcopy`` the content of the copies is copied shallowly: dicts and lists in the content values
+    (e.g. parameters) are copied together with the nested ones, so they can be modified in place
+    without changing the original nodes, while other values (e.g. names) are shared.
+    Nodes with the state other than content and parents are deep-copied.
+
+    Args:
+        nodes: nodes to copy
+
+    Returns:
+        copies of the ``nodes`` in the same order
+    """
+    clones = {}
+    nodes_to_clone = list(nodes)
+    while nodes_to_clone:
+        node = nodes_to_clone.pop()
+        if id(node) in clones:
+            continue
+        if not isinstance(node, LinkedGraphNode) or not vars(node).keys() <= {'content', '_nodes_from', 'uid'}:
+            return deepcopy(list(nodes))
+        clone = node.__class__.__new__(node.__class__)
+        clone.__dict__.update(node.__dict__)
+        clone.__dict__['content'] = TrackedDict((key, _copy_container(value)) for key, value in node.content.items())
+        clones[id(node)] = clone
+        nodes_to_clone.extend(node.nodes_from)
+    for clone in clones.values():
+        clone._nodes_from = TrackedUniqueList(clones[id(parent)] for parent in clone.nodes_from)
+    return [clones[id(node)] for node in nodes]
+
+
+def _copy_container(value: Any) -> Any:
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, list):
+        return list(value)
+    return value
+
+
 def get_distance_between(graph_1: Graph, graph_2: Graph) -> int:
     """
     Gets edit distance from ``graph_1`` graph to the ``graph_2``
@@ -1,9 +1,9 @@
 from typing import Union, Optional, Iterable, List
 from golem.core.dag.graph_node import GraphNode
-from golem.utilities.data_structures import UniqueList
+from golem.core.dag.structure_tracker import StructureTracker, TrackedDict, TrackedUniqueList
 
 
-class LinkedGraphNode(GraphNode):
+class LinkedGraphNode(GraphNode, StructureTracker):
     """Class for node definition in the directed graph structure
     that directly stores its parent nodes.
 
@@ -17,6 +17,7 @@ class LinkedGraphNode(GraphNode):
             - ``params`` - dictionary with additional information that is used by
                     the object in the ``name`` field (e.g. hyperparameters values)
     """
+    __slots__ = ('_holders',)
 
     def __init__(self, content: Union[dict, str],
                  nodes_from: Optional[Iterable['LinkedGraphNode']] = None):
@@ -24,8 +25,8 @@ class LinkedGraphNode(GraphNode):
         if isinstance(content, str):
             content = {'name': content}
 
-        self.content: dict = content
-        self._nodes_from = UniqueList(nodes_from or ())
+        self.content = content
+        self._nodes_from = TrackedUniqueList(nodes_from or ())
 
         super().__init__()
 
@@ -35,7 +36,32 @@ class LinkedGraphNode(GraphNode):
 
     @nodes_from.setter
     def nodes_from(self, nodes: Optional[Iterable['LinkedGraphNode']]):
-        self._nodes_from = UniqueList(nodes)
+        self._nodes_from = TrackedUniqueList(nodes)
+        self._nodes_from.add_holder(self)
+        self._modified()
+
+    @property
+    def content(self) -> dict:
+        return self.__dict__['content']
+
+    @content.setter
+    def content(self, content: dict):
+        # content is kept in the instance dict under its own name to keep the serialized form of the node
+        self.__dict__['content'] = TrackedDict(content)
+        self.content.add_holder(self)
+        self._modified()
+
+    def add_holder(self, holder) -> bool:
+        if not super().add_holder(holder):
+            return False
+        # the containers can be assigned directly, bypassing the setters (e.g. on restoring of the node)
+        self._nodes_from.add_holder(self)
+        self.content.add_holder(self)
+        return True
+
+    def __getstate__(self):
+        # the holders aren't copied
+        return self.__dict__
 
     @property
     def name(self) -> str:
@@ -0,0 +1,223 @@
+from typing import Any, Iterable, Optional
+from weakref import ref
+
+from golem.utilities.data_structures import UniqueList
+
+
+class StructureTracker:
+    """Base of the objects holding the structure and the content of graphs that notify their holders
+    about modifications.
+
+    Nodes and their parent lists can be modified directly (e.g. by evolutionary operators),
+    bypassing the methods of the graph. So the containers of a graph notify the graph or the nodes holding them
+    about each modification and the nodes notify the graphs they belong to, so that each graph drops the data
+    computed from its structure (e.g. index of node children or depth) only when this graph is modified.
+    Graphs become the holders of their nodes when they compute the structural data.
+
+    Dicts and lists inside node content (e.g. ``node.content['params']``) are copied into tracked containers
+    on assignment, so they can be modified in place too.
+    Values of other mutable types inside node content are not tracked and must be replaced instead.
+    """
+    __slots__ = ()
+
+    def add_holder(self, holder: Any) -> bool:
+        """Makes ``holder`` be notified about the modifications by the call of its ``_modified`` method.
+        Returns False if the ``holder`` was already added."""
+        holders = getattr(self, '_holders', None)
+        if holders is None:
+            self._holders = [ref(holder)]
+            return True
+        for holder_ref in holders:
+            if holder_ref() is holder:
+                return False
+        holders[:] = [holder_ref for holder_ref in holders if holder_ref() is not None]
+        holders.append(ref(holder))
+        return True
+
+    def _live_holders(self) -> list:
+        holders = (holder_ref() for holder_ref in getattr(self, '_holders', None) or ())
+        return [holder for holder in holders if holder is not None]
+
+    def _modified(self):
+        for holder_ref in getattr(self, '_holders', None) or ():
+            holder = holder_ref()
+            if holder is not None:
+                holder._modified()
+
+
+class _TrackedListMixin(StructureTracker):
+    """Notifies the holders about all modifications of the list."""
+    __slots__ = ()
+
+    def append(self, *args):
+        self._modified()
+        return super().append(*args)
+
+    def extend(self, *args):
+        self._modified()
+        return super().extend(*args)
+
+    def insert(self, *args):
+        self._modified()
+        return super().insert(*args)
+
+    def remove(self, *args):
+        self._modified()
+        return super().remove(*args)
+
+    def pop(self, *args):
+        self._modified()
+        return super().pop(*args)
+
+    def clear(self):
+        self._modified()
+        return super().clear()
+
+    def sort(self, *args, **kwargs):
+        self._modified()
+        return super().sort(*args, **kwargs)
+
+    def reverse(self):
+        self._modified()
+        return super().reverse()
+
+    def __setitem__(self, *args):
+        self._modified()
+        return super().__setitem__(*args)
+
+    def __delitem__(self, *args):
+        self._modified()
+        return super().__delitem__(*args)
+
+    def __iadd__(self, *args):
+        self._modified()
+        return super().__iadd__(*args)
+
+    def __imul__(self, *args):
+        self._modified()
+        return super().__imul__(*args)
+
+    @classmethod
+    def from_items(cls, items: Iterable):
+        """Creates the list with the items as they are: without tracked appends and checks of the items
+        (that can be not fully restored yet, e.g. copies of the nodes of cyclic graphs)."""
+        restored = cls.__new__(cls)
+        list.extend(restored, items)
+        return restored
+
+    def __reduce_ex__(self, protocol):
+        # copies are created at once, without tracked appends and holders
+        return self.from_items, (list(self),)
+
+
+class TrackedList(_TrackedListMixin, list):
+    """List that notifies its holders about each modification."""
+    __slots__ = ('_holders', '__weakref__')
+
+    def __init__(self, iterable: Optional[Iterable] = None):
+        super().__init__(iterable or ())
+
+
+class TrackedUniqueList(_TrackedListMixin, UniqueList):
+    """:class:`UniqueList` that notifies its holders about each modification."""
+    __slots__ = ('_holders',)
+
+
+class _TrackedValueList(TrackedList):
+    """List inside node content, its dict and list items are tracked too."""
+    __slots__ = ()
+
+    def __init__(self, iterable: Optional[Iterable] = None):
+        list.__init__(self, (_track(item, self) for item in iterable or ()))
+
+    def append(self, item):
+        return super().append(_track(item, self))
+
+    def extend(self, items: Iterable):
+        return super().extend([_track(item, self) for item in items])
+
+    def insert(self, index, item):
+        return super().insert(index, _track(item, self))
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = [_track(item, self) for item in value]
+        else:
+            value = _track(value, self)
+        return super().__setitem__(index, value)
+
+    def __iadd__(self, items: Iterable):
+        return super().__iadd__([_track(item, self) for item in items])
+
+    def __reduce_ex__(self, protocol):
+        return type(self), (list(self),)
+
+
+class TrackedDict(StructureTracker, dict):
+    """Dict that notifies its holders about each modification, its dict and list values are tracked too."""
+    __slots__ = ('_holders', '__weakref__')
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        for key, value in dict(*args, **kwargs).items():
+            dict.__setitem__(self, key, _track(value, self))
+
+    def __setitem__(self, key, value):
+        self._modified()
+        return super().__setitem__(key, _track(value, self))
+
+    def __delitem__(self, key):
+        self._modified()
+        return super().__delitem__(key)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs):
+        self._modified()
+        for key, value in dict(*args, **kwargs).items():
+            dict.__setitem__(self, key, _track(value, self))
+
+    def setdefault(self, key, default: Any = None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, *args):
+        self._modified()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._modified()
+        return super().popitem()
+
+    def clear(self):
+        self._modified()
+        return super().clear()
+
+    def __reduce_ex__(self, protocol):
+        return type(self), (dict(self),)
+
+
+def _track(value: Any, holder: StructureTracker) -> Any:
+    """Returns the value to keep in the tracked ``holder``: dicts and lists are copied into tracked containers,
+    tracked containers without holders (e.g. restored copies) are taken as they are
+    and the ones of other holders are copied."""
+    value_type = type(value)
+    if value_type is dict:
+        value = TrackedDict(value)
+    elif value_type is list:
+        value = _TrackedValueList(value)
+    elif value_type is TrackedDict or value_type is _TrackedValueList:
+        current_holders = value._live_holders()
+        if any(current_holder is holder for current_holder in current_holders):
+            return value
+        elif current_holders:
+            value = value_type(value)
+        else:
+            value._holders = None
+    else:
+        return value
+    value.add_holder(holder)
+    return value
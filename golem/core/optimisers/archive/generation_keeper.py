@@ -1,10 +1,10 @@
 import datetime
 from abc import ABC, abstractmethod
-from typing import Dict, Iterable, Sequence, Optional, Any, Callable
+from typing import Dict, Hashable, Iterable, Sequence, Optional, Any, Callable
 
 import numpy as np
 
-from golem.core.optimisers.fitness import is_metric_worse
+from golem.core.optimisers.fitness import PopulationFitness, is_metric_worse
 from golem.core.optimisers.genetic.operators.operator import PopulationT
 from golem.core.optimisers.objective.objective import Objective
 from golem.core.optimisers.opt_history_objects.individual import Individual
@@ -56,6 +56,12 @@ def _individuals_same(ind1: Individual, ind2: Individual) -> bool:
             ind1.graph == ind2.graph)
 
 
+def _individuals_key(ind: Individual) -> Hashable:
+    """Returns key of the individual that is the same for the individuals similar by :func:`_individuals_same`.
+    Graphs are compared by the descriptive ids of their root nodes, as ``LinkedGraph.__eq__`` does."""
+    return ind.native_generation, frozenset(root.descriptive_id for root in ind.graph.root_nodes())
+
+
 class GenerationKeeper(ImprovementWatcher):
     """Generation keeper that primarily tracks number of generations and stagnation duration.
 
@@ -67,13 +73,17 @@ class GenerationKeeper(ImprovementWatcher):
          NB: if None then keeper is created in inconsistent state and requires an initial .append().
         similarity_criteria: a function that in the case of multi-objective optimization
          tells the Pareto front whether two individuals are similar, optional.
+        similarity_key: a function that returns hashable key of an individual
+         that is the same for all individuals similar by ``similarity_criteria``, optional.
+         It's used to find similar individuals in the Pareto front without comparing with each of them.
     """
 
     def __init__(self,
                  objective: Optional[Objective] = None,
                  keep_n_best: int = 1,
                  initial_generation: PopulationT = None,
-                 similarity_criteria: Callable = _individuals_same):
+                 similarity_criteria: Callable = _individuals_same,
+                 similarity_key: Optional[Callable[[Individual], Hashable]] = None):
         self._generation_num = 0  # 0 means state before initial generation is added
         self._stagnation_counter = 0  # Initialized in non-stagnated state
         self._stagnation_start_time = datetime.datetime.now()
@@ -83,8 +93,10 @@ class GenerationKeeper(ImprovementWatcher):
         self._reset_metrics_improvement()
 
         if objective.is_multi_objective:
+            if similarity_key is None and similarity_criteria is _individuals_same:
+                similarity_key = _individuals_key
             self.archive = ParetoFront(maxsize=keep_n_best * PARETO_MAX_POP_SIZE_MULTIPLIER,
-                                       similar=similarity_criteria)
+                                       similar=similarity_criteria, similarity_key=similarity_key)
         else:
             self.archive = HallOfFame(maxsize=keep_n_best)
 
@@ -138,9 +150,8 @@ class GenerationKeeper(ImprovementWatcher):
         self._update_improvements(previous_archive_fitness)
 
     def _archive_fitness(self) -> Dict[Any, Sequence[float]]:
-        archive_pop_metrics = (ind.fitness.values for ind in self.archive.items)
-        archive_fitness_per_metric = zip(*archive_pop_metrics)  # transpose nested array
-        archive_fitness_per_metric = dict(zip(self._metric_ids, archive_fitness_per_metric))
+        archive_fitness = PopulationFitness(self.archive.items).values
+        archive_fitness_per_metric = dict(zip(self._metric_ids, archive_fitness.T))
         return archive_fitness_per_metric
 
     def _update_improvements(self, previous_metric_archive):
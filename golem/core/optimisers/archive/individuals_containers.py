@@ -1,8 +1,11 @@
 # This code is modified part of DEAP library (Library URL: https://github.com/DEAP/deap).
-from bisect import bisect_right
-from operator import eq
-from typing import Callable, Optional
+from operator import attrgetter, eq
+from typing import Callable, Dict, Hashable, List, Optional, Set, Tuple
 
+from sortedcontainers import SortedKeyList
+
+from golem.core.optimisers.fitness import Fitness
+from golem.core.optimisers.fitness.non_dominated_sorting import get_fitness_matrix, non_dominated_mask
 from golem.core.optimisers.genetic.operators.operator import PopulationT
 from golem.core.optimisers.opt_history_objects.individual import Individual
 
@@ -20,21 +23,47 @@ class HallOfFame:
     equivalence between two individuals is made by the operator passed to the
     *similar* argument.
 
+    The individuals are kept in a sorted container, so insertion and removal
+    take logarithmic time. If *similarity_key* is provided, the individuals are
+    also indexed by it and only the individuals with the same key are checked
+    for similarity.
+
     :param maxsize: The maximum number of individual to keep in the hall of
                     fame.
     :param similar: An equivalence operator between two individuals, optional.
                     It defaults to operator :func:`operator.eq`.
+    :param similarity_key: A function that returns hashable key of an individual
+                           that is the same for all similar individuals, optional.
+                           It defaults to the uid of the individual if *similar* is
+                           :func:`operator.eq` (that compares individuals by uid).
+                           Without the key each individual is compared with every member.
 
     The class :class:`HallOfFame` provides an interface similar to a list
     (without being one completely). It is possible to retrieve its length, to
     iterate on it forward and backward and to get an item or a slice from it.
     """
 
-    def __init__(self, maxsize: Optional[int], similar: Callable = eq):
+    def __init__(self, maxsize: Optional[int], similar: Callable = eq,
+                 similarity_key: Optional[Callable[[Individual], Hashable]] = None):
         self.maxsize = maxsize or 0
-        self.keys = list()
-        self.items = list()
         self.similar = similar
+        if similarity_key is None and similar is eq:
+            similarity_key = attrgetter('uid')
+        self.similarity_key = similarity_key
+        # individuals in ascending order of fitness, new individuals are placed after the equal old ones
+        self._sorted_items = SortedKeyList(key=attrgetter('fitness'))
+        self._index: Dict[Hashable, List[Individual]] = {}
+        self._index_keys: Dict[int, Hashable] = {}
+
+    @property
+    def items(self) -> List[Individual]:
+        """Individuals from the best to the worst one."""
+        return list(reversed(self._sorted_items))
+
+    @property
+    def keys(self) -> List[Fitness]:
+        """Fitnesses of the individuals from the worst to the best one."""
+        return [ind.fitness for ind in self._sorted_items]
 
     def update(self, population: PopulationT):
         """
@@ -53,23 +82,34 @@ class HallOfFame:
                 # Working on an empty hall of fame is problematic for the loop
                 self.insert(population[0])
                 continue
-            if ind.fitness > self[-1].fitness or len(self) < self.maxsize:
-                for hofer in self:
-                    # Loop through the hall of fame to check for any similar individual
-                    if self.similar(ind, hofer):
-                        break
-                else:
-                    # The individual is unique and strictly better than the worst
-                    if len(self) >= self.maxsize:
-                        self.remove(-1)
-                    self.insert(ind)
+            if (ind.fitness > self[-1].fitness or len(self) < self.maxsize) and not self.has_similar(ind):
+                # The individual is unique and strictly better than the worst
+                if len(self) >= self.maxsize:
+                    self.remove(-1)
+                self.insert(ind)
+
+    def has_similar(self, item: Individual) -> bool:
+        """
+        Check if the hall of fame contains an individual similar to the *item*.
+
+        :param item: The individual to look for.
+        """
+        if self.similarity_key is None:
+            candidates = self._sorted_items
+        else:
+            candidates = self._index.get(self.similarity_key(item), ())
+        return any(self.similar(item, hofer) for hofer in candidates)
+
+    def _similarity_key_of(self, item: Individual) -> Hashable:
+        """Returns similarity key of the item, the keys of the members are taken from the index."""
+        key = self._index_keys.get(id(item))
+        return self.similarity_key(item) if key is None else key
 
     def insert(self, item: Individual):
         """
-        Insert a new individual in the hall of fame using the
-        :func:`~bisect.bisect_right` function. The inserted individual is
-        inserted on the right side of an equal individual. Inserting a new
-        individual in the hall of fame also preserve the hall of fame's order.
+        Insert a new individual in the hall of fame keeping it sorted.
+        The inserted individual is placed after the equal individuals.
+        Inserting a new individual in the hall of fame also preserve the hall of fame's order.
         This method **does not** check for the size of the hall of fame, in a
         way that inserting a new individual in a full hall of fame will not
         remove the worst individual to maintain a constant size.
@@ -77,9 +117,11 @@ class HallOfFame:
         :param item: The individual with a fitness attribute to insert in the
                      hall of fame.
         """
-        i = bisect_right(self.keys, item.fitness)
-        self.items.insert(len(self) - i, item)
-        self.keys.insert(i, item.fitness)
+        self._sorted_items.add(item)
+        if self.similarity_key is not None:
+            key = self.similarity_key(item)
+            self._index.setdefault(key, []).append(item)
+            self._index_keys[id(item)] = key
 
     def remove(self, index: int):
         """
@@ -87,25 +129,34 @@ class HallOfFame:
 
         :param index: An integer giving which item to remove.
         """
-        del self.keys[len(self) - (index % len(self) + 1)]
-        del self.items[index]
+        # items are stored in reversed order
+        item = self._sorted_items.pop(~index)
+        if self.similarity_key is not None:
+            key = self._index_keys.pop(id(item))
+            same_key_items = self._index[key]
+            same_key_items.remove(item)
+            if not same_key_items:
+                del self._index[key]
 
     def clear(self):
         """Clear the hall of fame."""
-        del self.items[:]
-        del self.keys[:]
+        self._sorted_items.clear()
+        self._index.clear()
+        self._index_keys.clear()
 
     def __len__(self):
-        return len(self.items)
+        return len(self._sorted_items)
 
     def __getitem__(self, i):
-        return self.items[i]
+        if isinstance(i, slice):
+            return self.items[i]
+        return self._sorted_items[~i]
 
     def __iter__(self):
-        return iter(self.items)
+        return reversed(self._sorted_items)
 
     def __reversed__(self):
-        return reversed(self.items)
+        return iter(self._sorted_items)
 
     def __str__(self):
         return str(self.items)
@@ -119,6 +170,8 @@ class ParetoFront(HallOfFame):
 
     :param similar: A function that tells the Pareto front whether or not two
                     individuals are similar, optional.
+    :param similarity_key: A function that returns hashable key of an individual
+                           that is the same for all similar individuals, optional.
 
     The size of the front may become very large if it is used for example on
     a continuous function with a continuous domain. In order to limit the number
@@ -134,8 +187,9 @@ class ParetoFront(HallOfFame):
     it is sorted lexicographically at every moment.
     """
 
-    def __init__(self, maxsize: Optional[int] = None, similar: Callable = eq):
-        HallOfFame.__init__(self, maxsize, similar)
+    def __init__(self, maxsize: Optional[int] = None, similar: Callable = eq,
+                 similarity_key: Optional[Callable[[Individual], Hashable]] = None):
+        HallOfFame.__init__(self, maxsize, similar, similarity_key)
 
     def update(self, population: PopulationT):
         """
@@ -144,9 +198,55 @@ class ParetoFront(HallOfFame):
         of fame. If any individual in the hall of fame is dominated it is
         removed.
 
+        Multi-objective fitnesses are compared all at once with vectorized operations,
+        other fitnesses are compared one by one.
+
         :param population: A list of individual with a fitness attribute to
                            update the hall of fame with.
         """
+        population = list(population)
+        if not population:
+            return
+        candidates = self.items + population
+        fitness_matrix = get_fitness_matrix(candidates)
+        if fitness_matrix is None:
+            self._update_one_by_one(population)
+            return
+
+        # the current members go first, so they have priority over their new twins
+        front = []
+        front_by_values: Dict[bytes, List[Individual]] = {}
+        # similarity keys are computed only for the individuals with the same fitness values
+        front_by_keys: Dict[Tuple[bytes, Hashable], List[Individual]] = {}
+        keyed_values: Set[bytes] = set()
+        for ind, values, is_non_dominated in zip(candidates, fitness_matrix, non_dominated_mask(fitness_matrix)):
+            if not is_non_dominated:
+                continue
+            # zero is added to treat negative and positive zeros as the same value
+            values_key = (values + 0.).tobytes()
+            same_fitness_inds = front_by_values.setdefault(values_key, [])
+            if same_fitness_inds and self.similarity_key is not None:
+                if values_key not in keyed_values:
+                    keyed_values.add(values_key)
+                    for twin in same_fitness_inds:
+                        front_by_keys.setdefault((values_key, self._similarity_key_of(twin)), []).append(twin)
+                same_fitness_inds = front_by_keys.setdefault((values_key, self._similarity_key_of(ind)), [])
+            if not any(self.similar(ind, twin) for twin in same_fitness_inds):
+                same_fitness_inds.append(ind)
+                front.append(ind)
+
+        front_ids = set(map(id, front))
+        for i in reversed(range(len(self))):
+            if id(self[i]) not in front_ids:
+                self.remove(i)
+        current_ids = set(map(id, self.items))
+        for ind in front:
+            if id(ind) not in current_ids:
+                self.insert(ind)
+        while len(self) > self.maxsize > 0:
+            self.remove(-1)
+
+    def _update_one_by_one(self, population: PopulationT):
         for ind in population:
             is_dominated = False
             dominates_one = False
@@ -0,0 +1,98 @@
+from typing import List, Optional, Sequence, TYPE_CHECKING
+
+import numpy as np
+
+from golem.core.optimisers.fitness.population_fitness import PopulationFitness
+
+if TYPE_CHECKING:
+    from golem.core.optimisers.opt_history_objects.individual import Individual
+
+
+def get_fitness_matrix(individuals: Sequence['Individual']) -> Optional[np.ndarray]:
+    """Returns weighted values of multi-objective fitnesses of the individuals as a matrix (individuals x objectives)
+    where less values are better, as in :meth:`MultiObjFitness.dominates`.
+
+    Returns:
+        matrix of the values or None if the fitnesses can't be processed as a matrix
+        (e.g. they aren't multi-objective or have different number of values)
+    """
+    try:
+        population_fitness = PopulationFitness.of(individuals)
+    except (TypeError, ValueError):
+        return None
+    if not population_fitness.is_multi_objective:
+        return None
+    # comparisons of not finite values aren't consistent with the comparisons of the fitness objects
+    fitness_matrix = population_fitness.values
+    return fitness_matrix if np.isfinite(fitness_matrix).all() else None
+
+
+def dominance_matrix(fitness_matrix: np.ndarray) -> np.ndarray:
+    """Returns boolean matrix where ``[i, j]`` is True if i-th fitness dominates j-th one.
+
+    Args:
+        fitness_matrix: matrix of fitness values (fitnesses x objectives), less is better
+    """
+    not_worse = np.all(fitness_matrix[:, None, :] <= fitness_matrix[None, :, :], axis=2)
+    better = np.any(fitness_matrix[:, None, :] < fitness_matrix[None, :, :], axis=2)
+    return not_worse & better
+
+
+def non_dominated_mask(fitness_matrix: np.ndarray) -> np.ndarray:
+    """Returns boolean mask of the fitnesses that aren't dominated by any other fitness (i.e. the first front).
+
+    Args:
+        fitness_matrix: matrix of fitness values (fitnesses x objectives), less is better
+    """
+    return ~dominance_matrix(fitness_matrix).any(axis=0)
+
+
+def fast_non_dominated_sort(fitness_matrix: np.ndarray) -> List[np.ndarray]:
+    """Splits the fitnesses into Pareto fronts with vectorized version of Deb's fast non-dominated sorting.
+
+    Args:
+        fitness_matrix: matrix of fitness values (fitnesses x objectives), less is better
+
+    Returns:
+        arrays of indices of the fitnesses in each front starting from the non-dominated one
+    """
+    dominates = dominance_matrix(fitness_matrix)
+    domination_counts = dominates.sum(axis=0)
+    fronts = []
+    front = np.flatnonzero(domination_counts == 0)
+    while front.size:
+        fronts.append(front)
+        domination_counts -= dominates[front].sum(axis=0)
+        # fitnesses in the previous fronts are dominated only by each other, so they can't get zero count again
+        domination_counts[front] = -1
+        front = np.flatnonzero(domination_counts == 0)
+    return fronts
+
+
+def crowding_distance(fitness_matrix: np.ndarray) -> np.ndarray:
+    """Computes crowding distance of NSGA-II for the fitnesses from one front:
+    sum of the normalized distances between the neighbours of each fitness along each objective.
+    Boundary fitnesses get infinite distance.
+
+    Args:
+        fitness_matrix: matrix of fitness values (fitnesses x objectives)
+
+    Returns:
+        crowding distance of each fitness
+    """
+    fitness_len = len(fitness_matrix)
+    distances = np.zeros(fitness_len)
+    if fitness_len <= 2:
+        distances[:] = np.inf
+        return distances
+    order = np.argsort(fitness_matrix, axis=0, kind='stable')
+    sorted_values = np.take_along_axis(fitness_matrix, order, axis=0)
+    values_range = sorted_values[-1] - sorted_values[0]
+    # objectives with equal values don't affect the distance
+    normalizer = np.where(values_range > 0, values_range, np.inf)
+    neighbours_distances = (sorted_values[2:] - sorted_values[:-2]) / normalizer
+    for objective_idx in range(fitness_matrix.shape[1]):
+        distances[order[1:-1, objective_idx]] += neighbours_distances[:, objective_idx]
+    distances[order[0]] = np.inf
+    distances[order[-1]] = np.inf
+    return distances
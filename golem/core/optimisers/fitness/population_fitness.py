@@ -0,0 +1,86 @@
+from operator import is_
+from typing import List, Optional, Sequence, TYPE_CHECKING
+
+import numpy as np
+
+from golem.core.optimisers.fitness.fitness import Fitness
+from golem.core.optimisers.fitness.multi_objective_fitness import MultiObjFitness
+
+if TYPE_CHECKING:
+    from golem.core.optimisers.opt_history_objects.individual import Individual
+
+
+class PopulationFitness:
+    """Fitness values of the population individuals kept in a contiguous array
+    (individuals x objectives) next to the individuals.
+
+    The array contains weighted values as in :attr:`Fitness.values`.
+    Values of invalid fitnesses and missing values (if the fitnesses have different number of values) are nan.
+    The values are copied from the fitness objects, so the store has to be recreated
+    if the population or the fitnesses of its individuals change.
+
+    Args:
+        individuals: individuals of the population
+    """
+    __slots__ = ('individuals', 'values', 'valid', 'is_multi_objective')
+
+    def __init__(self, individuals: Sequence['Individual']):
+        self.individuals = tuple(individuals)
+        fitnesses = [ind.fitness for ind in self.individuals]
+        self.values = _values_matrix(fitnesses)
+        self.values.setflags(write=False)
+        self.valid = np.fromiter((fitness.valid for fitness in fitnesses), dtype=bool, count=len(fitnesses))
+        self.is_multi_objective = bool(fitnesses) and all(isinstance(fitness, MultiObjFitness)
+                                                          for fitness in fitnesses)
+
+    @staticmethod
+    def of(population: Sequence['Individual']) -> 'PopulationFitness':
+        """Returns fitness store of the population.
+        Reuses the store cached by the population if it has one (see :attr:`Generation.fitness_store`)."""
+        if isinstance(population, PopulationFitness):
+            return population
+        store = getattr(population, 'fitness_store', None)
+        return store if isinstance(store, PopulationFitness) else PopulationFitness(population)
+
+    @property
+    def num_objectives(self) -> int:
+        return self.values.shape[1]
+
+    @property
+    def all_valid(self) -> bool:
+        return bool(self.valid.all())
+
+    def objective_values(self, objective_idx: int) -> np.ndarray:
+        """Returns values of the specified objective for all individuals (nan if an individual doesn't have it)."""
+        if objective_idx >= self.num_objectives:
+            return np.full(len(self), np.nan)
+        return self.values[:, objective_idx]
+
+    def objective_values_list(self, objective_idx: int) -> List[Optional[float]]:
+        """Returns values of the specified objective as list with None instead of nan-s as in :attr:`Fitness.values`."""
+        return nan_to_none(self.objective_values(objective_idx))
+
+    def is_actual_for(self, individuals: Sequence['Individual']) -> bool:
+        """Checks if the store was created for the same individuals in the same order."""
+        return len(individuals) == len(self.individuals) and all(map(is_, individuals, self.individuals))
+
+    def __len__(self) -> int:
+        return len(self.individuals)
+
+
+def nan_to_none(values: np.ndarray) -> List[Optional[float]]:
+    """Converts array of fitness values to list, nan-s of the invalid fitnesses are replaced with None."""
+    return [None if np.isnan(value) else value for value in values.tolist()]
+
+
+def _values_matrix(fitnesses: Sequence[Fitness]) -> np.ndarray:
+    values = [fitness.values for fitness in fitnesses]
+    if not values:
+        return np.empty((0, 0))
+    if len({len(fitness_values) for fitness_values in values}) == 1:
+        # dtype=float replaces None values with nan-s
+        return np.array(values, dtype=float).reshape(len(values), -1)
+    matrix = np.full((len(values), max(map(len, values))), np.nan)
+    for row, fitness_values in zip(matrix, values):
+        row[:len(fitness_values)] = np.array(fitness_values, dtype=float)
+    return matrix
@@ -1,25 +1,30 @@
 import gc
 import logging
 import pathlib
+import shelve
 import timeit
 from abc import ABC, abstractmethod
-from datetime import datetime
-from functools import partial
-from typing import List, Optional, Sequence, Tuple, TypeVar, Dict
-
-from joblib import Parallel, delayed
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future
+from copy import copy
+from datetime import datetime, timedelta
+from itertools import chain
+from math import ceil
+from typing import Any, Callable, List, Optional, Sequence, Tuple, TypeVar, Dict, Union
 
 from golem.core.adapter import BaseOptimizationAdapter
+from golem.core.dag.compact_graph import CompactGraph, decode_graph, encode_graph
 from golem.core.dag.graph import Graph
 from golem.core.log import default_log, Log
-from golem.core.optimisers.fitness import Fitness
+from golem.core.optimisers.fitness import Fitness, null_fitness
 from golem.core.optimisers.genetic.operators.operator import EvaluationOperator, PopulationT
 from golem.core.optimisers.graph import OptGraph
 from golem.core.optimisers.objective import GraphFunction, ObjectiveFunction
-from golem.core.optimisers.opt_history_objects.individual import GraphEvalResult
+from golem.core.optimisers.opt_history_objects.individual import GraphEvalResult, Individual
 from golem.core.optimisers.timer import Timer, get_forever_timer
 from golem.utilities.serializable import Serializable
 from golem.utilities.memory import MemoryAnalytics
+from golem.utilities.process_pool import TaskTimeoutError, TimeoutProcessPool
 from golem.utilities.utilities import determine_n_jobs
 
 # the percentage of successful evaluations,
@@ -29,6 +34,29 @@ STAGNATION_EVALUATION_PERCENTAGE = 0.5
 EvalResultsList = List[GraphEvalResult]
 G = TypeVar('G', bound=Serializable)
 
+# dispatcher that evaluates graphs in the worker process, set once at the start of the worker
+_worker_dispatcher: Optional['BaseGraphEvaluationDispatcher'] = None
+
+
+def _init_evaluation_worker(dispatcher: 'BaseGraphEvaluationDispatcher',
+                            logs_initializer: Tuple[int, pathlib.Path]):
+    global _worker_dispatcher
+    _worker_dispatcher = dispatcher
+    Log.setup_in_mp(*logs_initializer)
+
+
+def _evaluate_in_worker(encoded_graphs: Sequence[Union[CompactGraph, OptGraph]],
+                        uids_of_individuals: Sequence[str]) -> EvalResultsList:
+    graphs = [decode_graph(encoded_graph) for encoded_graph in encoded_graphs]
+    evaluation_results = _worker_dispatcher.evaluate_graphs(graphs, uids_of_individuals)
+    for eval_res, encoded_graph in zip(evaluation_results, encoded_graphs):
+        if eval_res is not None and isinstance(encoded_graph, CompactGraph):
+            encoded_result = encode_graph(eval_res.graph)
+            # send the graph back only if it was changed during evaluation
+            unchanged = isinstance(encoded_result, CompactGraph) and encoded_result.has_same_structure(encoded_graph)
+            eval_res.graph = None if unchanged else encoded_result
+    return evaluation_results
+
 
 class DelegateEvaluator:
     """Interface for delegate evaluator of graphs."""
@@ -43,6 +71,96 @@ class DelegateEvaluator:
         raise NotImplementedError()
 
 
+class FitnessCache:
+    """Bounded cache of fitness values keyed by the structural identity of graphs.
+
+    Structurally identical graphs (e.g. produced by different mutations or crossovers,
+    or evaluated in the previous generations) get the fitness from the cache
+    instead of being evaluated again. Least recently used entries are evicted
+    when in-memory cache exceeds ``maxsize``.
+
+    Optionally the cache is backed by on-disk store (``shelve``) that is unbounded
+    and persists between runs, so that repeated and resumed runs reuse fitness values.
+    Fitness values depend on the objective and the data, so the keys are prefixed with the namespace
+    that identifies the problem, and the on-disk store requires it.
+
+    Args:
+        maxsize: max number of fitness values kept in memory.
+        cache_path: optional path to the on-disk store of the cache.
+        namespace: identifier of the problem (e.g. objective and dataset) that the fitness values belong to.
+    """
+
+    def __init__(self, maxsize: int = 10_000, cache_path: Optional[Union[str, pathlib.Path]] = None,
+                 namespace: str = ''):
+        if cache_path and not namespace:
+            raise ValueError('Namespace of the fitness cache is required for the on-disk store, '
+                             'since the stored fitness values must be reused only for the same problem.')
+        self.maxsize = maxsize
+        self.cache_path = str(cache_path) if cache_path else None
+        self.namespace = namespace
+        self._cache: 'OrderedDict[str, Fitness]' = OrderedDict()
+        self._store: Optional[shelve.Shelf] = None
+        self.hits = 0
+        self.misses = 0
+
+    def graph_key(self, graph: Graph) -> str:
+        """Returns key of the graph that is the same for structurally identical graphs."""
+        return f'{self.namespace}/{graph.structural_hash}' if self.namespace else graph.structural_hash
+
+    def get(self, graph: Graph) -> Optional[Fitness]:
+        """Returns cached fitness of the graph or None if the graph wasn't evaluated before."""
+        key = self.graph_key(graph)
+        fitness = self._cache.get(key)
+        if fitness is not None:
+            self._cache.move_to_end(key)
+        elif self.cache_path:
+            fitness = self._get_store().get(key)
+            if fitness is not None:
+                self._put_in_memory(key, fitness)
+        if fitness is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return copy(fitness)
+
+    def put(self, graph: Graph, fitness: Fitness):
+        """Stores valid fitness of the graph in the cache."""
+        if not fitness.valid:
+            return
+        key = self.graph_key(graph)
+        self._put_in_memory(key, fitness)
+        if self.cache_path:
+            self._get_store()[key] = fitness
+
+    def close(self):
+        """Flushes and closes on-disk store. The store is reopened on the next access."""
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    def _put_in_memory(self, key: str, fitness: Fitness):
+        self._cache[key] = fitness
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+    def _get_store(self) -> shelve.Shelf:
+        if self._store is None:
+            pathlib.Path(self.cache_path).parent.mkdir(parents=True, exist_ok=True)
+            self._store = shelve.open(self.cache_path)
+        return self._store
+
+    def __len__(self):
+        return len(self._cache)
+
+    def __getstate__(self):
+        # cache is used only in the main process, so don't send its content to workers
+        state = self.__dict__.copy()
+        state['_cache'] = OrderedDict()
+        state['_store'] = None
+        return state
+
+
 class ObjectiveEvaluationDispatcher(ABC):
     """Builder for evaluation operator.
     Takes objective function and decides how to evaluate it over population:
@@ -72,6 +190,10 @@ class ObjectiveEvaluationDispatcher(ABC):
         """
         pass
 
+    def shutdown(self):
+        """Releases resources held by the dispatcher (e.g. caches or worker pools)."""
+        pass
+
     @staticmethod
     def split_individuals_to_evaluate(individuals: PopulationT) -> Tuple[PopulationT, PopulationT]:
         """Split individuals sequence to evaluated and skipped ones."""
@@ -89,11 +211,14 @@ class ObjectiveEvaluationDispatcher(ABC):
                                  evaluation_results: EvalResultsList) -> PopulationT:
         """Applies results of evaluation to the evaluated population.
         Excludes individuals that weren't evaluated."""
-        evaluation_results = {res.uid_of_individual: res for res in evaluation_results if res}
+        evaluation_results = {res.uid_of_individual: res for res in evaluation_results if res is not None}
         individuals_evaluated = []
         for ind in individuals:
             eval_res = evaluation_results.get(ind.uid)
             if not eval_res:
+                if eval_res is not None:
+                    # keep metadata of failed evaluation (e.g. timeout)
+                    ind.metadata.update(eval_res.metadata)
                 continue
             ind.set_evaluation_result(eval_res)
             individuals_evaluated.append(ind)
@@ -110,18 +235,31 @@ class BaseGraphEvaluationDispatcher(ObjectiveEvaluationDispatcher):
         n_jobs: number of jobs for multiprocessing or 1 for no multiprocessing.
         graph_cleanup_fn: function to call after graph evaluation, primarily for memory cleanup.
         delegate_evaluator: delegate graph fitter (e.g. for remote graph fitting before evaluation)
+        fitness_cache: cache of fitness values of already evaluated graphs
+        graph_eval_timeout: hard time limit for evaluation of each graph. Enforced by the dispatchers
+         that evaluate graphs in worker processes: stuck workers are killed and replaced,
+         and the graph gets invalid fitness. All workers are replaced at once,
+         so the graphs that are evaluated at the moment by the other workers are evaluated again.
     """
 
     def __init__(self,
                  adapter: BaseOptimizationAdapter,
                  n_jobs: int = 1,
                  graph_cleanup_fn: Optional[GraphFunction] = None,
-                 delegate_evaluator: Optional[DelegateEvaluator] = None):
+                 delegate_evaluator: Optional[DelegateEvaluator] = None,
+                 fitness_cache: Optional[FitnessCache] = None,
+                 graph_eval_timeout: Optional[timedelta] = None):
         self._adapter = adapter
         self._objective_eval = None
         self._cleanup = graph_cleanup_fn
         self._post_eval_callback = None
         self._delegate_evaluator = delegate_evaluator
+        self._fitness_cache = fitness_cache
+        # individuals with the same graphs as the individual (by uid) that is being evaluated
+        self._batch_duplicates: Dict[str, PopulationT] = {}
+        self._graph_eval_timeout = graph_eval_timeout
+        self._pool: Optional[TimeoutProcessPool] = None
+        self._is_batch_objective = False
 
         self.timer = None
         self.logger = default_log(self)
@@ -131,14 +269,105 @@ class BaseGraphEvaluationDispatcher(ObjectiveEvaluationDispatcher):
 
     def dispatch(self, objective: ObjectiveFunction, timer: Optional[Timer] = None) -> EvaluationOperator:
         """Return handler to this object that hides all details
-        and allows only to evaluate population with provided objective."""
+        and allows only to evaluate population with provided objective.
+        If ``timer`` isn't provided, the timer of the previous dispatch is kept."""
+        if timer is None:
+            timer = self.timer or get_forever_timer()
+        if objective is not self._objective_eval or timer is not self.timer:
+            # workers evaluate the objective they got at start
+            self._reset_pool()
         self._objective_eval = objective
-        self.timer = timer or get_forever_timer()
+        self.timer = timer
+        # dispatchers with the custom evaluation of graphs evaluate them separately
+        self._is_batch_objective = (getattr(objective, 'supports_batch_evaluation', False) and
+                                    type(self).evaluate_single is BaseGraphEvaluationDispatcher.evaluate_single)
         return self.evaluate_population
 
     def set_graph_evaluation_callback(self, callback: Optional[GraphFunction]):
+        if callback is not self._post_eval_callback:
+            self._reset_pool()
         self._post_eval_callback = callback
 
+    def shutdown(self):
+        self._reset_pool()
+        if self._fitness_cache is not None:
+            self._fitness_cache.close()
+
+    @property
+    def n_workers(self) -> int:
+        """Number of worker processes that evaluate graphs."""
+        return determine_n_jobs(self._n_jobs)
+
+    def map_in_workers(self, fn: Callable, tasks: Sequence[tuple]) -> List[Any]:
+        """Executes ``fn(*args)`` for each of the ``tasks`` in the worker pool used for evaluation
+        and returns the results in the order of the tasks. Tasks aren't limited in time.
+        Used to offload other work of the optimizer (e.g. reproduction) to the warm workers."""
+        pool = self._get_pool()
+        futures = [pool.submit_with_timeout(None, fn, *args) for args in tasks]
+        pool.wait(futures)
+        return [future.result() for future in futures]
+
+    def split_cached_individuals(self, individuals: PopulationT) -> Tuple[PopulationT, PopulationT]:
+        """Split individuals to the ones that must be evaluated and the ones
+        that got fitness from the cache of previously evaluated graphs.
+        Of the individuals with structurally identical graphs only the first one is evaluated,
+        the others get its fitness in :meth:`cache_evaluated_individuals`.
+        Individuals that got fitness from the cache are marked in the metadata (see :meth:`_mark_cached`)."""
+        if self._fitness_cache is None:
+            return individuals, []
+        individuals_to_evaluate = []
+        individuals_cached = []
+        individuals_by_key: Dict[str, Individual] = {}
+        for ind in individuals:
+            fitness = self._fitness_cache.get(ind.graph)
+            if fitness is not None:
+                ind.set_evaluation_result(fitness)
+                self._mark_cached(ind)
+                individuals_cached.append(ind)
+                continue
+            key = self._fitness_cache.graph_key(ind.graph)
+            if key in individuals_by_key:
+                self._batch_duplicates.setdefault(individuals_by_key[key].uid, []).append(ind)
+            else:
+                individuals_by_key[key] = ind
+                individuals_to_evaluate.append(ind)
+        if individuals_cached:
+            self.logger.debug(f'Fitness of {len(individuals_cached)} individuals was taken from the cache.')
+        return individuals_to_evaluate, individuals_cached
+
+    def cache_evaluated_individuals(self, individuals: PopulationT,
+                                    individuals_evaluated: PopulationT) -> PopulationT:
+        """Stores fitness of evaluated individuals in the cache of evaluated graphs.
+
+        Args:
+            individuals: individuals that were sent to evaluation
+            individuals_evaluated: successfully evaluated individuals of them
+
+        Returns:
+            individuals with the same graphs as the evaluated ones that got their fitness
+        """
+        if self._fitness_cache is None:
+            return []
+        duplicates = {ind.uid: self._batch_duplicates.pop(ind.uid, []) for ind in individuals}
+        individuals_copied = []
+        for ind in individuals_evaluated:
+            self._fitness_cache.put(ind.graph, ind.fitness)
+            for duplicate in duplicates[ind.uid]:
+                duplicate.set_evaluation_result(copy(ind.fitness))
+                self._mark_cached(duplicate, ind.metadata.get('evaluation_time_iso'))
+                individuals_copied.append(duplicate)
+        return individuals_copied
+
+    @staticmethod
+    def _mark_cached(individual: Individual, evaluation_time_iso: Optional[str] = None):
+        """Sets the evaluation metadata of the individual that got fitness from the cache:
+        its graph wasn't evaluated, so no computation time was spent on it."""
+        individual.metadata.update({
+            'computation_time_in_seconds': 0.,
+            'evaluation_time_iso': evaluation_time_iso or datetime.now().isoformat(),
+            'fitness_from_cache': True
+        })
+
     def population_evaluation_info(self, pop_size: int, evaluated_pop_size: int):
         """ Shows the amount of successfully evaluated individuals and total number of individuals in population.
          If there are more that 50% of successful evaluations than it's more likely
@@ -182,16 +411,46 @@ class BaseGraphEvaluationDispatcher(ObjectiveEvaluationDispatcher):
         )
         return eval_res
 
+    def evaluate_batch(self, graphs: Sequence[OptGraph], uids_of_individuals: Sequence[str],
+                       with_time_limit: bool = True) -> EvalResultsList:
+        """Evaluates graphs with one call of ``evaluate_batch`` of the objective.
+        Computation time of the batch is equally divided between the graphs."""
+        if not graphs or with_time_limit and self.timer.is_time_limit_reached():
+            return [None] * len(graphs)
+
+        domain_graphs = [self._adapter.restore(graph) for graph in graphs]
+        start_time = timeit.default_timer()
+        fitnesses = self._objective_eval.evaluate_batch(domain_graphs)
+        for domain_graph in domain_graphs:
+            self._after_graph_evaluation(domain_graph)
+        gc.collect()
+        end_time = timeit.default_timer()
+        eval_time_iso = datetime.now().isoformat()
+
+        return [GraphEvalResult(
+            uid_of_individual=uid, fitness=fitness, graph=self._adapter.adapt(domain_graph), metadata={
+                'computation_time_in_seconds': (end_time - start_time) / len(graphs),
+                'evaluation_time_iso': eval_time_iso
+            }) for uid, fitness, domain_graph in zip(uids_of_individuals, fitnesses, domain_graphs)]
+
+    def evaluate_graphs(self, graphs: Sequence[OptGraph], uids_of_individuals: Sequence[str]) -> EvalResultsList:
+        """Evaluates graphs at once if objective supports batch evaluation or each graph separately."""
+        if self._is_batch_objective:
+            return self.evaluate_batch(graphs, uids_of_individuals)
+        return [self.evaluate_single(graph, uid) for graph, uid in zip(graphs, uids_of_individuals)]
+
     def _evaluate_graph(self, domain_graph: Graph) -> Tuple[Fitness, Graph]:
         fitness = self._objective_eval(domain_graph)
+        self._after_graph_evaluation(domain_graph)
+        gc.collect()
 
+        return fitness, domain_graph
+
+    def _after_graph_evaluation(self, domain_graph: Graph):
         if self._post_eval_callback:
             self._post_eval_callback(domain_graph)
         if self._cleanup:
             self._cleanup(domain_graph)
-        gc.collect()
-
-        return fitness, domain_graph
 
     def evaluate_with_cache(self, population: PopulationT) -> PopulationT:
         reversed_population = list(reversed(population))
@@ -203,6 +462,87 @@ class BaseGraphEvaluationDispatcher(ObjectiveEvaluationDispatcher):
     def _reset_eval_cache(self):
         self.evaluation_cache: Dict[str, Graph] = {}
 
+    def _get_pool(self) -> TimeoutProcessPool:
+        """Returns worker pool that is kept between evaluations of populations.
+        Dispatcher with the objective and the adapter is sent to each worker only once at its start."""
+        if self._pool is None:
+            task_timeout = self._graph_eval_timeout.total_seconds() if self._graph_eval_timeout else None
+            self._pool = TimeoutProcessPool(determine_n_jobs(self._n_jobs, self.logger), task_timeout,
+                                            initializer=_init_evaluation_worker,
+                                            initargs=(self, Log().get_parameters()))
+        return self._pool
+
+    def _reset_pool(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _split_into_tasks(self, individuals: PopulationT) -> List[PopulationT]:
+        """Splits individuals into the tasks for the workers. Objective that supports batch evaluation
+        gets chunks of individuals (one for each worker), other objectives get individuals one by one."""
+        if not self._is_batch_objective or not individuals:
+            return [[ind] for ind in individuals]
+        chunk_size = ceil(len(individuals) / min(len(individuals), self._get_pool().n_workers))
+        return [individuals[i:i + chunk_size] for i in range(0, len(individuals), chunk_size)]
+
+    def _submit(self, individuals: PopulationT) -> Future:
+        """Submits evaluation of the individuals to the worker pool as one task."""
+        pool = self._get_pool()
+        graphs = [ind.graph for ind in individuals]
+        uids = [ind.uid for ind in individuals]
+        if pool.is_in_process:
+            return pool.submit(self.evaluate_graphs, graphs, uids)
+        # time limit is set for each graph
+        task_timeout = pool.task_timeout * len(individuals) if pool.task_timeout is not None else None
+        return pool.submit_with_timeout(task_timeout, _evaluate_in_worker,
+                                        [encode_graph(graph) for graph in graphs], uids)
+
+    def _apply_futures(self, futures: Dict[Future, PopulationT]) -> PopulationT:
+        """Applies results of finished evaluations. Individuals that weren't evaluated
+        in time get invalid fitness with the timeout mark in the metadata."""
+        evaluation_results = []
+        for future, individuals in futures.items():
+            try:
+                task_results = future.result()
+                for eval_res in task_results:
+                    if eval_res is not None and eval_res.graph is not None:
+                        eval_res.graph = decode_graph(eval_res.graph)
+                evaluation_results.extend(task_results)
+            except TaskTimeoutError as ex:
+                self.logger.warning(f'Evaluation of individuals {[ind.uid for ind in individuals]} '
+                                    f'was terminated after {ex.task_timeout} seconds.')
+                evaluation_results.extend(GraphEvalResult(
+                    uid_of_individual=ind.uid, fitness=null_fitness(), graph=ind.graph, metadata={
+                        'evaluation_timeout': True,
+                        'computation_time_in_seconds': ex.task_timeout / len(individuals),
+                        'evaluation_time_iso': datetime.now().isoformat()
+                    }) for ind in individuals)
+            except Exception as ex:
+                self.logger.warning(f'Evaluation of individuals {[ind.uid for ind in individuals]} failed: {ex}')
+        evaluated_individuals = list(chain.from_iterable(futures.values()))
+        individuals_evaluated = self.apply_evaluation_results(evaluated_individuals, evaluation_results)
+        individuals_evaluated += self.cache_evaluated_individuals(evaluated_individuals, individuals_evaluated)
+        return individuals_evaluated
+
+    def _evaluate_any_without_time_limit(self, individuals: PopulationT) -> PopulationT:
+        """Tries to get at least one successful evaluation even if time limit was reached.
+        Individuals that exceeded the time limit of graph evaluation are not retried."""
+        for single_ind in individuals:
+            if single_ind.metadata.get('evaluation_timeout'):
+                continue
+            evaluation_result = self.evaluate_single(single_ind.graph, single_ind.uid, with_time_limit=False)
+            successful_evals = self.apply_evaluation_results([single_ind], [evaluation_result])
+            if successful_evals:
+                return successful_evals
+        return []
+
+    def __getstate__(self):
+        # worker pool is not sent to the workers with `evaluate_single`
+        state = self.__dict__.copy()
+        state['_pool'] = None
+        state['_batch_duplicates'] = {}
+        return state
+
     def _remote_compute_cache(self, population: PopulationT):
         self._reset_eval_cache()
         if self._delegate_evaluator and self._delegate_evaluator.is_enabled:
@@ -223,15 +563,20 @@ class MultiprocessingDispatcher(BaseGraphEvaluationDispatcher):
         n_jobs: number of jobs for multiprocessing or 1 for no multiprocessing.
         graph_cleanup_fn: function to call after graph evaluation, primarily for memory cleanup.
         delegate_evaluator: delegate graph fitter (e.g. for remote graph fitting before evaluation)
+        fitness_cache: cache of fitness values of already evaluated graphs
+        graph_eval_timeout: hard time limit for evaluation of each graph.
+         If specified then graphs are evaluated in worker processes even with ``n_jobs=1``.
     """
 
     def __init__(self,
                  adapter: BaseOptimizationAdapter,
                  n_jobs: int = 1,
                  graph_cleanup_fn: Optional[GraphFunction] = None,
-                 delegate_evaluator: Optional[DelegateEvaluator] = None):
+                 delegate_evaluator: Optional[DelegateEvaluator] = None,
+                 fitness_cache: Optional[FitnessCache] = None,
+                 graph_eval_timeout: Optional[timedelta] = None):
 
-        super().__init__(adapter, n_jobs, graph_cleanup_fn, delegate_evaluator)
+        super().__init__(adapter, n_jobs, graph_cleanup_fn, delegate_evaluator, fitness_cache, graph_eval_timeout)
 
     def dispatch(self, objective: ObjectiveFunction, timer: Optional[Timer] = None) -> EvaluationOperator:
         """Return handler to this object that hides all details
@@ -241,24 +586,19 @@ class MultiprocessingDispatcher(BaseGraphEvaluationDispatcher):
 
     def evaluate_population(self, individuals: PopulationT) -> PopulationT:
         individuals_to_evaluate, individuals_to_skip = self.split_individuals_to_evaluate(individuals)
+        individuals_to_evaluate, individuals_cached = self.split_cached_individuals(individuals_to_evaluate)
+        individuals_to_skip = individuals_cached + individuals_to_skip
         # Evaluate individuals without valid fitness in parallel.
-        n_jobs = determine_n_jobs(self._n_jobs, self.logger)
-
-        parallel = Parallel(n_jobs=n_jobs, verbose=0, pre_dispatch="2*n_jobs")
-        eval_func = partial(self.evaluate_single, logs_initializer=Log().get_parameters())
-        evaluation_results = parallel(delayed(eval_func)(ind.graph, ind.uid) for ind in individuals_to_evaluate)
-        individuals_evaluated = self.apply_evaluation_results(individuals_to_evaluate, evaluation_results)
+        futures = {self._submit(task): task for task in self._split_into_tasks(individuals_to_evaluate)}
+        self._get_pool().wait(futures)
+        individuals_evaluated = self._apply_futures(futures)
         # If there were no successful evals then try once again getting at least one,
         # even if time limit was reached
         successful_evals = individuals_evaluated + individuals_to_skip
         self.population_evaluation_info(evaluated_pop_size=len(successful_evals),
                                         pop_size=len(individuals))
         if not successful_evals:
-            for single_ind in individuals:
-                evaluation_result = eval_func(single_ind.graph, single_ind.uid, with_time_limit=False)
-                successful_evals = self.apply_evaluation_results([single_ind], [evaluation_result])
-                if successful_evals:
-                    break
+            successful_evals = self._evaluate_any_without_time_limit(individuals)
         MemoryAnalytics.log(self.logger,
                             additional_info='parallel evaluation of population',
                             logging_level=logging.INFO)
@@ -273,7 +613,122 @@ class SequentialDispatcher(BaseGraphEvaluationDispatcher):
 
     def evaluate_population(self, individuals: PopulationT) -> PopulationT:
         individuals_to_evaluate, individuals_to_skip = self.split_individuals_to_evaluate(individuals)
-        evaluation_results = [self.evaluate_single(ind.graph, ind.uid) for ind in individuals_to_evaluate]
+        individuals_to_evaluate, individuals_cached = self.split_cached_individuals(individuals_to_evaluate)
+        individuals_to_skip = individuals_cached + individuals_to_skip
+        evaluation_results = self.evaluate_graphs([ind.graph for ind in individuals_to_evaluate],
+                                                  [ind.uid for ind in individuals_to_evaluate])
         individuals_evaluated = self.apply_evaluation_results(individuals_to_evaluate, evaluation_results)
+        individuals_evaluated += self.cache_evaluated_individuals(individuals_to_evaluate, individuals_evaluated)
         evaluated_population = individuals_evaluated + individuals_to_skip
         return evaluated_population
+
+    @property
+    def n_workers(self) -> int:
+        return 1
+
+    def map_in_workers(self, fn: Callable, tasks: Sequence[tuple]) -> List[Any]:
+        return [fn(*args) for args in tasks]
+
+
+class AsyncDispatcher(BaseGraphEvaluationDispatcher):
+    """Evaluates objective function asynchronously using a pool of worker processes.
+
+    Unlike :class:`MultiprocessingDispatcher` it doesn't synchronize workers on the whole population.
+    Individuals are sent to the workers with ``submit``, and evaluated ones are returned
+    by ``collect`` as soon as they are ready, so that the optimizer can reproduce new individuals
+    for the free workers while the slow evaluations are still running (steady-state evolution).
+
+    Usage: call `dispatch(objective_function)` to get evaluation function
+    that evaluates the whole population, or use ``submit`` & ``collect`` for asynchronous evaluation.
+
+    Args:
+        adapter: adapter for graphs
+        n_jobs: number of worker processes or 1 for evaluation in the main process.
+        graph_cleanup_fn: function to call after graph evaluation, primarily for memory cleanup.
+        delegate_evaluator: delegate graph fitter (e.g. for remote graph fitting before evaluation).
+         Used only for evaluation of the whole population.
+        fitness_cache: cache of fitness values of already evaluated graphs
+        graph_eval_timeout: hard time limit for evaluation of each graph.
+         If specified then graphs are evaluated in worker processes even with ``n_jobs=1``.
+    """
+
+    def __init__(self,
+                 adapter: BaseOptimizationAdapter,
+                 n_jobs: int = 1,
+                 graph_cleanup_fn: Optional[GraphFunction] = None,
+                 delegate_evaluator: Optional[DelegateEvaluator] = None,
+                 fitness_cache: Optional[FitnessCache] = None,
+                 graph_eval_timeout: Optional[timedelta] = None):
+        super().__init__(adapter, n_jobs, graph_cleanup_fn, delegate_evaluator, fitness_cache, graph_eval_timeout)
+        self._in_flight: Dict[Future, PopulationT] = {}
+
+    def dispatch(self, objective: ObjectiveFunction, timer: Optional[Timer] = None) -> EvaluationOperator:
+        """Return handler to this object that hides all details
+        and allows only to evaluate population with provided objective."""
+        super().dispatch(objective, timer)
+        return self.evaluate_with_cache
+
+    @property
+    def max_in_flight(self) -> int:
+        """Number of evaluations that can run simultaneously."""
+        return self.n_workers
+
+    @property
+    def num_in_flight(self) -> int:
+        """Number of submitted individuals that are not collected yet."""
+        return sum(map(len, self._in_flight.values()))
+
+    def submit(self, individuals: PopulationT) -> PopulationT:
+        """Starts asynchronous evaluation of individuals.
+
+        Returns:
+            individuals that don't require evaluation (with valid fitness or with fitness from the cache)
+        """
+        individuals_to_evaluate, individuals_to_skip = self.split_individuals_to_evaluate(individuals)
+        individuals_to_evaluate, individuals_cached = self.split_cached_individuals(individuals_to_evaluate)
+        for task in self._split_into_tasks(individuals_to_evaluate):
+            self._in_flight[self._submit(task)] = task
+        return individuals_cached + individuals_to_skip
+
+    def collect(self, block: bool = True) -> PopulationT:
+        """Returns successfully evaluated individuals from the submitted ones.
+
+        Args:
+            block: if True then waits until at least one of the submitted individuals is evaluated.
+
+        Returns:
+            evaluated individuals, individuals with failed evaluation are dropped
+        """
+        if not self._in_flight:
+            return []
+        done = self._get_pool().wait(self._in_flight, timeout=None if block else 0, return_when=FIRST_COMPLETED)
+        return self._apply_futures({future: self._in_flight.pop(future) for future in done})
+
+    def evaluate_population(self, individuals: PopulationT) -> PopulationT:
+        individuals_to_evaluate, individuals_to_skip = self.split_individuals_to_evaluate(individuals)
+        individuals_to_evaluate, individuals_cached = self.split_cached_individuals(individuals_to_evaluate)
+        individuals_to_skip = individuals_cached + individuals_to_skip
+
+        futures = {self._submit(task): task for task in self._split_into_tasks(individuals_to_evaluate)}
+        self._get_pool().wait(futures)
+        individuals_evaluated = self._apply_futures(futures)
+        # If there were no successful evals then try once again getting at least one,
+        # even if time limit was reached
+        successful_evals = individuals_evaluated + individuals_to_skip
+        self.population_evaluation_info(evaluated_pop_size=len(successful_evals),
+                                        pop_size=len(individuals))
+        if not successful_evals:
+            successful_evals = self._evaluate_any_without_time_limit(individuals)
+        return successful_evals
+
+    def _reset_pool(self):
+        # evaluations in the stopped pool will never finish
+        self._in_flight = {}
+        self._batch_duplicates = {}
+        super()._reset_pool()
+
+    def __getstate__(self):
+        # pending evaluations are not sent to the workers with `evaluate_single`
+        state = super().__getstate__()
+        state['_in_flight'] = {}
+        return state
@@ -1,9 +1,9 @@
 import itertools
-from copy import deepcopy
 from typing import Any, List, Tuple, Optional
 
 from golem.core.dag.graph_node import descriptive_id_recursive_nodes
 from golem.core.dag.graph_utils import distance_to_primary_level
+from golem.core.dag.linked_graph import clone_nodes
 
 
 def equivalent_subtree(graph_first: Any, graph_second: Any, with_primary_nodes: bool = False) \
@@ -39,7 +39,7 @@ def equivalent_subtree(graph_first: Any, graph_second: Any, with_primary_nodes:
 
 def replace_subtrees(graph_first: Any, graph_second: Any, node_from_first: Any, node_from_second: Any,
                      layer_in_first: int, layer_in_second: int, max_depth: int):
-    node_from_graph_first_copy = deepcopy(node_from_first)
+    node_from_graph_first_copy = clone_nodes([node_from_first])[0]
 
     summary_depth = layer_in_first + distance_to_primary_level(node_from_second) + 1
     if summary_depth <= max_depth and summary_depth != 0:
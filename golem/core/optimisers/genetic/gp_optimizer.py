@@ -4,6 +4,7 @@ from typing import Sequence, Union, Any
 
 from golem.core.constants import MAX_GRAPH_GEN_ATTEMPTS
 from golem.core.dag.graph import Graph
+from golem.core.optimisers.genetic.evaluation import AsyncDispatcher
 from golem.core.optimisers.genetic.gp_params import GPAlgorithmParameters
 from golem.core.optimisers.genetic.operators.crossover import Crossover
 from golem.core.optimisers.genetic.operators.elitism import Elitism
@@ -47,7 +48,8 @@ class EvoGraphOptimizer(PopulationalOptimizer):
         self.elitism = Elitism(graph_optimizer_params)
         self.operators = [self.regularization, self.selection, self.crossover,
                           self.mutation, self.inheritance, self.elitism]
-        self.reproducer = ReproductionController(graph_optimizer_params, self.selection, self.mutation, self.crossover)
+        self.reproducer = ReproductionController(graph_optimizer_params, self.selection, self.mutation, self.crossover,
+                                                 dispatcher=self.eval_dispatcher)
 
         # Define adaptive parameters
         self._pop_size: PopulationSize = init_adaptive_pop_size(graph_optimizer_params, self.generations)
@@ -112,7 +114,12 @@ class EvoGraphOptimizer(PopulationalOptimizer):
         # Regularize previous population
         individuals_to_select = self.regularization(self.population, evaluator)
         # Reproduce from previous pop to get next population
-        new_population = self.reproducer.reproduce(individuals_to_select, evaluator)
+        if isinstance(self.eval_dispatcher, AsyncDispatcher) and self.requirements.parallelization_mode == 'streaming':
+            new_population = self.reproducer.reproduce_streaming(individuals_to_select, self.eval_dispatcher)
+        elif isinstance(self.eval_dispatcher, AsyncDispatcher):
+            new_population = self.reproducer.reproduce_steady_state(individuals_to_select, self.eval_dispatcher)
+        else:
+            new_population = self.reproducer.reproduce(individuals_to_select, evaluator)
 
         # Adaptive agent experience collection & learning
         # Must be called after reproduction (that collects the new experience)
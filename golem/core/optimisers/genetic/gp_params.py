@@ -28,6 +28,18 @@ class GPAlgorithmParameters(AlgorithmParameters):
 
     Used in `ReproductionController` to compensate for invalid individuals. See the class for details.
 
+    :param filter_evaluated_duplicates: flag to drop new individuals with the graphs that are structurally
+        identical to the graphs successfully evaluated during the run, before their evaluation.
+
+    Dropped individuals are replaced with fresh offspring by `ReproductionController`.
+    To reuse the fitness of such graphs instead, use the fitness cache (see `GraphRequirements.fitness_cache_size`).
+
+    :param parallel_reproduction: flag to apply crossover & mutation (with verification of new graphs)
+        in the worker processes of the evaluation dispatcher instead of the main process.
+
+    Useful when the custom mutations or the verification rules are expensive.
+    Each pair of parents gets its own random seed, so the offspring doesn't depend on the number of workers.
+
     :param adaptive_mutation_type: Experimental feature! Enables adaptive Mutation agent.
     :param context_agent_type: Experimental feature! Enables graph encoding for Mutation agent.
 
@@ -79,6 +91,8 @@ class GPAlgorithmParameters(AlgorithmParameters):
     mutation_strength: MutationStrengthEnum = MutationStrengthEnum.mean
     min_pop_size_with_elitism: int = 5
     required_valid_ratio: float = 0.9
+    filter_evaluated_duplicates: bool = False
+    parallel_reproduction: bool = False
 
     adaptive_mutation_type: MutationAgentTypeEnum = MutationAgentTypeEnum.default
     context_agent_type: Union[ContextAgentTypeEnum, Callable] = ContextAgentTypeEnum.nodes_num
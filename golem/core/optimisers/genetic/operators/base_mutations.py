@@ -1,4 +1,3 @@
-from copy import deepcopy
 from functools import partial
 from random import choice, randint, random, sample, shuffle
 from typing import TYPE_CHECKING, Optional
@@ -8,7 +7,7 @@ import numpy as np
 from golem.core.adapter import register_native
 from golem.core.dag.graph import ReconnectType
 from golem.core.dag.graph_node import GraphNode
-from golem.core.dag.graph_utils import distance_to_root_level, distance_to_primary_level, graph_has_cycle
+from golem.core.dag.graph_utils import distance_to_root_level, distance_to_primary_level
 from golem.core.optimisers.advisor import RemoveType
 from golem.core.optimisers.graph import OptGraph, OptNode
 from golem.core.optimisers.opt_node_factory import OptNodeFactory
@@ -128,7 +127,7 @@ def single_edge_mutation(graph: OptGraph,
 
         source_node, target_node = sample(graph.nodes, 2)
         if source_node not in target_node.nodes_from:
-            if graph_has_cycle(graph):
+            if graph.has_cycle:
                 graph.connect_nodes(source_node, target_node)
                 break
             else:
@@ -219,7 +218,7 @@ def single_add_mutation(graph: OptGraph,
         # add mutation is not possible
         return graph
 
-    new_graph = deepcopy(graph)
+    new_graph = graph.clone()
     single_add_strategies = [add_as_child, add_separate_parent_node, add_intermediate_node]
     shuffle(single_add_strategies)
     for strategy in single_add_strategies:
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from random import random
 from typing import Callable, Union, Tuple, TYPE_CHECKING, Mapping, Hashable, Optional
 
@@ -98,7 +97,7 @@ class Mutation(Operator):
         is_applied = self._will_mutation_be_applied(mutation_type)
         if is_applied:
             for _ in range(self.parameters.max_num_of_operator_attempts):
-                new_graph = deepcopy(individual.graph)
+                new_graph = individual.graph.clone()
 
                 new_graph = self._apply_mutations(new_graph, mutation_type)
                 is_correct_graph = self.graph_generation_params.verifier(new_graph)
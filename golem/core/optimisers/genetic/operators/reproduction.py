@@ -1,17 +1,64 @@
-from typing import Optional
+import random
+from collections import OrderedDict
+from copy import copy
+from itertools import islice
+from math import ceil
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, TYPE_CHECKING
 
 import numpy as np
 
 from golem.core.constants import MIN_POP_SIZE, EVALUATION_ATTEMPTS_NUMBER
 from golem.core.log import default_log
+from golem.core.optimisers.adaptive.common_types import ActType
+from golem.core.optimisers.adaptive.experience_buffer import ExperienceBuffer
 from golem.core.optimisers.genetic.gp_params import GPAlgorithmParameters
 from golem.core.optimisers.genetic.operators.crossover import Crossover
 from golem.core.optimisers.genetic.operators.mutation import Mutation
 from golem.core.optimisers.genetic.operators.operator import PopulationT, EvaluationOperator
 from golem.core.optimisers.genetic.operators.selection import Selection
+from golem.core.optimisers.opt_history_objects.individual import Individual
 from golem.core.optimisers.populational_optimizer import EvaluationAttemptsError
 from golem.utilities.data_structures import ensure_wrapped_in_sequence
 
+if TYPE_CHECKING:
+    from golem.core.optimisers.genetic.evaluation import AsyncDispatcher, BaseGraphEvaluationDispatcher
+
+VariationExperience = Tuple[List[Individual], List[ActType], List[float]]
+
+
+def _vary_in_worker(crossover: Crossover, mutation: Mutation,
+                    pairs: Sequence[Tuple[Individual, Individual]],
+                    seeds: Sequence[int]) -> Tuple[PopulationT, VariationExperience]:
+    """Applies crossover & mutation to each pair of parents with its own random seed,
+    so the offspring doesn't depend on the distribution of the pairs between the workers.
+    Returns the offspring and the experience collected by the mutation agent."""
+    random_state, np_random_state = random.getstate(), np.random.get_state()
+    # the experience of this task is collected separately from the experience of the original operator
+    mutation = copy(mutation)
+    mutation.agent_experience = ExperienceBuffer(window_size=mutation.agent_experience.window_size)
+    offspring = []
+    try:
+        for pair, seed in zip(pairs, seeds):
+            random.seed(seed)
+            np.random.seed(seed)
+            offspring.extend(ensure_wrapped_in_sequence(mutation(crossover(list(pair)))))
+    finally:
+        # the state of the main process isn't changed if the pool executes tasks in it
+        random.setstate(random_state)
+        np.random.set_state(np_random_state)
+    return offspring, mutation.agent_experience.retrieve_experience(as_graphs=False)
+
+
+def _restore_parents(individual: Individual, parents: Dict[str, Individual]) -> Individual:
+    """Replaces copies of the parents that came from the worker with the original individuals."""
+    if individual.uid in parents:
+        return parents[individual.uid]
+    if individual.parent_operator is not None:
+        restored = tuple(_restore_parents(parent, parents)
+                         for parent in individual.parent_operator.parent_individuals)
+        object.__setattr__(individual.parent_operator, 'parent_individuals', restored)
+    return individual
+
 
 class ReproductionController:
     """
@@ -32,12 +79,21 @@ class ReproductionController:
     Then we request 62, then approximately 62*0.8~=50 of them are valid in the end,
     and we achieve target size more reliably. This runs in a loop to control stochasticity.
 
+    If ``parameters.filter_evaluated_duplicates`` is enabled, then new individuals with the graphs
+    that are structurally identical to the ones successfully evaluated during the run
+    (or produced earlier in the same reproduction) are dropped before evaluation,
+    and the controller compensates them with fresh offspring.
+
     Args:
         parameters: genetic algorithm parameters.
         selection: operator used in reproduction.
         mutation: operator used in reproduction.
         crossover: operator used in reproduction.
         window_size: size in iterations of the moving window to compute reproduction success rate.
+        dispatcher: evaluation dispatcher whose workers apply crossover & mutation
+         if ``parameters.parallel_reproduction`` is enabled.
+        max_evaluated_structures: max number of the least recently evaluated structures
+         that are remembered to filter evaluated duplicates.
     """
 
     def __init__(self,
@@ -46,11 +102,17 @@ class ReproductionController:
                  mutation: Mutation,
                  crossover: Crossover,
                  window_size: int = 10,
+                 dispatcher: Optional['BaseGraphEvaluationDispatcher'] = None,
+                 max_evaluated_structures: int = 10_000,
                  ):
         self.parameters = parameters
         self.selection = selection
         self.mutation = mutation
         self.crossover = crossover
+        self.dispatcher = dispatcher
+        # structural hashes of the graphs that were successfully evaluated during the run
+        self.max_evaluated_structures = max_evaluated_structures
+        self._evaluated_structures: 'OrderedDict[str, None]' = OrderedDict()
 
         self._minimum_valid_ratio = parameters.required_valid_ratio * 0.5
         self._window_size = window_size
@@ -65,6 +127,90 @@ class ReproductionController:
         Computed as average fraction for the last N iterations (N = window size param)"""
         return float(np.mean(self._success_rate_window))
 
+    def produce_offspring(self, population: PopulationT, pop_size: Optional[int] = None) -> PopulationT:
+        """Reproduces population (select, crossover, mutate) without evaluation."""
+        selected_individuals = self.selection(population, pop_size)
+        if self.parameters.parallel_reproduction and self.dispatcher is not None and len(selected_individuals) > 1:
+            return self._vary_in_workers(selected_individuals)
+        new_population = self.crossover(selected_individuals)
+        new_population = ensure_wrapped_in_sequence(self.mutation(new_population))
+        return new_population
+
+    def filter_evaluated_duplicates(self, individuals: Iterable[Individual],
+                                    produced_structures: Optional[Set[str]] = None) -> Iterator[Individual]:
+        """Lazily drops individuals that require evaluation of the graphs structurally identical
+        to the ones successfully evaluated during the run or produced earlier in the same reproduction.
+
+        Args:
+            individuals: new individuals.
+            produced_structures: structures of the individuals produced earlier in the same reproduction,
+             it's updated with the structures of the passed individuals.
+             If None, the passed individuals are checked only against each other.
+        """
+        if produced_structures is None:
+            produced_structures = set()
+        for ind in individuals:
+            if self.parameters.filter_evaluated_duplicates and not ind.fitness.valid:
+                structure = ind.graph.structural_hash
+                if structure in self._evaluated_structures:
+                    self._evaluated_structures.move_to_end(structure)
+                    continue
+                if structure in produced_structures:
+                    continue
+                produced_structures.add(structure)
+            yield ind
+
+    def _remember_evaluated(self, population: PopulationT):
+        """Remembers structures of the successfully evaluated individuals, keeps the most recent ones."""
+        if self.parameters.filter_evaluated_duplicates:
+            for ind in population:
+                structure = ind.graph.structural_hash
+                self._evaluated_structures[structure] = None
+                self._evaluated_structures.move_to_end(structure)
+            while len(self._evaluated_structures) > self.max_evaluated_structures:
+                self._evaluated_structures.popitem(last=False)
+
+    def stream_offspring(self, population: PopulationT, max_parents_num: int) -> Iterator[Individual]:
+        """Lazily reproduces population (select, crossover, mutate) without evaluation.
+
+        Parents are selected in batches, but crossover & mutation are applied
+        to the next pair of parents only when its offspring is requested.
+
+        Args:
+            population: individuals to select the parents from.
+            max_parents_num: max number of parents to use, limits the stream
+             in case the operators can't produce new individuals.
+        """
+        parents_num = 0
+        while parents_num < max_parents_num:
+            selected_individuals = self.selection(population, min(len(population), self.parameters.pop_size))
+            if len(selected_individuals) > 1:
+                parents_groups = self.crossover.crossover_parents_selection(selected_individuals)
+            else:
+                parents_groups = [selected_individuals]
+            for parents in parents_groups:
+                if parents_num >= max_parents_num:
+                    return
+                parents_num += len(parents)
+                yield from ensure_wrapped_in_sequence(self.mutation(self.crossover(list(parents))))
+
+    def _vary_in_workers(self, selected_individuals: PopulationT) -> PopulationT:
+        """Applies crossover & mutation in the workers of the dispatcher.
+        Pairs of parents are the same as in the sequential crossover, each pair gets its own random seed."""
+        pairs = list(self.crossover.crossover_parents_selection(selected_individuals))
+        seeds = [random.getrandbits(32) for _ in pairs]
+        chunk_size = ceil(len(pairs) / min(len(pairs), self.dispatcher.n_workers))
+        tasks = [(self.crossover, self.mutation, pairs[i:i + chunk_size], seeds[i:i + chunk_size])
+                 for i in range(0, len(pairs), chunk_size)]
+        parents = {ind.uid: ind for ind in selected_individuals}
+
+        new_population = []
+        for offspring, experience in self.dispatcher.map_in_workers(_vary_in_worker, tasks):
+            new_population.extend(_restore_parents(ind, parents) for ind in offspring)
+            for obs, action, reward in zip(*experience):
+                self.mutation.agent_experience.collect_experience(_restore_parents(obs, parents), action, reward)
+        return new_population
+
     def reproduce_uncontrolled(self,
                                population: PopulationT,
                                evaluator: EvaluationOperator,
@@ -79,10 +225,10 @@ class ReproductionController:
 
         # TODO: it can't choose more than len(population)!
         #  It can be faster if it could.
-        selected_individuals = self.selection(population, pop_size)
-        new_population = self.crossover(selected_individuals)
-        new_population = ensure_wrapped_in_sequence(self.mutation(new_population))
+        new_population = self.produce_offspring(population, pop_size)
+        new_population = list(self.filter_evaluated_duplicates(new_population))
         new_population = evaluator(new_population)
+        self._remember_evaluated(new_population)
         return new_population
 
     def reproduce(self,
@@ -95,6 +241,7 @@ class ReproductionController:
         """
         total_target_size = self.parameters.pop_size  # next population size
         collected_next_population = {}
+        self._remember_evaluated(population)
         for i in range(EVALUATION_ATTEMPTS_NUMBER):
             # Estimate how many individuals we need to complete new population
             # based on average success rate of valid results
@@ -132,3 +279,129 @@ class ReproductionController:
             else:
                 raise EvaluationAttemptsError('Could not collect valid individuals'
                                               ' for next population.' + helpful_msg)
+
+    def reproduce_streaming(self,
+                            population: PopulationT,
+                            dispatcher: 'AsyncDispatcher'
+                            ) -> PopulationT:
+        """Reproduces and evaluates population with streaming of the offspring to the evaluation.
+
+        Offspring is produced lazily and is sent to the free evaluation slots of the dispatcher
+        as soon as it's created. Reproduction stops when the required number of valid individuals
+        (``pop_size * required_valid_ratio``) is collected instead of overshooting in whole batches.
+        Unlike the steady-state reproduction, new parents are selected only from the given population.
+        Evaluations that are still running when the population is complete are not cancelled:
+        they are collected on the next call and join the next population,
+        although they were produced from the parents of the previous call.
+        """
+        self._remember_evaluated(population)
+        offspring = self.stream_offspring(population,
+                                          max_parents_num=self.parameters.pop_size * EVALUATION_ATTEMPTS_NUMBER)
+        offspring = self.filter_evaluated_duplicates(offspring)
+
+        def offspring_source(size: int, collected_population: PopulationT) -> Optional[PopulationT]:
+            return list(islice(offspring, size)) or None
+
+        return self._reproduce_with_dispatcher(dispatcher, offspring_source,
+                                               required_size=self.parameters.pop_size *
+                                               self.parameters.required_valid_ratio,
+                                               reproduction_name='Streaming')
+
+    def reproduce_steady_state(self,
+                               population: PopulationT,
+                               dispatcher: 'AsyncDispatcher'
+                               ) -> PopulationT:
+        """Reproduces and evaluates population in steady-state manner.
+
+        Instead of reproducing the whole population at once and waiting for all of it to be evaluated,
+        new individuals are reproduced as soon as evaluation slots of the dispatcher free up.
+        Evaluated individuals immediately join the pool of individuals used for selection.
+        Evaluations that are still running when the population is complete are not cancelled:
+        they are collected on the next call and join the next population,
+        although they were produced from the parents of the previous call.
+        """
+        self._remember_evaluated(population)
+        max_parents_num = self.parameters.pop_size * EVALUATION_ATTEMPTS_NUMBER
+        # Offspring is produced in chunks even if a single slot is free, so that crossover gets pairs of parents.
+        # The surplus is kept for the next free slots.
+        chunk_size = max(2, dispatcher.max_in_flight)
+        parents_num = 0
+        buffered_offspring: List[Individual] = []
+        produced_structures: Set[str] = set()
+
+        def offspring_source(size: int, collected_population: PopulationT) -> Optional[PopulationT]:
+            nonlocal parents_num
+            # attempts are counted by the selected parents, so the loop ends even if all offspring is dropped
+            while len(buffered_offspring) < size and parents_num < max_parents_num:
+                parents_pool = list(population) + collected_population
+                selected_num = min(chunk_size, len(parents_pool))
+                parents_num += selected_num
+                offspring = self.produce_offspring(parents_pool, selected_num)
+                buffered_offspring.extend(self.filter_evaluated_duplicates(offspring, produced_structures))
+            if not buffered_offspring:
+                return None
+            new_individuals = buffered_offspring[:size]
+            del buffered_offspring[:size]
+            return new_individuals
+
+        return self._reproduce_with_dispatcher(dispatcher, offspring_source,
+                                               required_size=self.parameters.pop_size,
+                                               reproduction_name='Steady-state')
+
+    def _reproduce_with_dispatcher(self,
+                                   dispatcher: 'AsyncDispatcher',
+                                   offspring_source: Callable[[int, PopulationT], Optional[PopulationT]],
+                                   required_size: float,
+                                   reproduction_name: str
+                                   ) -> PopulationT:
+        """Fills free evaluation slots of the dispatcher with new individuals
+        and collects evaluated ones until the required number of valid individuals is collected.
+
+        Args:
+            dispatcher: dispatcher that evaluates individuals asynchronously.
+            offspring_source: returns new individuals for the given number of free slots
+             and the individuals collected so far, or None if no more individuals can be produced.
+            required_size: number of valid individuals that completes the population.
+            reproduction_name: name of the reproduction for logging.
+        """
+        total_target_size = self.parameters.pop_size  # next population size
+        collected_next_population = {}
+        is_offspring_exhausted = False
+        offspring_num = 0
+        finished_num = 0
+        evaluated_num = 0
+        while len(collected_next_population) < required_size:
+            # Fill free evaluation slots with new individuals
+            free_slots = dispatcher.max_in_flight - dispatcher.num_in_flight
+            if free_slots > 0 and not is_offspring_exhausted:
+                new_individuals = offspring_source(free_slots, list(collected_next_population.values()))
+                if new_individuals is None:
+                    is_offspring_exhausted = True
+                    continue
+                offspring_num += len(new_individuals)
+                not_evaluated = dispatcher.submit(new_individuals)
+                self._remember_evaluated(not_evaluated)
+                collected_next_population.update({ind.uid: ind for ind in not_evaluated})
+                continue
+            elif dispatcher.num_in_flight == 0:
+                break
+
+            in_flight_num = dispatcher.num_in_flight
+            evaluated = dispatcher.collect()
+            finished_num += in_flight_num - dispatcher.num_in_flight
+            evaluated_num += len(evaluated)
+            self._remember_evaluated(evaluated)
+            collected_next_population.update({ind.uid: ind for ind in evaluated})
+
+        # Keep running average of evaluation success rate (if sample is big enough)
+        if finished_num >= MIN_POP_SIZE:
+            self._success_rate_window = np.roll(self._success_rate_window, shift=1)
+            self._success_rate_window[0] = evaluated_num / finished_num
+
+        if len(collected_next_population) >= total_target_size * self._minimum_valid_ratio:
+            self._log.info(f'{reproduction_name} reproduction achieved pop size {len(collected_next_population)}'
+                           f' using {offspring_num} offspring with success rate {self.mean_success_rate:.3f}')
+            return list(collected_next_population.values())[:total_target_size]
+        raise EvaluationAttemptsError('Could not collect valid individuals for next population. '
+                                      'Check objective, constraints and evo operators. '
+                                      'Possibly they return too few valid individuals.')
@@ -4,6 +4,10 @@ from copy import copy
 from random import choice, randint, sample
 from typing import Callable, List, Optional
 
+import numpy as np
+
+from golem.core.optimisers.fitness.non_dominated_sorting import crowding_distance, dominance_matrix, \
+    fast_non_dominated_sort, get_fitness_matrix
 from golem.core.optimisers.genetic.operators.operator import PopulationT, Operator
 from golem.utilities.data_structures import ComparableEnum as Enum
 
@@ -11,6 +15,7 @@ from golem.utilities.data_structures import ComparableEnum as Enum
 class SelectionTypesEnum(Enum):
     tournament = 'tournament'
     spea2 = 'spea2'
+    nsga2 = 'nsga2'
 
 
 class Selection(Operator):
@@ -29,7 +34,8 @@ class Selection(Operator):
     def _selection_by_type(selection_type: SelectionTypesEnum) -> Callable[[PopulationT, int], PopulationT]:
         selections = {
             SelectionTypesEnum.tournament: tournament_selection,
-            SelectionTypesEnum.spea2: spea2_selection
+            SelectionTypesEnum.spea2: spea2_selection,
+            SelectionTypesEnum.nsga2: nsga2_selection,
         }
         if selection_type in selections:
             return selections[selection_type]
@@ -64,23 +70,79 @@ def default_selection_behaviour(selection_func: Optional[Callable] = None, *, en
 
 
 @default_selection_behaviour
-def tournament_selection(individuals: PopulationT, pop_size: int, fraction: float = 0.1) -> PopulationT:
+def tournament_selection(individuals: PopulationT, pop_size: int, fraction: float = 0.1,
+                         batched: bool = False, replace: bool = False) -> PopulationT:
     """ Having the size of *individuals* equals to *n* will have no effect other
-    than lax ordering of *individuals*. """
-    individuals = list(individuals)  # don't modify original
+    than lax ordering of *individuals*.
+
+    Fitnesses are compared only once to get their ranks, tournaments compare the ranks.
+
+    :param individuals: A list of individuals to select from.
+    :param pop_size: Number of individuals to select.
+    :param fraction: Size of each tournament relative to the number of individuals.
+    :param batched: If True, then all tournaments of a round are drawn at once,
+        members of the batched tournaments are drawn independently (so they can repeat).
+        Otherwise, tournaments are drawn one by one from distinct individuals.
+    :param replace: If True, then the same individual can win several tournaments,
+        so all tournaments are drawn in one batch. Otherwise, winners are excluded from the next tournaments.
+    :returns: A list of selected individuals
+    """
     group_size = math.ceil(len(individuals) * fraction)
     min_group_size = min(2, len(individuals))
     group_size = max(group_size, min_group_size)
-    chosen = []
-    iterations_limit = pop_size * 10
-    for _ in range(iterations_limit):
-        if len(chosen) >= pop_size:
-            break
-        group = sample(individuals, min(group_size, len(individuals)))
-        best = max(group, key=lambda ind: ind.fitness)
-        individuals.remove(best)
-        chosen.append(best)
-    return chosen
+    ranks = _fitness_ranks(individuals)
+    if replace:
+        chosen_indices = _batched_tournaments(ranks, np.arange(len(individuals)), pop_size, group_size)
+    elif batched:
+        chosen_indices = _batched_tournaments_without_replacement(ranks, pop_size, group_size)
+    else:
+        chosen_indices = _tournaments_without_replacement(ranks, pop_size, group_size)
+    return [individuals[i] for i in chosen_indices]
+
+
+def _fitness_ranks(individuals: PopulationT) -> np.ndarray:
+    """Returns ranks of the individuals by their fitness (better fitness has greater rank, equal ones have equal)."""
+    order = sorted(range(len(individuals)), key=lambda i: individuals[i].fitness)
+    ranks = np.zeros(len(individuals), dtype=int)
+    rank = 0
+    for prev_idx, idx in zip(order, order[1:]):
+        if individuals[idx].fitness != individuals[prev_idx].fitness:
+            rank += 1
+        ranks[idx] = rank
+    return ranks
+
+
+def _tournaments_without_replacement(ranks: np.ndarray, pop_size: int, group_size: int) -> List[int]:
+    # individuals that can take part in the tournaments are kept in the beginning of the pool
+    pool = np.arange(len(ranks))
+    pool_size = len(pool)
+    chosen_indices = []
+    for _ in range(pop_size):
+        group_positions = np.array(sample(range(pool_size), min(group_size, pool_size)))
+        best_position = group_positions[np.argmax(ranks[pool[group_positions]])]
+        chosen_indices.append(pool[best_position])
+        pool_size -= 1
+        pool[best_position] = pool[pool_size]
+    return chosen_indices
+
+
+def _batched_tournaments_without_replacement(ranks: np.ndarray, pop_size: int, group_size: int) -> List[int]:
+    chosen_indices = []
+    is_available = np.ones(len(ranks), dtype=bool)
+    while len(chosen_indices) < pop_size:
+        pool = np.flatnonzero(is_available)
+        winners = _batched_tournaments(ranks, pool, pop_size - len(chosen_indices), min(group_size, len(pool)))
+        # only the first win of each individual counts, the rest tournaments are drawn again in the next round
+        _, first_wins = np.unique(winners, return_index=True)
+        winners = winners[np.sort(first_wins)]
+        chosen_indices.extend(winners.tolist())
+        is_available[winners] = False
+    return chosen_indices
+
+
+def _batched_tournaments(ranks: np.ndarray, pool: np.ndarray, tournaments_num: int, group_size: int) -> np.ndarray:
+    groups = pool[np.random.randint(0, len(pool), size=(tournaments_num, group_size))]
+    return groups[np.arange(tournaments_num), np.argmax(ranks[groups], axis=1)]
 
 
 @default_selection_behaviour
@@ -88,7 +150,6 @@ def random_selection(individuals: PopulationT, pop_size: int) -> PopulationT:
     return sample(individuals, pop_size)
 
 
-# Code of spea2 selection is modified part of DEAP library (Library URL: https://github.com/DEAP/deap).
 @default_selection_behaviour
 def spea2_selection(individuals: PopulationT, pop_size: int) -> PopulationT:
     """
@@ -99,9 +160,122 @@ def spea2_selection(individuals: PopulationT, pop_size: int) -> PopulationT:
     than sorting the population according to a strength Pareto scheme. The
     list returned contains references to the input *individuals*.
 
+    Multi-objective fitnesses are processed as a matrix with vectorized operations,
+    other fitnesses are processed one by one with the same result.
+
     :param individuals: A list of individuals to select from.
     :returns: A list of selected individuals
     """
+    fitness_matrix = get_fitness_matrix(individuals)
+    if fitness_matrix is None:
+        return _spea2_selection_loop(individuals, pop_size)
+    return [individuals[i] for i in spea2_select_indices(fitness_matrix, pop_size)]
+
+
+def spea2_select_indices(fitness_matrix: np.ndarray, pop_size: int) -> List[int]:
+    """
+    Vectorized SPEA-II selection over the matrix of weighted fitness values
+    (individuals x objectives, less is better). Selects the same individuals in the same order
+    as the original algorithm from DEAP library.
+
+    :param fitness_matrix: weighted fitness values of the individuals.
+    :param pop_size: number of individuals to select.
+    :returns: indices of the selected individuals.
+    """
+    inds_len = len(fitness_matrix)
+    dominates = dominance_matrix(fitness_matrix)
+    strength_fits = dominates.sum(axis=1)
+    fits = (dominates * strength_fits[:, None]).sum(axis=0).astype(float)
+
+    # Choose all non-dominated individuals
+    chosen_indices = np.flatnonzero(fits < 1)
+
+    if len(chosen_indices) < pop_size:  # The archive is too small
+        # distances to the individuals that precede the current one are left zero as in the original algorithm
+        distances = np.triu(_squared_distances(fitness_matrix), 1)
+        kth_dist = np.partition(distances, int(math.sqrt(inds_len)), axis=1)[:, int(math.sqrt(inds_len))]
+        fits += 1.0 / (kth_dist + 2.0)
+
+        not_chosen = np.setdiff1d(np.arange(inds_len), chosen_indices)
+        next_indices = not_chosen[np.argsort(fits[not_chosen], kind='stable')]
+        chosen_indices = np.concatenate([chosen_indices, next_indices[:pop_size - len(chosen_indices)]])
+
+    elif len(chosen_indices) > pop_size:  # The archive is too large
+        chosen_indices = chosen_indices[_truncate_archive(fitness_matrix[chosen_indices], pop_size)]
+
+    return chosen_indices.tolist()
+
+
+@default_selection_behaviour
+def nsga2_selection(individuals: PopulationT, pop_size: int) -> PopulationT:
+    """
+    Apply NSGA-II selection operator on the *individuals*: individuals are taken front by front
+    starting from the non-dominated one, the last front that doesn't fit entirely is truncated
+    by the crowding distance (individuals from the less crowded regions are preferred).
+    Individuals without multi-objective fitness are selected by their fitness.
+
+    :param individuals: A list of individuals to select from.
+    :param pop_size: Number of individuals to select.
+    :returns: A list of selected individuals
+    """
+    fitness_matrix = get_fitness_matrix(individuals)
+    if fitness_matrix is None:
+        return sorted(individuals, key=lambda ind: ind.fitness, reverse=True)[:pop_size]
+    return [individuals[i] for i in nsga2_select_indices(fitness_matrix, pop_size)]
+
+
+def nsga2_select_indices(fitness_matrix: np.ndarray, pop_size: int) -> List[int]:
+    """
+    NSGA-II selection over the matrix of weighted fitness values (individuals x objectives, less is better).
+
+    :param fitness_matrix: weighted fitness values of the individuals.
+    :param pop_size: number of individuals to select.
+    :returns: indices of the selected individuals.
+    """
+    chosen_indices = []
+    for front in fast_non_dominated_sort(fitness_matrix):
+        left_size = pop_size - len(chosen_indices)
+        if len(front) > left_size:
+            distances = crowding_distance(fitness_matrix[front])
+            chosen_indices.extend(front[np.argsort(-distances, kind='stable')[:left_size]].tolist())
+            break
+        chosen_indices.extend(front.tolist())
+    return chosen_indices
+
+
+def _squared_distances(fitness_matrix: np.ndarray) -> np.ndarray:
+    distances = np.zeros((len(fitness_matrix), len(fitness_matrix)))
+    # objectives are summed one by one to get exactly the same values as in the original algorithm
+    for objective_values in fitness_matrix.T:
+        diff = objective_values[:, None] - objective_values[None, :]
+        distances += diff * diff
+    return distances
+
+
+def _truncate_archive(fitness_matrix: np.ndarray, pop_size: int) -> np.ndarray:
+    """Iteratively removes the individual that has the lexicographically smallest sorted distances
+    to the other individuals until ``pop_size`` individuals are left. Returns indices of the left ones."""
+    distances = _squared_distances(fitness_matrix)
+    np.fill_diagonal(distances, -1)
+    # neighbours of each individual sorted by the distance (ties are resolved by the index), without itself
+    neighbours = np.argsort(distances, axis=1, kind='stable')[:, 1:]
+    neighbour_distances = np.take_along_axis(distances, neighbours, axis=1)
+    left_indices = np.arange(len(fitness_matrix))
+    while len(left_indices) > pop_size:
+        # lexsort is stable, so the first of the equal individuals is chosen
+        min_pos = np.lexsort(neighbour_distances.T[::-1])[0]
+        removed = left_indices[min_pos]
+        left_indices = np.delete(left_indices, min_pos)
+        neighbours = np.delete(neighbours, min_pos, axis=0)
+        neighbour_distances = np.delete(neighbour_distances, min_pos, axis=0)
+        is_left = neighbours != removed
+        neighbours = neighbours[is_left].reshape(len(left_indices), -1)
+        neighbour_distances = neighbour_distances[is_left].reshape(len(left_indices), -1)
+    return left_indices
+
+
+# Code of spea2 selection is modified part of DEAP library (Library URL: https://github.com/DEAP/deap).
+def _spea2_selection_loop(individuals: PopulationT, pop_size: int) -> PopulationT:
     inds_len = len(individuals)
     fitness_len = len(individuals[0].fitness.values)
     inds_len_sqrt = math.sqrt(inds_len)
@@ -1,5 +1,6 @@
 import numpy as np
 
+from golem.core.optimisers.fitness import PopulationFitness
 from golem.core.optimisers.genetic.operators.operator import PopulationT
 from golem.core.optimisers.genetic.parameters.parameter import AdaptiveParameter
 
@@ -33,4 +34,4 @@ class AdaptiveMutationProb(AdaptiveParameter[float]):
 
     @staticmethod
     def _calc_std(population: PopulationT) -> float:
-        return float(np.std([ind.fitness.value for ind in population]))
+        return float(np.std(PopulationFitness.of(population).objective_values(0)))
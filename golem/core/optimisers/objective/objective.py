@@ -1,7 +1,7 @@
 import itertools
 from dataclasses import dataclass
 from numbers import Real
-from typing import Any, Optional, Callable, Sequence, TypeVar, Dict, Tuple, Union
+from typing import Any, Optional, Callable, Sequence, TypeVar, Dict, Tuple, Union, List
 
 from golem.core.dag.graph import Graph
 from golem.core.log import default_log
@@ -35,7 +35,11 @@ class ObjectiveInfo:
 
 class Objective(ObjectiveInfo, ObjectiveFunction):
     """Represents objective function for computing metric values
-    on Graphs and keeps information about metrics used."""
+    on Graphs and keeps information about metrics used.
+
+    Metric can additionally provide method ``evaluate_batch(graphs, **metrics_kwargs)``
+    that computes metric values for the sequence of graphs at once (e.g. vectorized with NumPy).
+    Such metrics are used by :meth:`evaluate_batch`."""
 
     def __init__(self,
                  quality_metrics: Union[Callable, Dict[Any, Callable]],
@@ -61,6 +65,44 @@ class Objective(ObjectiveInfo, ObjectiveFunction):
                 return null_fitness()  # fail right away
         return to_fitness(evaluated_metrics, self.is_multi_objective)
 
+    def evaluate_batch(self, graphs: Sequence[Graph], **metrics_kwargs: Any) -> List[Fitness]:
+        """Computes fitness of each graph. Metrics that support batch evaluation
+        are computed for all graphs at once, other metrics are computed for each graph separately."""
+        failed = [False] * len(graphs)
+        evaluated_metrics = [[] for _ in graphs]
+        for metric_id, metric_func in self.metrics:
+            metric_values = None
+            batch_func = getattr(metric_func, 'evaluate_batch', None)
+            if batch_func is not None:
+                try:
+                    metric_values = list(batch_func(graphs, **metrics_kwargs))
+                except Exception as ex:
+                    self._log.error(f'Objective batch evaluation error on metric {metric_id}: {ex}. '
+                                    f'Evaluating graphs separately.')
+            if metric_values is None:
+                metric_values = [self._evaluate_metric(metric_id, metric_func, graph, **metrics_kwargs)
+                                 if not failed[i] else None
+                                 for i, graph in enumerate(graphs)]
+            for i, metric_value in enumerate(metric_values):
+                if metric_value is None:
+                    failed[i] = True
+                evaluated_metrics[i].append(metric_value)
+        return [null_fitness() if is_failed else to_fitness(metric_values, self.is_multi_objective)
+                for is_failed, metric_values in zip(failed, evaluated_metrics)]
+
+    @property
+    def supports_batch_evaluation(self) -> bool:
+        """True if some of the metrics can be computed for the sequence of graphs at once."""
+        return any(callable(getattr(metric_func, 'evaluate_batch', None)) for _, metric_func in self.metrics)
+
+    def _evaluate_metric(self, metric_id: Any, metric_func: Callable, graph: Graph,
+                         **metrics_kwargs: Any) -> Optional[Real]:
+        try:
+            return metric_func(graph, **metrics_kwargs)
+        except Exception as ex:
+            self._log.error(f'Objective evaluation error for graph {graph} on metric {metric_id}: {ex}')
+            return None
+
     @property
     def metrics(self) -> Sequence[Tuple[Any, Callable]]:
         return list(itertools.chain(self.quality_metrics.items(), self.complexity_metrics.items()))
@@ -1,5 +1,5 @@
 from abc import ABC
-from typing import TypeVar, Generic
+from typing import TypeVar, Generic, List, Sequence
 
 from golem.core.dag.graph import Graph
 from golem.core.optimisers.fitness import Fitness
@@ -44,6 +44,24 @@ class ObjectiveEvaluate(ABC, Generic[G]):
         """Evaluate graph and compute its fitness."""
         return self._objective(graph, **self._objective_kwargs)
 
+    def evaluate_batch(self, graphs: Sequence[G]) -> List[Fitness]:
+        """Evaluate graphs and compute their fitness at once.
+        If ``evaluate`` is redefined by the inheritor, then graphs are evaluated separately with it."""
+        if self._is_evaluate_redefined:
+            return [self.evaluate(graph) for graph in graphs]
+        return self._objective.evaluate_batch(graphs, **self._objective_kwargs)
+
+    @property
+    def supports_batch_evaluation(self) -> bool:
+        """True if evaluation of the sequence of graphs at once is more efficient than separate evaluations."""
+        if type(self).evaluate_batch is not ObjectiveEvaluate.evaluate_batch:
+            return True
+        return not self._is_evaluate_redefined and self._objective.supports_batch_evaluation
+
+    @property
+    def _is_evaluate_redefined(self) -> bool:
+        return type(self).evaluate is not ObjectiveEvaluate.evaluate
+
     def evaluate_intermediate_metrics(self, graph: G):
         """Compute intermediate metrics for each graph node and store it there."""
         pass
@@ -4,6 +4,7 @@ from collections import UserList
 from copy import deepcopy, copy
 from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Union
 
+from golem.core.optimisers.fitness.population_fitness import PopulationFitness
 from golem.utilities.data_structures import ensure_wrapped_in_sequence
 
 if TYPE_CHECKING:
@@ -16,6 +17,8 @@ class Generation(UserList):
     Allows to provide additional information about the generation.
     Responsible for setting generation-related info to the individuals.
     """
+    # fitness store is kept out of the instance dict, so it isn't copied or serialized with the generation
+    __slots__ = ('_fitness_store',)
 
     def __init__(self, iterable: Union[Iterable[Individual], Generation], generation_num: int,
                  label: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None):
@@ -29,6 +32,16 @@ class Generation(UserList):
         super().__setitem__(index, item)
         self._set_native_generation(item)
 
+    @property
+    def fitness_store(self) -> PopulationFitness:
+        """Fitness values of the individuals in a contiguous array.
+        The store is cached while the generation isn't modified and all its individuals are evaluated."""
+        store = getattr(self, '_fitness_store', None)
+        if store is None or not store.is_actual_for(self.data):
+            store = PopulationFitness(self.data)
+            self._fitness_store = store if store.all_valid else None
+        return store
+
     def copy(self) -> Generation:
         return copy(self)
 
@@ -47,6 +60,10 @@ class Generation(UserList):
             object.__setattr__(result, k, deepcopy(v, memo))
         return result
 
+    def __getstate__(self):
+        # don't pickle the fitness store
+        return self.__dict__
+
     def _set_native_generation(self, individuals: Union[Individual, Iterable[Individual]]):
         individuals = ensure_wrapped_in_sequence(individuals)
         for individual in individuals:
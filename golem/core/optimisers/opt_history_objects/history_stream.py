@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+import numpy as np
+
+from golem.core.optimisers.fitness.population_fitness import PopulationFitness
+from golem.core.optimisers.graph import OptGraph
+from golem.core.optimisers.objective.objective import ObjectiveInfo
+from golem.core.optimisers.opt_history_objects.generation import Generation
+from golem.core.optimisers.opt_history_objects.individual import Individual
+from golem.serializers.serializer import Serializer
+
+if TYPE_CHECKING:
+    from golem.core.optimisers.opt_history_objects.opt_history import OptHistory
+
+HISTORY_STREAM_FILE = 'history.jsonl'
+
+# Index of the generation records: byte offset of the record in the stream, number of individuals in the generation,
+# offset & number of columns of their fitness values in the flat fitness index
+GENERATIONS_INDEX_DTYPE = np.dtype([('offset', '<i8'), ('size', '<i8'),
+                                    ('fitness_offset', '<i8'), ('fitness_columns', '<i8')])
+FITNESS_INDEX_DTYPE = np.dtype('<f8')
+
+MISSING_INDIVIDUAL_METADATA = {'MISSING_INDIVIDUAL': 'This individual could not be restored from the history stream'}
+
+
+class OptHistoryStreamWriter:
+    """
+    Appends the optimization history to a single file in JSON Lines format, one line per generation.
+
+    The first line keeps the objective of the history. Each next line keeps the individuals
+    that weren't written before (including the intermediate parents) and the uids of the individuals
+    of the generation and of the archive. So every individual is serialized only once.
+
+    Next to the stream the writer appends the index files (see :func:`history_index_paths`):
+    binary index of the generation records, binary fitness values of the generations
+    and the text index of the records where each individual is written.
+    They allow to read the history lazily with :class:`OptHistoryView`.
+
+    Args:
+        file_path: path to the file of the stream, it's overwritten by the first written generation
+        objective: information about metrics of the history
+    """
+
+    def __init__(self, file_path: Union[str, os.PathLike], objective: Optional[ObjectiveInfo] = None):
+        self.file_path = Path(file_path)
+        self._objective = objective or ObjectiveInfo()
+        self._written_uids: Set[str] = set()
+        self._records_num = 0
+        self._fitness_offset = 0
+        self._started = False
+
+    def write(self, generation: Generation, archive: Sequence[Individual] = ()):
+        """Appends the generation and the archive of the best individuals to the stream."""
+        generations_index_path, fitness_index_path, uids_index_path = history_index_paths(self.file_path)
+        if not self._started:
+            self.file_path.parent.mkdir(parents=True, exist_ok=True)
+            header = {'objective': ObjectiveInfo(self._objective.is_multi_objective,
+                                                 list(self._objective.metric_names))}
+            self._write_lines([header], mode='w')
+            for index_path in (generations_index_path, fitness_index_path, uids_index_path):
+                open(index_path, mode='w').close()
+            self._started = True
+
+        new_individuals = self._collect_new_individuals([*generation, *archive])
+        record = {
+            'generation_num': generation.generation_num,
+            'label': generation.label,
+            'metadata': generation.metadata,
+            'individuals': new_individuals,
+            'generation': [ind.uid for ind in generation],
+            'archive': [ind.uid for ind in archive],
+        }
+        offset = self._write_lines([record], mode='a')
+
+        fitness_values = np.ascontiguousarray(PopulationFitness(generation).values, dtype=FITNESS_INDEX_DTYPE)
+        generation_entry = np.array([(offset, len(generation), self._fitness_offset, fitness_values.shape[1])],
+                                    dtype=GENERATIONS_INDEX_DTYPE)
+        with open(fitness_index_path, mode='ab') as index_file:
+            index_file.write(fitness_values.tobytes())
+        with open(generations_index_path, mode='ab') as index_file:
+            index_file.write(generation_entry.tobytes())
+        with open(uids_index_path, mode='a') as index_file:
+            index_file.writelines(f'{ind.uid}\t{self._records_num}\n' for ind in new_individuals)
+        self._fitness_offset += fitness_values.size
+        self._records_num += 1
+
+    def _collect_new_individuals(self, individuals: Sequence[Individual]) -> List[Individual]:
+        new_individuals = []
+        stack = list(reversed(individuals))
+        while stack:
+            individual = stack.pop()
+            if individual.uid in self._written_uids:
+                continue
+            self._written_uids.add(individual.uid)
+            new_individuals.append(individual)
+            stack.extend(parent for parent in individual.parents if parent is not None)
+        return new_individuals
+
+    def _write_lines(self, records: Sequence[Dict[str, Any]], mode: str) -> int:
+        """Writes records and returns the byte offset of the first of them."""
+        with open(self.file_path, mode=mode + 'b') as stream_file:
+            offset = stream_file.seek(0, os.SEEK_END)
+            for record in records:
+                stream_file.write(json.dumps(record, cls=Serializer).encode())
+                stream_file.write(b'\n')
+        return offset
+
+
+class OptHistoryStreamReader:
+    """
+    Reads the optimization history written by :class:`OptHistoryStreamWriter`.
+
+    Generations are read lazily one by one while iterating over the reader,
+    so the stream could be processed without loading the whole history.
+
+    Args:
+        file_path: path to the file of the stream
+    """
+
+    def __init__(self, file_path: Union[str, os.PathLike]):
+        self.file_path = Path(file_path)
+
+    @property
+    def objective(self) -> ObjectiveInfo:
+        with open(self.file_path, mode='r') as stream_file:
+            header = json.loads(stream_file.readline(), cls=Serializer)
+        return header['objective']
+
+    def __iter__(self) -> Iterator[Tuple[Generation, List[Individual]]]:
+        """Yields generations with the archives of the best individuals in the order they were written."""
+        uid_to_individual: Dict[str, Individual] = {}
+        with open(self.file_path, mode='r') as stream_file:
+            stream_file.readline()  # skip the header
+            for line in stream_file:
+                if not line.strip():
+                    continue
+                yield self._decode_record(json.loads(line, cls=Serializer), uid_to_individual)
+
+    def to_history(self) -> OptHistory:
+        """Reads the whole stream into the history."""
+        from golem.core.optimisers.opt_history_objects.opt_history import OptHistory
+
+        history = OptHistory(self.objective, default_save_dir=self.file_path.parent)
+        for generation, archive in self:
+            history.generations.append(generation)
+            history.add_to_archive_history(archive)
+        return history
+
+    @staticmethod
+    def _decode_record(record: Dict[str, Any],
+                       uid_to_individual: Dict[str, Individual]) -> Tuple[Generation, List[Individual]]:
+        new_individuals = record['individuals']
+        uid_to_individual.update((ind.uid, ind) for ind in new_individuals)
+        for individual in new_individuals:
+            link_parents(individual, uid_to_individual)
+        return decode_generation(record, uid_to_individual)
+
+
+def history_index_paths(file_path: Union[str, os.PathLike]) -> Tuple[Path, Path, Path]:
+    """Returns paths to the index files of the history stream:
+    index of the generation records, index of the fitness values and index of the individual records."""
+    file_path = Path(file_path)
+    return (file_path.with_name(file_path.name + '.generations'),
+            file_path.with_name(file_path.name + '.fitness'),
+            file_path.with_name(file_path.name + '.uids'))
+
+
+def link_parents(individual: Individual, uid_to_individual: Dict[str, Individual]):
+    """Replaces uids of the parents (as they are serialized) by the individuals. The operation is executed in-place"""
+    parent_operator = individual.parent_operator
+    if parent_operator:
+        parents = tuple(_get_individual(uid, uid_to_individual) if isinstance(uid, str) else uid
+                        for uid in parent_operator.parent_individuals)
+        object.__setattr__(parent_operator, 'parent_individuals', parents)
+
+
+def decode_generation(record: Dict[str, Any],
+                      uid_to_individual: Dict[str, Individual]) -> Tuple[Generation, List[Individual]]:
+    """Returns generation and archive of the decoded record with the individuals taken by uids."""
+    generation = Generation([_get_individual(uid, uid_to_individual) for uid in record['generation']],
+                            record['generation_num'], record['label'], record['metadata'])
+    archive = [_get_individual(uid, uid_to_individual) for uid in record['archive']]
+    return generation, archive
+
+
+def _get_individual(uid: str, uid_to_individual: Dict[str, Individual]) -> Individual:
+    individual = uid_to_individual.get(uid)
+    if individual is None:
+        individual = Individual(OptGraph(), metadata=dict(MISSING_INDIVIDUAL_METADATA), uid=uid)
+    return individual
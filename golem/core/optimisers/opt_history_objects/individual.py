@@ -100,12 +100,13 @@ class Individual:
         operators.reverse()
         return operators
 
-    def save(self, json_file_path: Union[str, os.PathLike] = None) -> Optional[str]:
-        return default_save(obj=self, json_file_path=json_file_path)
+    def save(self, json_file_path: Union[str, os.PathLike] = None,
+             backend: str = 'json') -> Optional[Union[str, bytes]]:
+        return default_save(obj=self, json_file_path=json_file_path, backend=backend)
 
     @staticmethod
-    def load(json_str_or_file_path: Union[str, os.PathLike] = None) -> Individual:
-        return default_load(json_str_or_file_path)
+    def load(json_str_or_file_path: Union[str, bytes, os.PathLike] = None, backend: str = 'json') -> Individual:
+        return default_load(json_str_or_file_path, backend=backend)
 
     def __repr__(self):
         return (f'<Individual {self.uid} | fitness: {self.fitness} | native_generation: {self.native_generation} '
@@ -135,7 +136,9 @@ class Individual:
 class GraphEvalResult:
     uid_of_individual: str
     fitness: Fitness
-    graph: OptGraph  # For the case if evaluation needs to assign some values to the graph.
+    # For the case if evaluation needs to assign some values to the graph.
+    # None if the graph is the same as the evaluated one.
+    graph: Optional[OptGraph]
     metadata: Dict[str, Any] = field(default_factory=dict)
 
     def __bool__(self):
@@ -9,8 +9,12 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Union, TYPE_CHECKING
 
 from golem.core.log import default_log
+from golem.core.optimisers.fitness import PopulationFitness
 from golem.core.optimisers.objective.objective import ObjectiveInfo
 from golem.core.optimisers.opt_history_objects.generation import Generation
+from golem.core.optimisers.opt_history_objects.history_stream import OptHistoryStreamReader, OptHistoryStreamWriter
+from golem.core.optimisers.opt_history_objects.opt_history_table import OptHistoryTable
+from golem.core.optimisers.opt_history_objects.opt_history_view import OptHistoryView
 
 from golem.core.paths import default_data_dir
 from golem.serializers.serializer import default_load, default_save
@@ -80,12 +84,16 @@ class OptHistory:
             writer.writerow(header_row)
 
             # Write history rows
-            idx = 0
-            for gen_num, gen_inds in enumerate(self.generations):
-                for ind_num, ind in enumerate(gen_inds):
-                    row = [idx, gen_num, ind.fitness.values, ind.graph.length, ind.graph.depth, ind.metadata]
-                    writer.writerow(row)
-                    idx += 1
+            table = self.to_table()
+            individuals = itertools.chain(*self.generations)
+            writer.writerows([idx, gen_num, ind.fitness.values, length, depth, ind.metadata]
+                             for idx, (gen_num, ind, length, depth)
+                             in enumerate(zip(table.generation.tolist(), individuals,
+                                              table.graph_size.tolist(), table.graph_depth.tolist())))
+
+    def to_table(self) -> OptHistoryTable:
+        """Returns columnar table of the history with a row per individual of each generation."""
+        return OptHistoryTable.from_history(self)
 
     def save_current_results(self, save_dir: Optional[os.PathLike] = None):
         # Create folder if it's not exists
@@ -104,20 +112,43 @@ class OptHistory:
         except Exception as ex:
             self._log.exception(ex)
 
-    def save(self, json_file_path: Union[str, os.PathLike] = None, is_save_light: bool = False) -> Optional[str]:
+    def save(self, json_file_path: Union[str, os.PathLike] = None, is_save_light: bool = False,
+             backend: str = 'json') -> Optional[Union[str, bytes]]:
         """ Saves history to specified path.
         Args:
             json_file_path: path to json file where to save history.
             is_save_light: bool parameter to specify whether there is a need to save full history or a light version.
             NB! For experiments and etc. full histories must be saved. However, to make the analysis of results faster
             (show fitness plots, for example) the light version of histories can be saved too.
+            backend: format of the saved history: ``'json'``, ``'json_compact'`` or ``'msgpack'``
+             (see :func:`golem.serializers.serializer.default_save`).
         """
         history_to_save = lighten_history(self) if is_save_light else self
-        return default_save(obj=history_to_save, json_file_path=json_file_path)
+        return default_save(obj=history_to_save, json_file_path=json_file_path, backend=backend)
+
+    @staticmethod
+    def load(json_str_or_file_path: Union[str, bytes, os.PathLike] = None, backend: str = 'json') -> OptHistory:
+        return default_load(json_str_or_file_path, backend=backend)
+
+    def save_stream(self, file_path: Union[str, os.PathLike]):
+        """Saves history to the indexed stream (see :class:`OptHistoryStreamWriter`),
+        that can be loaded lazily with ``load_lazy``."""
+        writer = OptHistoryStreamWriter(file_path, self.objective)
+        for gen_num, generation in enumerate(self.generations):
+            archive = self.archive_history[gen_num] if gen_num < len(self.archive_history) else ()
+            writer.write(generation, archive)
+
+    @staticmethod
+    def load_stream(file_path: Union[str, os.PathLike]) -> OptHistory:
+        """Loads history appended to the file by :class:`OptHistoryStreamWriter`.
+        Use :class:`OptHistoryStreamReader` to iterate over the generations without loading the whole history."""
+        return OptHistoryStreamReader(file_path).to_history()
 
     @staticmethod
-    def load(json_str_or_file_path: Union[str, os.PathLike] = None) -> OptHistory:
-        return default_load(json_str_or_file_path)
+    def load_lazy(file_path: Union[str, os.PathLike]) -> OptHistoryView:
+        """Opens history saved by ``save_stream`` or by :class:`OptHistoryStreamWriter` without loading it.
+        Fitness values are memory-mapped and generations are loaded on demand."""
+        return OptHistoryView(file_path)
 
     @staticmethod
     def clean_results(dir_path: Optional[str] = None):
@@ -128,18 +159,20 @@ class OptHistory:
 
     @property
     def historical_fitness(self) -> Sequence[Sequence[Union[float, Sequence[float]]]]:
-        """Return sequence of histories of generations per each metric"""
+        """Return sequence of histories of generations per each metric.
+        Values of invalid fitnesses are None."""
+        generations_fitness = [PopulationFitness.of(generation) for generation in self.generations]
         if self.objective.is_multi_objective:
             historical_fitness = []
             num_metrics = len(self.generations[0][0].fitness.values)
             for objective_num in range(num_metrics):
                 # history of specific objective for each generation
-                objective_history = [[ind.fitness.values[objective_num] for ind in generation]
-                                     for generation in self.generations]
+                objective_history = [generation_fitness.objective_values_list(objective_num)
+                                     for generation_fitness in generations_fitness]
                 historical_fitness.append(objective_history)
         else:
-            historical_fitness = [[ind.fitness.value for ind in pop]
-                                  for pop in self.generations]
+            historical_fitness = [generation_fitness.objective_values_list(0)
+                                  for generation_fitness in generations_fitness]
         return historical_fitness
 
     @property
@@ -181,7 +214,7 @@ class OptHistory:
         """
         # Take only the first graph's appearance in history
         individuals_with_positions \
-            = list({ind.graph.descriptive_id: (ind, gen_num, ind_num)
+            = list({ind.graph.structural_hash: (ind, gen_num, ind_num)
                     for gen_num, gen in enumerate(self.generations)
                     for ind_num, ind in reversed(list(enumerate(gen)))}.values())
 
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from golem.core.optimisers.fitness import PopulationFitness
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from golem.core.optimisers.opt_history_objects.individual import Individual
+    from golem.core.optimisers.opt_history_objects.opt_history import OptHistory
+    from golem.core.optimisers.opt_history_objects.opt_history_view import OptHistoryView
+
+# columns with a sequence of values in each row
+LIST_COLUMNS = ('operations', 'parents', 'nodes')
+
+
+class OptHistoryTable:
+    """Columnar table of the optimization history with a row per individual of each generation.
+
+    Columns are numpy arrays, so the table could be analysed without iterating over the individuals
+    and could be converted to pandas/Arrow/Parquet as is (see :meth:`columns`).
+    Graph properties are computed once per individual, even if it appears in many generations.
+
+    Columns:
+        generation: number of the generation
+        uid: uid of the individual
+        fitness: matrix (rows x objectives) of fitness values, values of invalid fitnesses are nan
+        graph_size: number of nodes in the graph
+        graph_depth: depth of the graph
+        operator: type of the operator that produced the individual ('' for the initial individuals)
+        operations: names of the operations applied by the operator
+        parents: uids of the parents of the individual
+        nodes: names of the nodes of the graph
+        computation_time: fitness evaluation time in seconds (nan if unknown)
+        evaluation_time_iso: time of the evaluation in iso format ('' if unknown)
+
+    Args:
+        columns: values of the columns listed above
+    """
+    __slots__ = ('generation', 'uid', 'fitness', 'graph_size', 'graph_depth', 'operator', 'operations', 'parents',
+                 'nodes', 'computation_time', 'evaluation_time_iso')
+
+    def __init__(self, **columns: np.ndarray):
+        for name in self.__slots__:
+            setattr(self, name, columns[name])
+
+    @staticmethod
+    def from_history(history: Union[OptHistory, OptHistoryView]) -> OptHistoryTable:
+        generations = list(history.generations)
+        individuals = [ind for generation in generations for ind in generation]
+        rows_by_uid: Dict[str, Tuple[int, int, Tuple[str, ...], str, Tuple[str, ...], Tuple[str, ...]]] = {}
+        for ind in individuals:
+            if ind.uid not in rows_by_uid:
+                rows_by_uid[ind.uid] = _individual_row(ind)
+        graph_size, graph_depth, nodes, operator, operations, parents = \
+            zip(*(rows_by_uid[ind.uid] for ind in individuals)) if individuals else ((),) * 6
+
+        return OptHistoryTable(
+            generation=np.repeat(np.arange(len(generations)), [len(generation) for generation in generations]),
+            uid=np.array([ind.uid for ind in individuals], dtype=str),
+            fitness=_fitness_matrix(generations),
+            graph_size=np.array(graph_size, dtype=int),
+            graph_depth=np.array(graph_depth, dtype=int),
+            operator=np.array(operator, dtype=str),
+            operations=_object_array(operations),
+            parents=_object_array(parents),
+            nodes=_object_array(nodes),
+            computation_time=np.array([ind.metadata.get('computation_time_in_seconds', np.nan)
+                                       for ind in individuals], dtype=float),
+            evaluation_time_iso=np.array([ind.metadata.get('evaluation_time_iso', '')
+                                          for ind in individuals], dtype=str),
+        )
+
+    def __len__(self) -> int:
+        return len(self.generation)
+
+    @property
+    def generations_count(self) -> int:
+        return int(self.generation[-1]) + 1 if len(self) else 0
+
+    def generation_fitness(self, generation_num: int) -> np.ndarray:
+        """Returns fitness matrix of the generation (individuals x objectives)."""
+        return self.fitness[self.generation == generation_num]
+
+    def columns(self) -> Dict[str, Union[np.ndarray, List[Any]]]:
+        """Returns flat columns with a column per objective (``fitness_0``, ``fitness_1``, ...).
+        Columns with sequences in the rows are lists of lists, as Arrow expects."""
+        columns = {}
+        for name in self.__slots__:
+            values = getattr(self, name)
+            if name == 'fitness':
+                columns.update({f'fitness_{i}': values[:, i] for i in range(values.shape[1])})
+            elif name in LIST_COLUMNS:
+                columns[name] = [list(row) for row in values]
+            else:
+                columns[name] = values
+        return columns
+
+    def to_dataframe(self) -> pd.DataFrame:
+        import pandas as pd
+        return pd.DataFrame(self.columns())
+
+    def save(self, file_path: Union[str, os.PathLike]):
+        """Saves the table to ``.npz`` file. Columns with sequences are stored as flat values
+        with the offsets of the rows, so the file doesn't require pickling."""
+        arrays = {}
+        for name in self.__slots__:
+            values = getattr(self, name)
+            if name in LIST_COLUMNS:
+                arrays[f'{name}_offsets'] = np.cumsum([0] + [len(row) for row in values])
+                arrays[name] = np.array([item for row in values for item in row], dtype=str)
+            else:
+                arrays[name] = values
+        np.savez(file_path, **arrays)
+
+    @staticmethod
+    def load(file_path: Union[str, os.PathLike]) -> OptHistoryTable:
+        columns = {}
+        with np.load(file_path, allow_pickle=False) as arrays:
+            for name in OptHistoryTable.__slots__:
+                values = arrays[name]
+                if name in LIST_COLUMNS:
+                    offsets = arrays[f'{name}_offsets']
+                    values = _object_array(tuple(values[start:end].tolist())
+                                           for start, end in zip(offsets[:-1], offsets[1:]))
+                columns[name] = values
+        return OptHistoryTable(**columns)
+
+
+def _individual_row(ind: Individual) -> Tuple[int, int, Tuple[str, ...], str, Tuple[str, ...], Tuple[str, ...]]:
+    parent_operator = ind.parent_operator
+    operator = parent_operator.type_ if parent_operator else ''
+    operations = tuple(map(str, parent_operator.operators)) if parent_operator else ()
+    parents = tuple(parent.uid for parent in ind.parents)
+    nodes = tuple(map(str, ind.graph.nodes))
+    return ind.graph.length, ind.graph.depth, nodes, operator, operations, parents
+
+
+def _fitness_matrix(generations: Sequence[Sequence[Individual]]) -> np.ndarray:
+    matrices = [PopulationFitness.of(generation).values for generation in generations]
+    num_objectives = max((matrix.shape[1] for matrix in matrices), default=1) or 1
+    fitness = np.full((sum(map(len, matrices)), num_objectives), np.nan)
+    row = 0
+    for matrix in matrices:
+        fitness[row:row + len(matrix), :matrix.shape[1]] = matrix
+        row += len(matrix)
+    return fitness
+
+
+def _object_array(rows) -> np.ndarray:
+    rows = list(rows)
+    array = np.empty(len(rows), dtype=object)
+    for i, row in enumerate(rows):
+        array[i] = row
+    return array
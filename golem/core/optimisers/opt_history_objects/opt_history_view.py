@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import itertools
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union, overload
+
+import numpy as np
+
+from golem.core.optimisers.fitness.population_fitness import nan_to_none
+from golem.core.optimisers.objective.objective import ObjectiveInfo
+from golem.core.optimisers.opt_history_objects.generation import Generation
+from golem.core.optimisers.opt_history_objects.history_stream import FITNESS_INDEX_DTYPE, GENERATIONS_INDEX_DTYPE, \
+    OptHistoryStreamReader, decode_generation, history_index_paths, link_parents
+from golem.core.optimisers.opt_history_objects.individual import Individual
+from golem.serializers.serializer import Serializer
+
+if TYPE_CHECKING:
+    from golem.core.optimisers.opt_history_objects.opt_history import OptHistory
+
+
+class OptHistoryView:
+    """
+    Read-only view of the history written by :class:`OptHistoryStreamWriter` that loads its parts on demand.
+
+    Fitness values are memory-mapped from the fitness index, so the fitness of the whole history
+    is available without decoding of the individuals. Generations are decoded from the stream only when accessed
+    together with the records of their individuals and of the ancestors of the individuals.
+    Decoded individuals are kept by the view, so the same individual is always the same object.
+
+    Args:
+        file_path: path to the history stream
+    """
+
+    def __init__(self, file_path: Union[str, os.PathLike]):
+        self.file_path = Path(file_path)
+        generations_index_path, fitness_index_path, self._uids_index_path = history_index_paths(self.file_path)
+        self._generations_index = _memmap(generations_index_path, GENERATIONS_INDEX_DTYPE)
+        self._fitness_index = _memmap(fitness_index_path, FITNESS_INDEX_DTYPE)
+        self._objective: Optional[ObjectiveInfo] = None
+        self._uid_to_record: Optional[Dict[str, int]] = None
+        self._uid_to_individual: Dict[str, Individual] = {}
+        self._decoded_records: Set[int] = set()
+        self._generations: Dict[int, Tuple[Generation, List[Individual]]] = {}
+
+    @property
+    def objective(self) -> ObjectiveInfo:
+        if self._objective is None:
+            self._objective = OptHistoryStreamReader(self.file_path).objective
+        return self._objective
+
+    @property
+    def generations_count(self) -> int:
+        return len(self._generations_index)
+
+    def is_empty(self) -> bool:
+        return self.generations_count == 0
+
+    @property
+    def generations(self) -> Sequence[Generation]:
+        """Sequence of the generations that are decoded on access."""
+        return _LazyGenerations(self)
+
+    def generation(self, generation_num: int) -> Generation:
+        return self._get_generation(generation_num)[0]
+
+    def archive(self, generation_num: int) -> List[Individual]:
+        """Returns the best individuals found to the moment of the generation."""
+        return self._get_generation(generation_num)[1]
+
+    def fitness(self, generation_num: int) -> np.ndarray:
+        """Returns read-only matrix of fitness values of the generation (individuals x objectives)
+        without decoding of the generation. Values of invalid fitnesses are nan."""
+        _, size, fitness_offset, fitness_columns = self._generations_index[generation_num].tolist()
+        return self._fitness_index[fitness_offset:fitness_offset + size * fitness_columns] \
+            .reshape(size, fitness_columns)
+
+    @property
+    def historical_fitness(self) -> Sequence[Sequence[Union[float, Sequence[float]]]]:
+        """Return sequence of histories of generations per each metric.
+        Values of invalid fitnesses are None."""
+        if self.objective.is_multi_objective:
+            num_metrics = self.fitness(0).shape[1]
+            return [[nan_to_none(self._objective_values(gen_num, objective_num))
+                     for gen_num in range(self.generations_count)]
+                    for objective_num in range(num_metrics)]
+        return [nan_to_none(self._objective_values(gen_num, 0)) for gen_num in range(self.generations_count)]
+
+    @property
+    def all_historical_fitness(self) -> List[float]:
+        historical_fitness = self.historical_fitness
+        if self.objective.is_multi_objective:
+            return [list(itertools.chain(*objective_history)) for objective_history in historical_fitness]
+        return list(itertools.chain(*historical_fitness))
+
+    def all_historical_quality(self, metric_position: int = 0) -> List[float]:
+        """Return fitness history of population for specified metric (see `OptHistory.all_historical_quality`)."""
+        if self.objective.is_multi_objective:
+            return self.all_historical_fitness[metric_position]
+        return self.all_historical_fitness
+
+    def to_history(self) -> OptHistory:
+        """Loads the whole history."""
+        return OptHistoryStreamReader(self.file_path).to_history()
+
+    def _objective_values(self, generation_num: int, objective_idx: int) -> np.ndarray:
+        values = self.fitness(generation_num)
+        if objective_idx >= values.shape[1]:
+            return np.full(len(values), np.nan)
+        return values[:, objective_idx]
+
+    def _get_generation(self, generation_num: int) -> Tuple[Generation, List[Individual]]:
+        generation_num = range(self.generations_count)[generation_num]
+        if generation_num not in self._generations:
+            record = self._read_record(generation_num)
+            self._load_individuals(itertools.chain(record['generation'], record['archive']))
+            self._generations[generation_num] = decode_generation(record, self._uid_to_individual)
+        return self._generations[generation_num]
+
+    def _load_individuals(self, uids: Iterable[str]):
+        """Decodes records with the individuals and with all their ancestors."""
+        if self._uid_to_record is None:
+            with open(self._uids_index_path, mode='r') as index_file:
+                self._uid_to_record = {uid: int(record_num)
+                                       for uid, record_num in (line.split('\t') for line in index_file)}
+
+        decoded_individuals = []
+        uids = set(uids)
+        while uids:
+            records_nums = {self._uid_to_record[uid] for uid in uids
+                            if uid not in self._uid_to_individual and uid in self._uid_to_record}
+            uids = set()
+            for record_num in sorted(records_nums - self._decoded_records):
+                for individual in self._read_record(record_num)['individuals']:
+                    self._uid_to_individual[individual.uid] = individual
+                    decoded_individuals.append(individual)
+                    if individual.parent_operator:
+                        uids.update(parent for parent in individual.parent_operator.parent_individuals
+                                    if isinstance(parent, str))
+                self._decoded_records.add(record_num)
+
+        for individual in decoded_individuals:
+            link_parents(individual, self._uid_to_individual)
+
+    def _read_record(self, record_num: int) -> Dict[str, Any]:
+        with open(self.file_path, mode='rb') as stream_file:
+            stream_file.seek(int(self._generations_index[record_num]['offset']))
+            return json.loads(stream_file.readline(), cls=Serializer)
+
+
+class _LazyGenerations(Sequence):
+    def __init__(self, view: OptHistoryView):
+        self._view = view
+
+    def __len__(self) -> int:
+        return self._view.generations_count
+
+    @overload
+    def __getitem__(self, index: int) -> Generation: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Generation]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._view.generation(i) for i in range(len(self))[index]]
+        return self._view.generation(index)
+
+
+def _memmap(path: Path, dtype: np.dtype) -> np.ndarray:
+    """Maps the complete items of the binary index to the read-only array."""
+    count = os.path.getsize(path) // dtype.itemsize
+    if count == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r', shape=(count,))
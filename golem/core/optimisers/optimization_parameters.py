@@ -33,10 +33,30 @@ class OptimizationParameters:
 
     :param keep_n_best: number of the best individuals of previous generation to keep in next generation
     :param max_graph_fit_time: time constraint for evaluation of each graph (datetime.timedelta)
+    :param hard_graph_fit_timeout: if True then the optimizer enforces `max_graph_fit_time` on its own.
+
+        Graphs are evaluated in worker processes even with `n_jobs=1`, and the workers that exceed
+        the constraint are terminated. Such graphs get invalid fitness. Termination restarts all workers,
+        so the other graphs that are evaluated at the moment are evaluated again from the start.
     :param n_jobs: num of n_jobs
     :param show_progress: bool indicating whether to show progress using tqdm or not
     :param collect_intermediate_metric: save metrics for intermediate (non-root) nodes in graph
-    :param parallelization_mode: identifies the way to parallelize population evaluation
+    :param parallelization_mode: identifies the way to parallelize population evaluation:
+        'populational' -- evaluates the whole population in parallel,
+        'async' -- steady-state evolution: new individuals are reproduced for the free workers
+        without waiting for the slow evaluations of the population,
+        'streaming' -- offspring of the population is evaluated as soon as it's produced,
+        and reproduction stops when enough valid individuals are collected,
+        other values -- sequential evaluation.
+    :param fitness_cache_size: max number of fitness values of evaluated graphs kept in memory
+        for reuse on structurally identical graphs. If None -- fitness cache is not used.
+    :param fitness_cache_path: optional path to the on-disk store of the fitness cache.
+
+        Persists fitness values between runs, so that repeated and resumed runs
+        don't evaluate the same graphs again. Used only if `fitness_cache_size` is specified.
+    :param fitness_cache_namespace: key of the problem (e.g. name of the dataset) that the cached
+        fitness values belong to. Together with the metrics of the objective it separates the values
+        of different problems in the cache. Required if `fitness_cache_path` is specified.
 
     History options:
 
@@ -46,6 +66,8 @@ class OptimizationParameters:
         If the path is relative, then save relative to `default_data_dir`.
         If absolute -- then save directly by specified path.
         If None -- do not save the history to disk and keep it only in-memory.
+    :param stream_history: if True, then generations are appended to the single file `history.jsonl`
+        in the `history_dir` (see `OptHistory.load_stream`) instead of saving each individual to its own file.
     """
 
     num_of_generations: Optional[int] = None
@@ -55,16 +77,21 @@ class OptimizationParameters:
 
     keep_n_best: int = 1
     max_graph_fit_time: Optional[datetime.timedelta] = None
+    hard_graph_fit_timeout: bool = False
     n_jobs: int = 1
     show_progress: bool = True
     collect_intermediate_metric: bool = False
     parallelization_mode: str = 'populational'
+    fitness_cache_size: Optional[int] = None
+    fitness_cache_path: Optional[str] = None
+    fitness_cache_namespace: Optional[str] = None
     static_individual_metadata: dict = field(default_factory=lambda: {
         'use_input_preprocessing': True
     })
 
     keep_history: bool = True
     history_dir: Optional[str] = field(default_factory=default_data_dir)
+    stream_history: bool = False
     agent_dir: Optional[str] = field(default_factory=default_data_dir)
 
 
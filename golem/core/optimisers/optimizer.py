@@ -21,6 +21,7 @@ from golem.core.optimisers.random_graph_factory import RandomGraphFactory, Rando
 from golem.utilities.random import RandomStateHandler
 
 STRUCTURAL_DIVERSITY_FREQUENCY_CHECK = 5
+VERIFIER_CACHE_SIZE = 10_000
 
 
 def do_nothing_callback(*args, **kwargs):
@@ -77,7 +78,9 @@ class GraphGenerationParams:
                  remote_evaluator: Optional[DelegateEvaluator] = None,
                  ):
         self.adapter = adapter or IdentityAdapter()
-        self.verifier = GraphVerifier(rules_for_constraint, self.adapter)
+        # default rules check only the structure of the graph, so their results can be cached
+        verifier_cache_size = VERIFIER_CACHE_SIZE if set(rules_for_constraint) <= set(DEFAULT_DAG_RULES) else 0
+        self.verifier = GraphVerifier(rules_for_constraint, self.adapter, cache_size=verifier_cache_size)
         self.advisor = advisor or DefaultChangeAdvisor()
         self.remote_evaluator = remote_evaluator
         if node_factory:
@@ -1,14 +1,17 @@
 from abc import abstractmethod
+from pathlib import Path
 from random import choice
 from typing import Any, Optional, Sequence, Dict
 
 from golem.core.constants import MIN_POP_SIZE
 from golem.core.dag.graph import Graph
 from golem.core.optimisers.archive import GenerationKeeper
-from golem.core.optimisers.genetic.evaluation import MultiprocessingDispatcher, SequentialDispatcher
+from golem.core.optimisers.genetic.evaluation import MultiprocessingDispatcher, SequentialDispatcher, FitnessCache, \
+    AsyncDispatcher
 from golem.core.optimisers.genetic.operators.operator import PopulationT, EvaluationOperator
 from golem.core.optimisers.objective import GraphFunction, ObjectiveFunction
 from golem.core.optimisers.objective.objective import Objective
+from golem.core.optimisers.opt_history_objects.history_stream import HISTORY_STREAM_FILE, OptHistoryStreamWriter
 from golem.core.optimisers.opt_history_objects.individual import Individual
 from golem.core.optimisers.optimization_parameters import GraphRequirements
 from golem.core.optimisers.optimizer import GraphGenerationParams, GraphOptimizer, AlgorithmParameters
@@ -48,13 +51,32 @@ class PopulationalOptimizer(GraphOptimizer):
         self.generations = GenerationKeeper(self.objective, keep_n_best=requirements.keep_n_best)
         self.timer = OptimisationTimer(timeout=self.requirements.timeout)
 
-        dispatcher_type = MultiprocessingDispatcher if self.requirements.parallelization_mode == 'populational' else \
-            SequentialDispatcher
-
+        dispatcher_types = {'populational': MultiprocessingDispatcher,
+                            'async': AsyncDispatcher,
+                            'streaming': AsyncDispatcher}
+        dispatcher_type = dispatcher_types.get(self.requirements.parallelization_mode, SequentialDispatcher)
+
+        fitness_cache = None
+        if requirements.fitness_cache_size is not None:
+            if requirements.fitness_cache_path and not requirements.fitness_cache_namespace:
+                raise ValueError('`fitness_cache_namespace` is required for the on-disk fitness cache.')
+            # fitness values are reused only for the same problem and the same objective
+            cache_namespace = ':'.join([requirements.fitness_cache_namespace or '',
+                                        str(self.objective.is_multi_objective), *self.objective.metric_names])
+            fitness_cache = FitnessCache(requirements.fitness_cache_size, requirements.fitness_cache_path,
+                                         cache_namespace)
+        graph_eval_timeout = requirements.max_graph_fit_time if requirements.hard_graph_fit_timeout else None
         self.eval_dispatcher = dispatcher_type(adapter=graph_generation_params.adapter,
                                                n_jobs=requirements.n_jobs,
                                                graph_cleanup_fn=_try_unfit_graph,
-                                               delegate_evaluator=graph_generation_params.remote_evaluator)
+                                               delegate_evaluator=graph_generation_params.remote_evaluator,
+                                               fitness_cache=fitness_cache,
+                                               graph_eval_timeout=graph_eval_timeout)
+
+        self._history_stream = None
+        if requirements.keep_history and requirements.history_dir and requirements.stream_history:
+            self._history_stream = OptHistoryStreamWriter(Path(requirements.history_dir, HISTORY_STREAM_FILE),
+                                                          self.history.objective)
 
         # early_stopping_iterations and early_stopping_timeout may be None, so use some obvious max number
         max_stagnation_length = requirements.early_stopping_iterations or requirements.num_of_generations
@@ -91,24 +113,27 @@ class PopulationalOptimizer(GraphOptimizer):
         # eval_dispatcher defines how to evaluate objective on the whole population
         evaluator = self.eval_dispatcher.dispatch(objective, self.timer)
 
-        with self.timer, self._progressbar as pbar:
-
-            self._initial_population(evaluator)
-
-            while not self.stop_optimization():
-                try:
-                    new_population = self._evolve_population(evaluator)
-                    if self.gen_structural_diversity_check != -1 \
-                            and self.generations.generation_num % self.gen_structural_diversity_check == 0 \
-                            and self.generations.generation_num != 0:
-                        new_population = self.get_structure_unique_population(new_population, evaluator)
-                    pbar.update()
-                except EvaluationAttemptsError as ex:
-                    self.log.warning(f'Composition process was stopped due to: {ex}')
-                    break
-                # Adding of new population to history
-                self._update_population(new_population)
-        pbar.close()
+        try:
+            with self.timer, self._progressbar as pbar:
+
+                self._initial_population(evaluator)
+
+                while not self.stop_optimization():
+                    try:
+                        new_population = self._evolve_population(evaluator)
+                        if self.gen_structural_diversity_check != -1 \
+                                and self.generations.generation_num % self.gen_structural_diversity_check == 0 \
+                                and self.generations.generation_num != 0:
+                            new_population = self.get_structure_unique_population(new_population, evaluator)
+                        pbar.update()
+                    except EvaluationAttemptsError as ex:
+                        self.log.warning(f'Composition process was stopped due to: {ex}')
+                        break
+                    # Adding of new population to history
+                    self._update_population(new_population)
+            pbar.close()
+        finally:
+            self.eval_dispatcher.shutdown()
         self._update_population(self.best_individuals, 'final_choices')
         return [ind.graph for ind in self.best_individuals]
 
@@ -151,13 +176,15 @@ class PopulationalOptimizer(GraphOptimizer):
                         metadata: Optional[Dict[str, Any]] = None):
         self.history.add_to_history(population, label, metadata)
         self.history.add_to_archive_history(self.generations.best_individuals)
-        if self.requirements.history_dir:
+        if self._history_stream is not None:
+            self._history_stream.write(self.history.generations[-1], self.history.archive_history[-1])
+        elif self.requirements.history_dir:
             self.history.save_current_results(self.requirements.history_dir)
 
     def get_structure_unique_population(self, population: PopulationT, evaluator: EvaluationOperator) -> PopulationT:
         """ Increases structurally uniqueness of population to prevent stagnation in optimization process.
         Returned population may be not entirely unique, if the size of unique population is lower than MIN_POP_SIZE. """
-        unique_population_with_ids = {ind.graph.descriptive_id: ind for ind in population}
+        unique_population_with_ids = {ind.graph.structural_hash: ind for ind in population}
         unique_population = list(unique_population_with_ids.values())
 
         # if size of unique population is too small, then extend it to MIN_POP_SIZE by repeating individuals
@@ -3,6 +3,7 @@ from typing import Any, Dict, Type, Sequence, Union
 from golem.core.dag.graph import Graph
 from golem.core.dag.graph_delegate import GraphDelegate
 from golem.core.dag.linked_graph_node import LinkedGraphNode
+from golem.core.dag.structure_tracker import TrackedUniqueList
 
 
 def graph_from_json(cls: Type[Graph], json_obj: Dict[str, Any]) -> Graph:
@@ -34,7 +35,10 @@ def _reassign_edges_by_node_ids(nodes: Sequence[Union[LinkedGraphNode, dict]]):
 
     for node in nodes:
         nodes_from = node['_nodes_from'] if isinstance(node, dict) else node.nodes_from
-        if not nodes_from:
-            continue
-        for parent_node_idx, parent_node_uid in enumerate(nodes_from):
-            nodes_from[parent_node_idx] = lookup_dict.get(parent_node_uid, None)
+        if nodes_from:
+            for parent_node_idx, parent_node_uid in enumerate(nodes_from):
+                nodes_from[parent_node_idx] = lookup_dict.get(parent_node_uid, None)
+        if isinstance(node, LinkedGraphNode):
+            # restore the types of the containers that track modifications of the node
+            node._nodes_from = TrackedUniqueList.from_items(nodes_from or ())
+            node.content = node.content
@@ -1,11 +1,13 @@
+import hashlib
 from itertools import chain
 from typing import Any, Dict, List, Sequence, Type, Union
 
+from golem.core.dag.graph import Graph
 from golem.core.optimisers.graph import OptGraph
 from golem.core.optimisers.opt_history_objects.individual import Individual
 from golem.core.optimisers.opt_history_objects.generation import Generation
 from golem.core.optimisers.opt_history_objects.opt_history import OptHistory
-from .. import any_from_json, any_to_json
+from .. import Serializer, any_from_json, any_to_json
 from ...core.optimisers.objective.objective import ObjectiveInfo
 
 MISSING_INDIVIDUAL_ARGS = {
@@ -42,9 +44,44 @@ def _archive_to_uids(generations_list: List[List[Individual]]) -> List[List[str]
     return [[individual.uid for individual in generation] for generation in generations_list]
 
 
+def _individuals_to_json(individuals: Sequence[Individual], graphs_pool: Dict[str, Graph]) -> List[Dict[str, Any]]:
+    """Encodes individuals with the graphs replaced by their keys (see :func:`_graph_key`).
+    Graphs are added to the pool, one graph per key.
+    Graphs with repeated uids of the nodes are kept inside of the individuals,
+    since they aren't restored as the same structure and so can't be addressed by it."""
+    serialized = []
+    for individual in individuals:
+        encoded = any_to_json(individual)
+        graph = individual.graph
+        if isinstance(graph, Graph) and _has_unique_node_uids(graph):
+            graph_key = _graph_key(graph)
+            graphs_pool.setdefault(graph_key, graph)
+            encoded['graph'] = graph_key
+        encoded.update(Serializer.dump_path_to_obj(individual))
+        serialized.append(encoded)
+    return serialized
+
+
+def _graph_key(graph: Graph) -> str:
+    """Returns key of the graph in the pool that is the same for the graphs with the same structure
+    and the same uids of the nodes (e.g. for the copies of the graph that weren't changed by the operators).
+    Unlike ``structural_hash`` it depends on the uids, so the individuals restored from the pool
+    have the nodes with the same uids as the saved ones."""
+    nodes = sorted(f'{node.uid}:{node.description()}:{",".join(sorted(parent.uid for parent in node.nodes_from))}'
+                   for node in graph.nodes)
+    return hashlib.blake2b('\n'.join(nodes).encode(), digest_size=16).hexdigest()
+
+
+def _has_unique_node_uids(graph: Graph) -> bool:
+    return len({node.uid for node in graph.nodes}) == len(graph.nodes)
+
+
 def opt_history_to_json(obj: OptHistory) -> Dict[str, Any]:
     serialized = any_to_json(obj)
-    serialized['individuals_pool'] = _flatten_generations_list(serialized['_generations'])
+    graphs_pool = {}
+    serialized['individuals_pool'] = _individuals_to_json(_flatten_generations_list(serialized['_generations']),
+                                                          graphs_pool)
+    serialized['graphs_pool'] = graphs_pool
     serialized['_generations'] = _generations_list_to_uids(serialized['_generations'])
     serialized['archive_history'] = _archive_to_uids(serialized['archive_history'])
     return serialized
@@ -62,6 +99,18 @@ def _uids_to_individuals(uid_sequence: Sequence[Union[str, Individual]],
     return list(map(uid_to_individual_mapper, uid_sequence))
 
 
+def _deserialize_graphs(individuals: List[Individual], graphs_pool: Dict[str, Graph]):
+    """Replaces keys of the graphs by the graphs from the pool, so the same graphs are shared.
+    The operation is executed in-place"""
+    for individual in individuals:
+        if isinstance(individual.graph, str):
+            graph = graphs_pool.get(individual.graph)
+            if graph is None:
+                raise ValueError(f'Graph {individual.graph} of the individual {individual.uid} is missing '
+                                 f'in the saved history. The history file is probably corrupted or truncated.')
+            object.__setattr__(individual, 'graph', graph)
+
+
 def _deserialize_generations_list(generations_list: List[Union[Generation, List[Union[str, Individual]]]],
                                   uid_to_individual_map: Dict[str, Individual]):
     """The operation is executed in-place"""
@@ -103,9 +152,13 @@ def opt_history_from_json(cls: Type[OptHistory], json_obj: Dict[str, Any]) -> Op
     if 'individuals' in json_obj:
         json_obj['_generations'] = json_obj.pop('individuals')
 
+    # Older histories keep the graphs inside of the individuals.
+    graphs_pool = json_obj.pop('graphs_pool', {})
+
     history = any_from_json(cls, json_obj)
     # Read all individuals from history.
     individuals_pool = history.individuals_pool
+    _deserialize_graphs(individuals_pool, graphs_pool)
     uid_to_individual_map = {ind.uid: ind for ind in individuals_pool}
     # The attributes `individuals` and `archive_history` at the moment contain uid strings that must be converted
     # to `Individual` instances.
@@ -1,13 +1,21 @@
 import json
 import os
+from functools import partial
 from importlib import import_module
 from inspect import isclass, isfunction, ismethod, signature
 from json import JSONDecoder, JSONEncoder
-from typing import Any, Callable, Dict, Optional, Type, TypeVar, Union
+from typing import Any, Callable, Dict, Optional, Set, Type, TypeVar, Union
 
 from golem.core.dag.linked_graph import LinkedGraph
 from golem.core.dag.linked_graph_node import LinkedGraphNode
 from golem.core.log import default_log
+from golem.utilities.requirements_notificator import warn_requirement
+
+try:
+    import msgpack
+except ModuleNotFoundError:
+    warn_requirement('msgpack', 'other_requirements/serialization.txt')
+    msgpack = None
 
 # NB: at the end of module init happens registration of default class coders
 
@@ -15,6 +23,8 @@ INSTANCE_OR_CALLABLE = TypeVar('INSTANCE_OR_CALLABLE', object, Callable)
 EncodeCallable = Callable[[INSTANCE_OR_CALLABLE], Dict[str, Any]]
 DecodeCallable = Callable[[Type[INSTANCE_OR_CALLABLE], Dict[str, Any]], INSTANCE_OR_CALLABLE]
 
+SERIALIZATION_BACKENDS = ('json', 'json_compact', 'msgpack')
+
 MODULE_X_NAME_DELIMITER = '/'
 CLASS_PATH_KEY = '_class_path'
 
@@ -64,12 +74,22 @@ class Serializer(JSONEncoder, JSONDecoder):
 
     CODERS_BY_TYPE = {}
 
+    # caches of the dispatch, the classes are resolved once per class path and the coders -- once per class
+    _classes_by_path: Dict[str, Type[INSTANCE_OR_CALLABLE]] = {}
+    _coders_by_class: Dict[Type, Optional[Dict[str, Callable]]] = {}
+    _class_paths: Dict[Type, str] = {}
+
     __default_coders_initialized = False
 
     def __init__(self, *args, **kwargs):
-        for base_class, coder_name in [(JSONEncoder, 'default'), (JSONDecoder, 'object_hook')]:
+        # modules that can't be imported during the decoding by this serializer (i.e. during one load call),
+        # objects of their classes are decoded by the content and the failure is logged only once
+        self._failed_imports: Set[str] = set()
+        object_hook = partial(self.object_hook, failed_imports=self._failed_imports)
+        for base_class, coder_name, coder in [(JSONEncoder, 'default', self.default),
+                                              (JSONDecoder, 'object_hook', object_hook)]:
             base_kwargs = {k: kwargs[k] for k in kwargs.keys() & signature(base_class.__init__).parameters}
-            base_kwargs[coder_name] = getattr(self, coder_name)
+            base_kwargs[coder_name] = coder
             base_class.__init__(self, **base_kwargs)
 
         if not self.__default_coders_initialized:
@@ -122,6 +142,7 @@ class Serializer(JSONEncoder, JSONDecoder):
             ComparableEnum: {_to_json: enum_to_json, _from_json: enum_from_json},
         }
         Serializer.CODERS_BY_TYPE.update(default_coders)
+        Serializer._coders_by_class.clear()
 
     @staticmethod
     def register_coders(cls: Type[INSTANCE_OR_CALLABLE],
@@ -159,6 +180,7 @@ class Serializer(JSONEncoder, JSONDecoder):
 
         if cls not in Serializer.CODERS_BY_TYPE or overwrite:
             Serializer.CODERS_BY_TYPE[cls] = coders
+            Serializer._coders_by_class.clear()
         else:
             raise AttributeError(f'Object {cls} already has serializer coders registered.')
 
@@ -178,6 +200,17 @@ class Serializer(JSONEncoder, JSONDecoder):
                 return k_type
         return None
 
+    @staticmethod
+    def _get_coders(obj_cls: Type) -> Optional[Dict[str, Callable]]:
+        """Returns coders registered for the class or for its base class, the result is cached per class"""
+        try:
+            return Serializer._coders_by_class[obj_cls]
+        except KeyError:
+            base_type = Serializer._get_base_type(obj_cls)
+            coders = Serializer.CODERS_BY_TYPE[base_type] if base_type is not None else None
+            Serializer._coders_by_class[obj_cls] = coders
+            return coders
+
     @staticmethod
     def _get_coder_by_type(coder_type: Type, coder_aim: str):
         return Serializer.CODERS_BY_TYPE[coder_type][coder_aim]
@@ -214,32 +247,46 @@ class Serializer(JSONEncoder, JSONDecoder):
         """
         if isfunction(obj) or ismethod(obj):
             return Serializer.dump_path_to_obj(obj)
-        base_type = Serializer._get_base_type(obj)
-        if base_type is not None:
-            encoded = Serializer._get_coder_by_type(base_type, Serializer._to_json)(obj)
+        obj_cls = obj if isclass(obj) else type(obj)
+        coders = Serializer._get_coders(obj_cls)
+        if coders is not None:
+            encoded = coders[Serializer._to_json](obj)
             if CLASS_PATH_KEY not in encoded:
-                encoded.update(Serializer.dump_path_to_obj(obj))
+                class_path = Serializer._class_paths.get(obj_cls)
+                if class_path is None:
+                    class_path = Serializer.dump_path_to_obj(obj)[CLASS_PATH_KEY]
+                    Serializer._class_paths[obj_cls] = class_path
+                encoded[CLASS_PATH_KEY] = class_path
             return encoded
 
         return JSONEncoder.default(self, obj)
 
     @staticmethod
-    def _get_class(json_obj: dict) -> Optional[Type[INSTANCE_OR_CALLABLE]]:
+    def _get_class(json_obj: dict, failed_imports: Optional[Set[str]] = None) -> Optional[Type[INSTANCE_OR_CALLABLE]]:
         """
         Gets the object type from the class_path
 
         :param class_path: full path (module + name) of the class
+        :param failed_imports: modules that failed to import earlier, it's updated with the new failures
 
         :return: class, function or method type
         """
         class_path = json_obj[CLASS_PATH_KEY]
+        obj_cls = Serializer._classes_by_path.get(class_path)
+        if obj_cls is not None:
+            return obj_cls
+        stored_class_path = class_path
         class_path = LEGACY_CLASS_PATHS.get(class_path, class_path)
         module_name, class_name = class_path.split(MODULE_X_NAME_DELIMITER)
         module_name = Serializer._legacy_module_map(module_name)
 
+        if failed_imports is not None and module_name in failed_imports:
+            return Serializer._import_as_base_class(json_obj)
         try:
             obj_cls = import_module(module_name)
         except ImportError as ex:
+            if failed_imports is not None:
+                failed_imports.add(module_name)
             obj_cls = Serializer._import_as_base_class(json_obj)
             if not obj_cls:
                 default_log('Serializer').info(
@@ -253,6 +300,8 @@ class Serializer(JSONEncoder, JSONDecoder):
 
         for sub in class_name.split('.'):
             obj_cls = getattr(obj_cls, sub)
+        # classes that weren't imported are resolved by the content of the object, so they aren't cached
+        Serializer._classes_by_path[stored_class_path] = obj_cls
         return obj_cls
 
     @staticmethod
@@ -279,21 +328,23 @@ class Serializer(JSONEncoder, JSONDecoder):
             return None
 
     @staticmethod
-    def object_hook(json_obj: Dict[str, Any]) -> Union[INSTANCE_OR_CALLABLE, dict]:
+    def object_hook(json_obj: Dict[str, Any],
+                    failed_imports: Optional[Set[str]] = None) -> Union[INSTANCE_OR_CALLABLE, dict]:
         """
         Decodes every JSON-object to python class/func object or just returns dict
 
         :param json_obj: dict[str, Any] to be decoded into Python class, function or
             method object only if it has some special fields
+        :param failed_imports: modules that failed to import earlier in the same decoding
 
         :return: Python class, function or method object OR input if it's just a regular dict
         """
         if CLASS_PATH_KEY in json_obj:
-            obj_cls = Serializer._get_class(json_obj)
+            obj_cls = Serializer._get_class(json_obj, failed_imports)
             del json_obj[CLASS_PATH_KEY]
-            base_type = Serializer._get_base_type(obj_cls)
-            if isclass(obj_cls) and base_type is not None:
-                coder = Serializer._get_coder_by_type(base_type, Serializer._from_json)
+            coders = Serializer._get_coders(obj_cls) if isclass(obj_cls) else None
+            if coders is not None:
+                coder = coders[Serializer._from_json]
                 # call with a right num of arguments
                 if Serializer._is_bound_method(coder):
                     return coder(json_obj)
@@ -306,17 +357,49 @@ class Serializer(JSONEncoder, JSONDecoder):
         return json_obj
 
 
-def default_save(obj: Any, json_file_path: Optional[Union[str, os.PathLike]] = None) -> Optional[str]:
-    """ Default save to json using Serializer """
+def default_save(obj: Any, json_file_path: Optional[Union[str, os.PathLike]] = None,
+                 backend: str = 'json') -> Optional[Union[str, bytes]]:
+    """ Default save using Serializer
+
+    Args:
+        obj: object to be saved
+        json_file_path: path to the file, if None then the serialized object is returned
+        backend: format of the saved object, one of :data:`SERIALIZATION_BACKENDS`:
+         ``'json'`` -- indented json (by default), ``'json_compact'`` -- json without indents
+         that is encoded much faster, ``'msgpack'`` -- binary msgpack format (requires ``msgpack`` package)
+    """
+    _check_backend(backend)
+    if backend == 'msgpack':
+        data = msgpack.packb(obj, default=Serializer().default, use_bin_type=True)
+        if json_file_path is None:
+            return data
+        with open(json_file_path, mode='wb') as binary_file:
+            binary_file.write(data)
+        return None
+
+    indent = 4 if backend == 'json' else None
     if json_file_path is None:
-        return json.dumps(obj, indent=4, cls=Serializer)
+        return json.dumps(obj, indent=indent, cls=Serializer)
     with open(json_file_path, mode='w') as json_file:
-        json.dump(obj, json_file, indent=4, cls=Serializer)
+        json.dump(obj, json_file, indent=indent, cls=Serializer)
         return None
 
 
-def default_load(json_str_or_file_path: Union[str, os.PathLike]) -> Any:
-    """ Default load from json using Serializer """
+def default_load(json_str_or_file_path: Union[str, bytes, os.PathLike], backend: str = 'json') -> Any:
+    """ Default load using Serializer
+
+    Args:
+        json_str_or_file_path: serialized object or path to the file with it
+        backend: format of the saved object (see :func:`default_save`), both json formats are loaded by ``'json'``
+    """
+
+    _check_backend(backend)
+    if backend == 'msgpack':
+        data = json_str_or_file_path
+        if not isinstance(data, bytes):
+            with open(data, mode='rb') as binary_file:
+                data = binary_file.read()
+        return msgpack.unpackb(data, object_hook=Serializer().object_hook, raw=False, strict_map_key=False)
 
     def load_as_file_path():
         with open(json_str_or_file_path, mode='r') as json_file:
@@ -334,6 +417,13 @@ def default_load(json_str_or_file_path: Union[str, os.PathLike]) -> Any:
         return load_as_file_path()
 
 
+def _check_backend(backend: str):
+    if backend not in SERIALIZATION_BACKENDS:
+        raise ValueError(f'Unknown serialization backend {backend}. Use one of: {SERIALIZATION_BACKENDS}')
+    if backend == 'msgpack' and msgpack is None:
+        warn_requirement('msgpack', 'other_requirements/serialization.txt', should_raise=True)
+
+
 def register_serializable(cls: Optional[Type[INSTANCE_OR_CALLABLE]] = None,
                           to_json: Optional[EncodeCallable] = None,
                           from_json: Optional[DecodeCallable] = None,
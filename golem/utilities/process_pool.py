@@ -0,0 +1,243 @@
+import queue
+import time
+from collections import deque
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, Future, TimeoutError, wait
+from itertools import count
+from typing import Any, Callable, Collection, Deque, Dict, Optional, Set, Tuple
+
+from joblib.externals.loky import ProcessPoolExecutor
+from joblib.externals.loky.backend.context import get_context
+from joblib.externals.loky.process_executor import BrokenProcessPool
+
+from golem.core.log import default_log
+
+# period of checking the start of the tasks that are sent to the workers but aren't started yet
+START_POLLING_INTERVAL = 0.1
+
+_Task = Tuple[Callable, tuple, dict, Optional[float]]
+
+# queue for notifications about the start of the tasks, set in the worker processes
+_started_tasks_queue: Optional[queue.Queue] = None
+
+
+def _init_worker(started_tasks_queue, initializer: Optional[Callable], initargs: tuple):
+    global _started_tasks_queue
+    _started_tasks_queue = started_tasks_queue
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _run_task(task_id: int, fn: Callable, *args, **kwargs) -> Any:
+    # task is started only after the worker was started and imported everything required for it,
+    # so the time limit doesn't include this overhead
+    _started_tasks_queue.put((task_id, time.time()))
+    return fn(*args, **kwargs)
+
+
+class TaskTimeoutError(TimeoutError):
+    """Raised for the task that was running longer than the time limit of the pool."""
+
+    def __init__(self, task_timeout: float):
+        super().__init__(f'Task was running longer than {task_timeout} seconds and was terminated.')
+        self.task_timeout = task_timeout
+
+
+class _RunningTask:
+    def __init__(self, future: Future, task: _Task):
+        self.future = future
+        self.task = task
+        self.start_time: Optional[float] = None
+
+    @property
+    def timeout(self) -> Optional[float]:
+        return self.task[-1]
+
+    @property
+    def deadline(self) -> Optional[float]:
+        if self.start_time is None or self.timeout is None:
+            return None
+        return self.start_time + self.timeout
+
+
+class TimeoutProcessPool:
+    """Pool of worker processes with hard wall-clock time limit for each task.
+
+    Task that runs longer than ``task_timeout`` can't be interrupted inside the worker,
+    so the pool kills all its workers and starts the new ones. The future of the stuck task gets
+    :class:`TaskTimeoutError`, other running tasks are restarted from the start on the new workers
+    transparently for the caller, so each timeout costs the work already done by all running tasks.
+    Time limit is counted from the actual start of the task in the worker,
+    so it doesn't include start of the worker processes.
+
+    Workers are started on the first submitted task and are reused until ``shutdown``,
+    so the state that is common for all tasks can be sent to each worker only once with ``initializer``.
+    Futures returned by ``submit`` advance only inside ``wait`` of the pool.
+
+    Args:
+        n_workers: number of worker processes. With one worker and without time limit
+         tasks are executed right away in the calling process.
+        task_timeout: max running time of each task in seconds, if None then tasks are not limited.
+        initializer: function that is called once in each started worker process,
+         it isn't called when tasks are executed in the calling process.
+        initargs: arguments for ``initializer``
+    """
+
+    def __init__(self, n_workers: int = 1, task_timeout: Optional[float] = None,
+                 initializer: Optional[Callable] = None, initargs: tuple = ()):
+        self.n_workers = n_workers
+        self.task_timeout = task_timeout
+        self.initializer = initializer
+        self.initargs = initargs
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._started_tasks_queue = None
+        self._task_ids = count()
+        self._pending: Deque[Tuple[Future, _Task]] = deque()
+        self._running: Dict[int, _RunningTask] = {}
+        self._running_futures: Dict[Future, int] = {}
+        self._log = default_log(self)
+
+    @property
+    def is_in_process(self) -> bool:
+        return self.n_workers == 1 and self.task_timeout is None
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """Schedules ``fn(*args, **kwargs)`` to be executed and returns its future."""
+        return self.submit_with_timeout(self.task_timeout, fn, *args, **kwargs)
+
+    def submit_with_timeout(self, task_timeout: Optional[float], fn: Callable, *args, **kwargs) -> Future:
+        """Same as ``submit``, but with the specific time limit for the task (e.g. proportional to its size).
+        The limit is ignored if the pool executes tasks in the calling process."""
+        future = Future()
+        if self.is_in_process:
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except Exception as ex:
+                future.set_exception(ex)
+        else:
+            self._pending.append((future, (fn, args, kwargs, task_timeout)))
+        return future
+
+    def wait(self, futures: Collection[Future], timeout: Optional[float] = None,
+             return_when: str = ALL_COMPLETED) -> Set[Future]:
+        """Waits for the futures submitted to this pool and enforces time limit of the running tasks.
+
+        Args:
+            futures: futures returned by ``submit``
+            timeout: max number of seconds to wait, if None then there is no limit
+            return_when: ``concurrent.futures.FIRST_COMPLETED`` or ``concurrent.futures.ALL_COMPLETED``
+
+        Returns:
+            futures that are done
+        """
+        deadline = time.time() + timeout if timeout is not None else None
+        while True:
+            self._update()
+            done = {future for future in futures if future.done()}
+            if len(done) == len(futures) or (done and return_when == FIRST_COMPLETED) or not self._running:
+                return done
+            wait_time = self._time_to_next_check()
+            if deadline is not None:
+                time_left = deadline - time.time()
+                if time_left <= 0:
+                    return done
+                wait_time = min(wait_time, time_left) if wait_time is not None else time_left
+            wait(self._running_futures, timeout=wait_time, return_when=FIRST_COMPLETED)
+
+    def shutdown(self):
+        """Cancels not finished tasks and terminates workers."""
+        for future, _ in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._running.clear()
+        self._running_futures.clear()
+        self._restart_executor(start_new=False)
+
+    def _update(self):
+        self._receive_started_tasks()
+        now = time.time()
+        need_restart = False
+        for inner_future, task_id in list(self._running_futures.items()):
+            running_task = self._running[task_id]
+            if inner_future.done():
+                self._remove_running(inner_future)
+                exception = inner_future.exception()
+                if isinstance(exception, BrokenProcessPool):
+                    # workers crashed, new ones must be started
+                    need_restart = True
+                if exception is not None:
+                    running_task.future.set_exception(exception)
+                else:
+                    running_task.future.set_result(inner_future.result())
+            elif running_task.deadline is not None and now > running_task.deadline:
+                self._remove_running(inner_future)
+                running_task.future.set_exception(TaskTimeoutError(running_task.timeout))
+                need_restart = True
+        if need_restart:
+            self._restart_executor()
+        self._start_pending()
+
+    def _receive_started_tasks(self):
+        if self._started_tasks_queue is None:
+            return
+        while True:
+            try:
+                task_id, start_time = self._started_tasks_queue.get_nowait()
+            except queue.Empty:
+                return
+            if task_id in self._running:
+                self._running[task_id].start_time = start_time
+
+    def _start_pending(self):
+        while self._pending and len(self._running) < self.n_workers:
+            future, task = self._pending.popleft()
+            # restarted tasks are already running
+            if not future.running() and not future.set_running_or_notify_cancel():
+                continue
+            fn, args, kwargs, _ = task
+            if self._executor is None:
+                self._started_tasks_queue = get_context().Queue()
+                self._executor = ProcessPoolExecutor(max_workers=self.n_workers, initializer=_init_worker,
+                                                     initargs=(self._started_tasks_queue,
+                                                               self.initializer, self.initargs))
+            task_id = next(self._task_ids)
+            inner_future = self._executor.submit(_run_task, task_id, fn, *args, **kwargs)
+            self._running[task_id] = _RunningTask(future, task)
+            self._running_futures[inner_future] = task_id
+
+    def _remove_running(self, inner_future: Future):
+        task_id = self._running_futures.pop(inner_future)
+        del self._running[task_id]
+
+    def _restart_executor(self, start_new: bool = True):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, kill_workers=True)
+            self._executor = None
+            self._started_tasks_queue = None
+        if start_new and self._running:
+            # restart tasks that were interrupted by the termination of workers
+            interrupted = list(self._running.values())
+            self._running.clear()
+            self._running_futures.clear()
+            self._log.debug(f'Restarting {len(interrupted)} tasks interrupted by termination of workers.')
+            for running_task in reversed(interrupted):
+                self._pending.appendleft((running_task.future, running_task.task))
+
+    def _time_to_next_check(self) -> Optional[float]:
+        limited_tasks = [task for task in self._running.values() if task.timeout is not None]
+        if not limited_tasks:
+            return None
+        if any(task.start_time is None for task in limited_tasks):
+            return START_POLLING_INTERVAL
+        return max(min(task.deadline for task in limited_tasks) - time.time(), 0.)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # workers and tasks are not transferred between processes
+        state = self.__dict__.copy()
+        state['_executor'] = None
+        state['_started_tasks_queue'] = None
+        state['_task_ids'] = count()
+        state['_pending'] = deque()
+        state['_running'] = {}
+        state['_running_futures'] = {}
+        return state
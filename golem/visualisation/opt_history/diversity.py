@@ -5,6 +5,7 @@ import numpy as np
 from matplotlib import pyplot as plt
 from matplotlib.animation import FuncAnimation
 
+from golem.core.optimisers.fitness import PopulationFitness
 from golem.core.optimisers.genetic.operators.operator import PopulationT
 from golem.visualisation.opt_history.history_visualization import HistoryVisualization
 from golem.visualisation.opt_history.utils import show_or_save_figure
@@ -30,8 +31,8 @@ class DiversityPopulation(HistoryVisualization):
 
 def compute_fitness_diversity(population: PopulationT) -> np.ndarray:
     """Returns numpy array of standard deviations of fitness values."""
-    # substitutes None values
-    fitness_values = np.array([ind.fitness.values for ind in population], dtype=float)
+    # None values are substituted with nan-s
+    fitness_values = PopulationFitness.of(population).values
     # compute std along each axis while ignoring nan-s
     diversity = np.nanstd(fitness_values, axis=0)
     return diversity
@@ -44,10 +45,10 @@ def plot_diversity_dynamic_gif(history: 'OptHistory',
                                dpi: int = 100,
                                ) -> FuncAnimation:
     metric_names = history.objective.metric_names
-    # dtype=float removes None, puts np.nan
+    # None values are substituted with nan-s
     # indexed by [population, metric, individual] after transpose (.T)
     pops = history.generations[1:-1]  # ignore initial pop and final choices
-    fitness_distrib = [np.array([ind.fitness.values for ind in pop], dtype=float).T
+    fitness_distrib = [PopulationFitness.of(pop).values.T
                        for pop in pops]
 
     # Define bounds on metrics: find min & max on a flattened view of array
@@ -104,7 +105,7 @@ def plot_diversity_dynamic(history: 'OptHistory',
     np_history = np.array([compute_fitness_diversity(pop) for pop in h])
     ys = {label: np_history[:, i] for i, label in enumerate(labels)}
     # Compute number of unique individuals, plot
-    ratio_unique = [len(set(ind.graph.descriptive_id for ind in pop)) / len(pop) for pop in h]
+    ratio_unique = [len(set(ind.graph.structural_hash for ind in pop)) / len(pop) for pop in h]
 
     fig, ax = plt.subplots()
     fig.suptitle('Population diversity')
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import itertools
 import os
 from pathlib import Path
 from textwrap import wrap
 from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Union
 
+import numpy as np
 import pandas as pd
 from matplotlib import pyplot as plt
 
 from golem.core.log import default_log
+from golem.core.optimisers.opt_history_objects.opt_history_table import OptHistoryTable
 
 if TYPE_CHECKING:
     from golem.core.optimisers.opt_history_objects.opt_history import OptHistory
@@ -21,32 +24,22 @@ TagOperationsMap = Dict[str, List[str]]
 
 def get_history_dataframe(history: OptHistory, best_fraction: Optional[float] = None,
                           tags_map: Optional[TagOperationsMap] = None):
+    table = OptHistoryTable.from_history(history)
+    # Resolving individuals with the same uid
+    uid_counts = pd.Series(table.uid).groupby(table.uid).cumcount().astype(str)
+    individuals = np.char.add(np.char.add(table.uid, '_'), uid_counts.to_numpy(dtype=str))
+    nodes_num = [len(nodes) for nodes in table.nodes]
     history_data = {
-        'generation': [],
-        'individual': [],
-        'fitness': [],
-        'node': [],
+        'generation': np.repeat(table.generation, nodes_num),
+        'individual': np.repeat(individuals, nodes_num),
+        'fitness': np.repeat(np.abs(table.fitness[:, 0]), nodes_num),
+        'node': list(itertools.chain.from_iterable(table.nodes)),
     }
     if tags_map:
-        history_data['tag'] = []
         new_map = {}
         for tag, operations in tags_map.items():
             new_map.update({operation: tag for operation in operations})
-        tags_map = new_map
-
-    uid_counts = {}  # Resolving individuals with the same uid
-    for gen_num, gen in enumerate(history.generations):
-        for ind in gen:
-            uid_counts[ind.uid] = uid_counts.get(ind.uid, -1) + 1
-            for node in ind.graph.nodes:
-                history_data['generation'].append(gen_num)
-                history_data['individual'].append('_'.join([ind.uid, str(uid_counts[ind.uid])]))
-                fitness = abs(ind.fitness.value)
-                history_data['fitness'].append(fitness)
-                history_data['node'].append(str(node))
-                if not tags_map:
-                    continue
-                history_data['tag'].append(tags_map.get(str(node), None))
+        history_data['tag'] = [new_map.get(node, None) for node in history_data['node']]
 
     df_history = pd.DataFrame.from_dict(history_data)
 
@@ -59,12 +52,9 @@ def get_history_dataframe(history: OptHistory, best_fraction: Optional[float] =
         df_individuals['rank_per_generation'] = df_individuals.sort_values('fitness', ascending=False). \
             groupby('generation').cumcount()
 
-        best_individuals = df_individuals[
-            df_individuals.apply(
-                lambda row: row['rank_per_generation'] < generation_sizes[row['generation']] * best_fraction,
-                axis='columns'
-            )
-        ]['individual']
+        is_best = df_individuals['rank_per_generation'] < \
+            df_individuals['generation'].map(generation_sizes) * best_fraction
+        best_individuals = df_individuals[is_best]['individual']
 
         df_history = df_history[df_history['individual'].isin(best_individuals)]
 
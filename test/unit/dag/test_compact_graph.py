@@ -0,0 +1,63 @@
+import pickle
+
+import pytest
+
+from golem.core.dag.compact_graph import CompactGraph, decode_graph, encode_graph
+from golem.core.dag.graph_delegate import GraphDelegate
+from golem.core.dag.linked_graph import LinkedGraph
+from golem.core.dag.linked_graph_node import LinkedGraphNode
+from test.unit.utils import graph_first, graph_fifth, branched_cycled_graph, joined_branches_graph
+
+
+class GraphWithState(GraphDelegate):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.state = 'some_state'
+
+
+@pytest.mark.parametrize('graph', [graph_first(), graph_fifth(), branched_cycled_graph(), joined_branches_graph(),
+                                   LinkedGraph(joined_branches_graph().nodes), GraphDelegate()])
+def test_compact_graph_restores_same_graph(graph):
+    for node in graph.nodes:
+        node.parameters = {'param': len(node.nodes_from)}
+
+    encoded = encode_graph(graph)
+    restored = decode_graph(pickle.loads(pickle.dumps(encoded)))
+
+    assert isinstance(encoded, CompactGraph)
+    assert type(restored) is type(graph)
+    assert restored.descriptive_id == graph.descriptive_id
+    for node, restored_node in zip(graph.nodes, restored.nodes):
+        assert type(restored_node) is type(node)
+        assert restored_node.uid == node.uid
+        assert restored_node.content == node.content
+        assert [parent.uid for parent in restored_node.nodes_from] == [parent.uid for parent in node.nodes_from]
+    # parameters of the restored nodes are not shared
+    if restored.nodes:
+        restored.nodes[0].parameters['param'] = -1
+        assert all(node.parameters['param'] != -1 for node in restored.nodes[1:])
+
+
+def test_compact_graph_is_smaller():
+    graph = graph_fifth()
+    assert len(pickle.dumps(encode_graph(graph))) < len(pickle.dumps(graph))
+
+
+def test_compact_graph_structure_comparison():
+    graph = graph_first()
+    encoded = CompactGraph(graph)
+    assert CompactGraph(decode_graph(encoded)).has_same_structure(encoded)
+
+    graph.nodes[0].parameters = {'param': 1}
+    assert not CompactGraph(graph).has_same_structure(encoded)
+
+    graph = graph_first()
+    graph.connect_nodes(graph.nodes[0], graph.nodes[1])
+    assert not CompactGraph(graph).has_same_structure(encoded)
+
+
+def test_not_encodable_graph_is_transferred_as_is():
+    graph = GraphWithState(LinkedGraphNode('a'))
+    assert not CompactGraph.is_encodable(graph)
+    assert encode_graph(graph) is graph
+    assert decode_graph(graph) is graph
@@ -1,3 +1,5 @@
+import json
+import pickle
 from copy import copy, deepcopy
 from random import seed
 
@@ -8,6 +10,8 @@ from golem.core.dag.graph import Graph, ReconnectType
 from golem.core.dag.graph_delegate import GraphDelegate
 from golem.core.dag.linked_graph import LinkedGraph
 from golem.core.dag.linked_graph_node import LinkedGraphNode
+from golem.core.dag.structure_tracker import TrackedUniqueList
+from golem.serializers import Serializer
 from test.unit.utils import find_same_node, nodes_same
 
 seed(1)
@@ -325,3 +329,190 @@ def test_graph_deepcopy(graph: Graph):
 
 def _modify_graph_copy(graph: Graph):
     graph.root_node.content['name'] = 'n2'
+
+
+def test_node_children_after_direct_modifications():
+    first = GraphNode(content='n1')
+    second = GraphNode(content='n2', nodes_from=[first])
+    third = GraphNode(content='n3', nodes_from=[first])
+    final = GraphNode(content='n4', nodes_from=[second, third])
+    graph = GraphImpl(final)
+
+    assert graph.node_children(first) == [second, third]
+    assert graph.root_nodes() == [final]
+
+    # modifications bypassing the graph methods are seen by the graph
+    third.nodes_from.remove(first)
+    extra = GraphNode(content='n5', nodes_from=[first])
+    graph.nodes.append(extra)
+
+    assert graph.node_children(first) == [second, extra]
+    assert graph.node_children(third) == [final]
+    assert set(graph.root_nodes()) == {final, extra}
+
+    final.nodes_from = [second]
+    assert graph.node_children(third) == []
+
+
+def test_children_index_isnt_copied():
+    first = GraphNode(content='n1')
+    graph = GraphImpl(GraphNode(content='n2', nodes_from=[first]))
+    assert graph.node_children(first)
+
+    assert '_structure_cache' not in vars(graph)
+    assert '_structure_cache' not in vars(deepcopy(graph))
+    restored = pickle.loads(pickle.dumps(graph))
+    assert not hasattr(restored, '_structure_cache')
+    assert restored.node_children(restored.nodes[1]) == [restored.nodes[0]]
+
+
+def test_structural_properties_after_modifications():
+    first = GraphNode(content='n1')
+    second = GraphNode(content='n2', nodes_from=[first])
+    graph = GraphImpl(GraphNode(content='n3', nodes_from=[second]))
+    assert graph.depth == 3
+    assert not graph.has_cycle
+    initial_id = graph.descriptive_id
+
+    graph.nodes[0].nodes_from.remove(second)
+    graph.nodes[0].nodes_from.append(first)
+    assert graph.depth == 2
+    graph.nodes[0].nodes_from = [second]
+    assert graph.depth == 3
+    assert graph.descriptive_id == initial_id
+
+    first.content['name'] = 'n0'
+    assert graph.descriptive_id != initial_id
+    first.parameters = {'param': 1}
+    assert 'param' in graph.descriptive_id
+
+    first.nodes_from.append(graph.root_node)
+    assert graph.has_cycle
+    assert graph.depth == -1
+
+
+def test_copying_doesnt_invalidate_structural_properties():
+    graph = GraphImpl(GraphNode(content='n2', nodes_from=[GraphNode(content='n1')]))
+    assert graph.depth == 2
+    cache = graph._structure_cache
+
+    graph_copy = deepcopy(graph)
+    pickle.loads(pickle.dumps(graph))
+
+    assert graph_copy.descriptive_id == graph.descriptive_id
+    assert graph._structure_cache is cache
+    assert graph_copy.depth == graph.depth
+
+
+def test_modifications_of_other_graph_dont_invalidate_structural_properties():
+    graph = GraphImpl(GraphNode(content='n2', nodes_from=[GraphNode(content='n1')]))
+    other_graph = graph.clone()
+    assert graph.depth == 2
+    cache = graph._structure_cache
+
+    other_graph.root_node.parameters = {'param': 1}
+    other_graph.root_node.nodes_from.clear()
+    other_graph.add_node(GraphNode(content='n3'))
+
+    assert other_graph.depth == 1
+    assert graph.depth == 2
+    assert graph._structure_cache is cache
+
+
+def test_structural_properties_after_nested_params_modifications():
+    graph = GraphImpl(GraphNode(content={'name': 'n1', 'params': {'layers': [{'size': 1}]}}))
+    initial_hash = graph.structural_hash
+    initial_id = graph.descriptive_id
+
+    graph.root_node.content['params']['layers'][0]['size'] = 2
+    assert graph.structural_hash != initial_hash
+    assert graph.descriptive_id != initial_id
+
+    graph.root_node.content['params']['layers'][0]['size'] = 1
+    assert graph.structural_hash == initial_hash
+    graph.root_node.parameters['layers'].append({'size': 3})
+    assert graph.structural_hash != initial_hash
+    graph.root_node.parameters['layers'][-1]['size'] = 4
+    assert '4' in graph.descriptive_id
+
+    graph.root_node.content = {'name': 'n1', 'params': {'layers': []}}
+    assert graph.descriptive_id != initial_id
+    graph.root_node.parameters['layers'].append({'size': 1})
+    assert graph.structural_hash == initial_hash
+
+
+def test_nested_params_are_copied_on_assignment():
+    params = {'layers': [1]}
+    first = GraphNode(content={'name': 'n1', 'params': params})
+    second = GraphNode(content={'name': 'n2'})
+    second.content['params'] = first.content['params']
+    graph = GraphImpl(second)
+    graph_hash = graph.structural_hash
+
+    params['layers'].append(2)
+    first.parameters['layers'].append(3)
+
+    assert second.parameters == {'layers': [1]}
+    assert graph.structural_hash == graph_hash
+
+
+@pytest.mark.parametrize('graph', [GraphImpl(GraphNode(content='n2', nodes_from=[GraphNode(content='n1')])),
+                                   GraphDelegate(GraphNode(content='n2', nodes_from=[GraphNode(content='n1')]),
+                                                 delegate_cls=GraphImpl)])
+def test_graph_clone(graph: Graph):
+    graph.nodes[1].parameters = {'param': 1}
+    graph_clone = graph.clone()
+
+    assert type(graph_clone) is type(graph)
+    assert graph_clone.structural_hash == graph.structural_hash
+    assert [node.uid for node in graph_clone.nodes] == [node.uid for node in graph.nodes]
+    assert not set(map(id, graph_clone.nodes)) & set(map(id, graph.nodes))
+    assert graph_clone.nodes[0].nodes_from == [graph_clone.nodes[1]]
+    assert graph_clone.nodes[1].parameters == graph.nodes[1].parameters
+    assert graph_clone.nodes[1].parameters is not graph.nodes[1].parameters
+
+    graph_clone.nodes[1].parameters = {'param': 2}
+    graph_clone.nodes[0].content['name'] = 'n3'
+    graph_clone.add_node(GraphNode(content='n4', nodes_from=[graph_clone.nodes[0]]))
+
+    assert graph.nodes[1].parameters == {'param': 1}
+    assert graph.root_node.name == 'n2'
+    assert graph.length == 2
+
+
+def test_graph_clone_params_modified_in_place():
+    graph = GraphImpl(GraphNode(content={'name': 'n1', 'params': {'param': 1}}))
+    graph_hash = graph.structural_hash
+
+    graph_clone = graph.clone()
+    graph_clone.root_node.parameters['param'] = 2
+    graph_clone.root_node.content['params']['other_param'] = 3
+
+    assert graph.root_node.parameters == {'param': 1}
+    assert graph.structural_hash == graph_hash
+    assert graph_clone.root_node.parameters == {'param': 2, 'other_param': 3}
+
+
+def test_graph_clone_with_additional_state():
+    node = GraphNode(content='n1')
+    node.state = {'key': 'value'}
+    graph = GraphImpl(node)
+
+    graph_clone = graph.clone()
+
+    assert graph_clone.root_node.state == node.state
+    assert graph_clone.root_node.state is not node.state
+
+
+def test_graph_serialization_keeps_parents():
+    first = GraphNode(content='n1')
+    # nodes of the graphs produced by crossover can share uids
+    first_twin = GraphNode(content='n1')
+    first_twin.uid = first.uid
+    graph = GraphImpl(GraphNode(content='n2', nodes_from=[first, first_twin]))
+
+    dumped_graph = json.dumps(graph, cls=Serializer)
+    restored_graph = json.loads(dumped_graph, cls=Serializer)
+
+    assert json.dumps(restored_graph, cls=Serializer) == dumped_graph
+    assert all(isinstance(node.nodes_from, TrackedUniqueList) for node in restored_graph.nodes)
@@ -1,8 +1,11 @@
+from copy import deepcopy
+
 import pytest
 
 from golem.core.dag.graph_utils import distance_to_primary_level
 from golem.core.dag.graph_utils import nodes_from_layer, distance_to_root_level, ordered_subnodes_hierarchy, \
-    graph_has_cycle, node_depth
+    graph_has_cycle, node_depth, graph_structural_hash
+from golem.core.dag.linked_graph import LinkedGraph
 from golem.core.dag.linked_graph_node import LinkedGraphNode
 from test.unit.dag.test_graph_operator import graph
 from test.unit.utils import graph_first, simple_cycled_graph, branched_cycled_graph, graph_second, graph_third, \
@@ -97,3 +100,32 @@ def test_node_depth(graph, nodes_names, correct_depths):
     nodes = [graph.get_nodes_by_name(name)[0] for name in nodes_names]
     depths = node_depth(nodes)
     assert depths == correct_depths
+
+
+def test_graph_structural_hash():
+    graphs = [graph_first(), graph_second(), graph_third(), graph_fifth(), graph_with_multi_roots_first(),
+              joined_branches_graph(), simple_cycled_graph()]
+    hashes = [graph_structural_hash(graph) for graph in graphs]
+    assert len(set(hashes)) == len(graphs)
+    assert hashes[:-1] == [graph_structural_hash(deepcopy(graph)) for graph in graphs[:-1]]
+
+    # hash doesn't depend on the order of nodes and parents
+    graph = graph_first()
+    graph.nodes.reverse()
+    for node in graph.nodes:
+        node.nodes_from.reverse()
+    assert graph_structural_hash(graph) == hashes[0]
+
+    graph.nodes[0].parameters = {'param': 1}
+    assert graph_structural_hash(graph) != hashes[0]
+
+
+def test_graph_structural_hash_of_shared_ancestors():
+    # each node depends on the two previous ones, so the number of paths grows exponentially
+    nodes = [LinkedGraphNode('a'), LinkedGraphNode('b')]
+    for i in range(60):
+        nodes.append(LinkedGraphNode(str(i), nodes_from=nodes[-2:]))
+    graph = LinkedGraph(nodes[-1])
+
+    assert graph_structural_hash(graph) == graph.structural_hash
+    assert graph.structural_hash != LinkedGraph(nodes[-2]).structural_hash
@@ -1,8 +1,12 @@
+import networkx as nx
 import pytest
 
+from golem.core.dag.convert import graph_structure_as_nx_graph
+from golem.core.dag.graph_verifier import GraphVerifier, VerificationError
 from golem.core.dag.verification_rules import has_no_cycle, has_no_isolated_nodes, ERROR_PREFIX, \
     has_no_self_cycled_nodes, has_no_isolated_components
-from test.unit.mocks.common_mocks import MockNode, MockDomainStructure
+from golem.core.optimisers.optimizer import GraphGenerationParams
+from test.unit.mocks.common_mocks import MockAdapter, MockNode, MockDomainStructure
 from test.unit.utils import graph_first
 
 
@@ -73,3 +77,61 @@ def test_graph_with_isolated_components_raise_exception():
     with pytest.raises(Exception) as exc:
         assert has_no_isolated_components(graph)
     assert str(exc.value) == f'{ERROR_PREFIX} Graph has isolated components'
+
+
+@pytest.mark.parametrize('graph_fn', [graph_first, graph_with_cycle, graph_with_isolated_nodes,
+                                      graph_with_cycled_node, graph_with_isolated_components])
+def test_structural_facts_are_same_as_networkx(graph_fn):
+    graph = graph_fn()
+    nx_graph, node_labels = graph_structure_as_nx_graph(graph)
+
+    facts = graph.structural_facts
+
+    assert facts.has_cycle == (not nx.is_directed_acyclic_graph(nx_graph))
+    assert facts.components_num == nx.number_weakly_connected_components(nx_graph)
+    assert set(map(id, facts.isolated_nodes)) == {id(node_labels[label]) for label in nx.isolates(nx_graph)}
+    assert set(map(id, facts.root_nodes)) == set(map(id, graph.root_nodes()))
+    if not facts.has_cycle:
+        order = {id(node): i for i, node in enumerate(facts.topological_order)}
+        assert all(order[id(node_labels[parent])] < order[id(node_labels[child])]
+                   for parent, child in nx_graph.edges)
+
+
+def test_verifier_checks_identical_structures_once():
+    checked_graphs = []
+
+    def domain_rule(graph):
+        checked_graphs.append(graph)
+        return True
+
+    adapter = MockAdapter()
+    verifier = GraphVerifier([domain_rule, domain_rule, has_no_cycle], adapter=adapter, cache_size=10)
+
+    assert verifier(adapter.adapt(graph_first())) and verifier(adapter.adapt(graph_first()))
+    # the graph is restored once for both domain rules and the structurally identical graph isn't checked
+    assert len(checked_graphs) == 2 and checked_graphs[0] is checked_graphs[1]
+    assert isinstance(checked_graphs[0], MockDomainStructure)
+    assert not verifier(graph_with_cycle()) and not verifier(graph_with_cycle())
+
+
+def test_verifier_raises_on_cached_failure():
+    verifier = GraphVerifier([has_no_cycle], raise_on_failure=True, cache_size=10)
+    for _ in range(2):
+        with pytest.raises(VerificationError):
+            verifier(graph_with_cycle())
+
+
+def test_verifier_cache_is_opt_in():
+    checked_graphs = []
+
+    def domain_rule(graph):
+        checked_graphs.append(graph)
+        return True
+
+    verifier = GraphVerifier([domain_rule])
+    assert verifier(graph_first()) and verifier(graph_first())
+    assert len(checked_graphs) == 2
+
+    # the results are cached for the default rules only
+    assert GraphGenerationParams().verifier._cache_size > 0
+    assert GraphGenerationParams(rules_for_constraint=[domain_rule]).verifier._cache_size == 0
@@ -0,0 +1,72 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from golem.core.dag.linked_graph_node import LinkedGraphNode
+from golem.core.optimisers.fitness import MultiObjFitness, PopulationFitness, SingleObjFitness, null_fitness
+from golem.core.optimisers.graph import OptGraph
+from golem.core.optimisers.opt_history_objects.generation import Generation
+from golem.core.optimisers.opt_history_objects.individual import Individual
+
+
+def get_individuals(fitnesses):
+    individuals = []
+    for fitness in fitnesses:
+        ind = Individual(OptGraph(LinkedGraphNode('node')))
+        if fitness.valid:
+            ind.set_evaluation_result(fitness)
+        individuals.append(ind)
+    return individuals
+
+
+@pytest.mark.parametrize('fitnesses, expected_values', [
+    ([], np.empty((0, 0))),
+    ([SingleObjFitness(1.), SingleObjFitness(2.)], [[1.], [2.]]),
+    ([SingleObjFitness(1., 3.), null_fitness()], [[1., 3.], [np.nan, np.nan]]),
+    ([MultiObjFitness((1., 2.), weights=-1), MultiObjFitness((3., 4.))], [[-1., -2.], [3., 4.]]),
+])
+def test_population_fitness_values(fitnesses, expected_values):
+    individuals = get_individuals(fitnesses)
+    population_fitness = PopulationFitness(individuals)
+
+    assert len(population_fitness) == len(individuals)
+    assert np.array_equal(population_fitness.values, np.array(expected_values), equal_nan=True)
+    assert list(population_fitness.valid) == [fitness.valid for fitness in fitnesses]
+    assert not population_fitness.values.flags.writeable
+    for ind, values in zip(individuals, population_fitness.values):
+        if ind.fitness.valid:
+            assert tuple(values[:len(ind.fitness.values)]) == tuple(ind.fitness.values)
+
+
+def test_population_fitness_objective_values():
+    fitnesses = [MultiObjFitness((1., 2.)), MultiObjFitness((3., 4.))]
+    population_fitness = PopulationFitness(get_individuals(fitnesses))
+
+    assert population_fitness.is_multi_objective
+    assert population_fitness.num_objectives == 2
+    assert list(population_fitness.objective_values(1)) == [2., 4.]
+    assert np.isnan(population_fitness.objective_values(2)).all()
+
+
+def test_generation_caches_fitness_store():
+    individuals = get_individuals([SingleObjFitness(1.), SingleObjFitness(2.)])
+    generation = Generation(individuals, 0)
+
+    store = generation.fitness_store
+    assert generation.fitness_store is store
+    assert PopulationFitness.of(generation) is store
+    assert '_fitness_store' not in vars(pickle.loads(pickle.dumps(generation)))
+
+    generation.append(get_individuals([SingleObjFitness(3.)])[0])
+    assert generation.fitness_store is not store
+    assert list(generation.fitness_store.objective_values(0)) == [1., 2., 3.]
+
+
+def test_generation_does_not_cache_store_of_not_evaluated_individuals():
+    individuals = get_individuals([SingleObjFitness(1.), null_fitness()])
+    generation = Generation(individuals, 0)
+
+    assert not generation.fitness_store.all_valid
+    individuals[1].set_evaluation_result(SingleObjFitness(2.))
+    assert list(generation.fitness_store.objective_values(0)) == [1., 2.]
@@ -1,4 +1,5 @@
 import random
+from datetime import timedelta
 from math import ceil
 from typing import Optional
 
@@ -7,6 +8,7 @@ import pytest
 
 from examples.synthetic_graph_evolution.generators import generate_labeled_graph
 from golem.core.adapter.nx_adapter import BaseNetworkxAdapter
+from golem.core.optimisers.genetic.evaluation import MultiprocessingDispatcher
 from golem.core.optimisers.genetic.gp_params import GPAlgorithmParameters
 from golem.core.optimisers.genetic.operators.base_mutations import MutationTypesEnum
 from golem.core.optimisers.genetic.operators.crossover import Crossover, CrossoverTypesEnum
@@ -39,9 +41,9 @@ class MockEvaluator(EvaluationOperator):
         return graph if is_valid else None
 
 
-def get_rand_population(pop_size: int = 10) -> PopulationT:
+def get_rand_population(pop_size: int = 10, kind: str = 'tree') -> PopulationT:
     graph_sizes = list(range(5, 15))
-    random_pop = [generate_labeled_graph('tree', size=random.choice(graph_sizes),
+    random_pop = [generate_labeled_graph(kind, size=random.choice(graph_sizes),
                                          directed=True)
                   for _ in range(pop_size)]
     graph_pop = BaseNetworkxAdapter().adapt(random_pop)
@@ -129,3 +131,189 @@ def test_pop_size_progression(reproducer: ReproductionController, success_rate:
 
         # update pop size
         parameters.pop_size = pop_size_progress.next(pop)
+
+
+def test_filter_evaluated_duplicates(reproducer: ReproductionController):
+    reproducer.parameters.filter_evaluated_duplicates = True
+    evaluated_structures = []
+
+    def evaluator(pop: PopulationT) -> PopulationT:
+        evaluated_structures.extend(ind.graph.structural_hash for ind in pop)
+        return pop
+
+    pop = get_rand_population(reproducer.parameters.pop_size, kind='dag')
+    initial_structures = {ind.graph.structural_hash for ind in pop}
+    for i in range(5):
+        pop = reproducer.reproduce(pop, evaluator)
+
+    # each structure is evaluated only once during the run
+    assert len(evaluated_structures) == len(set(evaluated_structures))
+    assert not initial_structures.intersection(evaluated_structures)
+
+
+def test_filter_evaluated_duplicates_after_evaluation(reproducer: ReproductionController):
+    reproducer.parameters.filter_evaluated_duplicates = True
+    pop = get_rand_population(reproducer.parameters.pop_size, kind='dag')
+    structures = {ind.graph.structural_hash for ind in pop}
+    reproducer.produce_offspring = lambda population, pop_size=None: [Individual(ind.graph.clone()) for ind in pop]
+
+    # structures of the failed individuals aren't remembered
+    assert reproducer.reproduce_uncontrolled(pop, lambda population: []) == []
+    evaluated = reproducer.reproduce_uncontrolled(pop, lambda population: population)
+    assert {ind.graph.structural_hash for ind in evaluated} == structures
+    assert len(evaluated) == len(structures)
+    assert reproducer.reproduce_uncontrolled(pop, lambda population: population) == []
+
+
+def test_filter_evaluated_duplicates_keeps_recent_structures(reproducer: ReproductionController):
+    reproducer = ReproductionController(reproducer.parameters, reproducer.selection,
+                                        reproducer.mutation, reproducer.crossover, max_evaluated_structures=2)
+    reproducer.parameters.filter_evaluated_duplicates = True
+    pop = get_rand_population(3, kind='dag')
+    reproducer.produce_offspring = lambda population, pop_size=None: [Individual(ind.graph.clone()) for ind in pop]
+    evaluated = reproducer.reproduce_uncontrolled(pop, lambda population: population)
+    assert len(evaluated) == len(pop)
+
+    # only the structure evaluated first is forgotten
+    evaluated_again = reproducer.reproduce_uncontrolled(pop, lambda population: population)
+    assert [ind.graph.structural_hash for ind in evaluated_again] == [pop[0].graph.structural_hash]
+
+
+class MockAsyncDispatcher:
+    def __init__(self, success_prob: float = 1.0, max_in_flight: int = 4):
+        self.success_prob = success_prob
+        self.max_in_flight = max_in_flight
+        self.in_flight = []
+        self.submitted_num = 0
+
+    @property
+    def num_in_flight(self) -> int:
+        return len(self.in_flight)
+
+    def submit(self, individuals: PopulationT) -> PopulationT:
+        self.in_flight.extend(individuals)
+        self.submitted_num += len(individuals)
+        return []
+
+    def collect(self) -> PopulationT:
+        finished, self.in_flight = self.in_flight[:1], self.in_flight[1:]
+        return [ind for ind in finished if random.random() < self.success_prob]
+
+
+@pytest.mark.parametrize('success_rate', [0.5, 1.0])
+def test_steady_state_reproduction(reproducer: ReproductionController, success_rate: float):
+    parameters = reproducer.parameters
+    dispatcher = MockAsyncDispatcher(success_rate)
+    pop = get_rand_population(parameters.pop_size)
+    for i in range(10):
+        pop = reproducer.reproduce_steady_state(pop, dispatcher)
+        assert len(pop) == parameters.pop_size
+        assert dispatcher.num_in_flight <= dispatcher.max_in_flight
+
+    assert np.isclose(reproducer.mean_success_rate, success_rate, rtol=0.25)
+
+
+def test_steady_state_too_little_valid_evals(reproducer: ReproductionController):
+    dispatcher = MockAsyncDispatcher(success_prob=0.)
+    pop = get_rand_population(reproducer.parameters.pop_size)
+
+    with pytest.raises(EvaluationAttemptsError):
+        reproducer.reproduce_steady_state(pop, dispatcher)
+
+
+def test_steady_state_reproduction_with_single_slot(reproducer: ReproductionController):
+    parameters = reproducer.parameters
+    crossover = reproducer.crossover
+    crossover_inputs_sizes = []
+
+    def crossover_spy(population: PopulationT) -> PopulationT:
+        crossover_inputs_sizes.append(len(population))
+        return crossover(population)
+
+    reproducer.crossover = crossover_spy
+    dispatcher = MockAsyncDispatcher(max_in_flight=1)
+    pop = reproducer.reproduce_steady_state(get_rand_population(parameters.pop_size, kind='dag'), dispatcher)
+
+    assert len(pop) == parameters.pop_size
+    # offspring is produced for several slots at once, so crossover gets pairs of parents
+    assert crossover_inputs_sizes
+    assert all(size >= 2 for size in crossover_inputs_sizes)
+
+
+def test_steady_state_stops_if_no_offspring(reproducer: ReproductionController):
+    reproducer.mutation = lambda population: []
+    dispatcher = MockAsyncDispatcher()
+    pop = get_rand_population(reproducer.parameters.pop_size, kind='dag')
+
+    with pytest.raises(EvaluationAttemptsError):
+        reproducer.reproduce_steady_state(pop, dispatcher)
+
+
+@pytest.mark.parametrize('success_rate', [0.5, 1.0])
+def test_streaming_reproduction(reproducer: ReproductionController, success_rate: float):
+    parameters = reproducer.parameters
+    required_size = parameters.pop_size * parameters.required_valid_ratio
+    pop = get_rand_population(parameters.pop_size, kind='dag')
+    for i in range(10):
+        dispatcher = MockAsyncDispatcher(success_rate)
+        pop = reproducer.reproduce_streaming(pop, dispatcher)
+        assert required_size <= len(pop) <= parameters.pop_size
+
+    assert np.isclose(reproducer.mean_success_rate, success_rate, rtol=0.25)
+
+
+def test_streaming_reproduction_stops_on_required_size(reproducer: ReproductionController):
+    parameters = reproducer.parameters
+    dispatcher = MockAsyncDispatcher()
+    pop = get_rand_population(parameters.pop_size, kind='dag')
+
+    pop = reproducer.reproduce_streaming(pop, dispatcher)
+
+    # offspring is produced only for the free evaluation slots until enough individuals are collected
+    assert len(pop) == ceil(parameters.pop_size * parameters.required_valid_ratio)
+    assert dispatcher.submitted_num < len(pop) + dispatcher.max_in_flight
+
+
+def test_streaming_too_little_valid_evals(reproducer: ReproductionController):
+    dispatcher = MockAsyncDispatcher(success_prob=0.)
+    pop = get_rand_population(reproducer.parameters.pop_size, kind='dag')
+
+    with pytest.raises(EvaluationAttemptsError):
+        reproducer.reproduce_streaming(pop, dispatcher)
+
+
+def produce_offspring_in_workers(graph_eval_timeout: Optional[timedelta] = None, seed: int = 1):
+    params = GPAlgorithmParameters(pop_size=20, parallel_reproduction=True,
+                                   crossover_types=[CrossoverTypesEnum.subtree])
+    graph_gen_params = GraphGenerationParams(available_node_types=['x', 'y', 'z'])
+    requirements = GraphRequirements()
+    # with time limit the dispatcher uses worker processes even with one job
+    dispatcher = MultiprocessingDispatcher(graph_gen_params.adapter, graph_eval_timeout=graph_eval_timeout)
+    reproducer = ReproductionController(params, Selection(params, requirements),
+                                        Mutation(params, requirements, graph_gen_params),
+                                        Crossover(params, requirements, graph_gen_params),
+                                        dispatcher=dispatcher)
+    random.seed(seed)
+    np.random.seed(seed)
+    pop = get_rand_population(params.pop_size, kind='dag')
+    for ind in pop:
+        ind.set_native_generation(0)
+    try:
+        offspring = reproducer.produce_offspring(pop)
+    finally:
+        dispatcher.shutdown()
+    return pop, offspring
+
+
+def test_parallel_reproduction():
+    _, offspring = produce_offspring_in_workers()
+    pop, offspring_from_workers = produce_offspring_in_workers(graph_eval_timeout=timedelta(minutes=1))
+
+    # offspring is the same in the main process and in the workers
+    assert offspring
+    assert ([ind.graph.descriptive_id for ind in offspring] ==
+            [ind.graph.descriptive_id for ind in offspring_from_workers])
+    # offspring refers to the original parents, not to their copies from the workers
+    pop_ids = set(map(id, pop))
+    for ind in offspring_from_workers:
+        assert id(ind) in pop_ids or all(id(parent) in pop_ids for parent in ind.parents_from_prev_generation)
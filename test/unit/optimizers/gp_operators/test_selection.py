@@ -1,7 +1,13 @@
+import numpy as np
+import pytest
+
 from golem.core.adapter import DirectAdapter
+from golem.core.optimisers.fitness import MultiObjFitness
+from golem.core.optimisers.fitness.non_dominated_sorting import crowding_distance, fast_non_dominated_sort
 from golem.core.optimisers.genetic.gp_params import GPAlgorithmParameters
 from golem.core.optimisers.genetic.operators.operator import PopulationT
-from golem.core.optimisers.genetic.operators.selection import Selection, SelectionTypesEnum, random_selection
+from golem.core.optimisers.genetic.operators.selection import Selection, SelectionTypesEnum, random_selection, \
+    spea2_selection, tournament_selection, _spea2_selection_loop
 from golem.core.optimisers.opt_history_objects.individual import Individual
 from test.unit.optimizers.test_evaluation import get_objective
 from test.unit.utils import graph_first, graph_second, graph_third, graph_fourth, graph_fifth
@@ -72,3 +78,97 @@ def test_custom_selection():
     selected_individuals = selection(population)
     assert (all([ind in population for ind in selected_individuals]) and
             len(selected_individuals) == num_of_inds)
+
+
+def get_multi_objective_population(fitness_values: np.ndarray) -> PopulationT:
+    adapter = DirectAdapter()
+    population = []
+    for values in fitness_values:
+        ind = Individual(adapter.adapt(graph_first()))
+        ind.set_evaluation_result(MultiObjFitness(tuple(values), weights=-1.))
+        population.append(ind)
+    return population
+
+
+@pytest.mark.parametrize('pop_size, num_of_objectives, discrete',
+                         [(10, 2, False), (40, 2, True), (5, 3, False), (30, 3, True), (25, 1, False)])
+def test_spea2_selection_is_same_as_original(pop_size, num_of_objectives, discrete):
+    rng = np.random.default_rng(1)
+    fitness_values = rng.random((50, num_of_objectives))
+    if discrete:
+        # many equal distances and fitnesses
+        fitness_values = np.round(fitness_values * 5)
+    population = get_multi_objective_population(fitness_values)
+
+    selected_individuals = spea2_selection(population, pop_size)
+
+    assert selected_individuals == _spea2_selection_loop(population, pop_size)
+    assert len(selected_individuals) == pop_size
+
+
+def test_spea2_selection_with_single_objective():
+    population = get_population()
+    selected_individuals = spea2_selection(population, 3)
+    assert selected_individuals == _spea2_selection_loop(population, 3)
+
+
+def test_fast_non_dominated_sort():
+    fitness_matrix = np.array([[1, 5], [2, 2], [5, 1], [2, 3], [3, 3], [4, 4], [1, 5]])
+    fronts = fast_non_dominated_sort(fitness_matrix)
+    assert [front.tolist() for front in fronts] == [[0, 1, 2, 6], [3], [4], [5]]
+
+    rng = np.random.default_rng(1)
+    fitness_matrix = rng.random((60, 3))
+    dominates = [[MultiObjFitness(tuple(first)).dominates(MultiObjFitness(tuple(second)))
+                  for second in fitness_matrix] for first in fitness_matrix]
+    rank = np.empty(len(fitness_matrix))
+    for front_idx, front in enumerate(fast_non_dominated_sort(fitness_matrix)):
+        rank[front] = front_idx
+    for i in range(len(fitness_matrix)):
+        for j in range(len(fitness_matrix)):
+            if dominates[i][j]:
+                assert rank[i] < rank[j]
+        # each individual (except the first front) is dominated by some individual from the previous front
+        assert rank[i] == 0 or any(dominates[k][i] for k in np.flatnonzero(rank == rank[i] - 1))
+
+
+def test_crowding_distance():
+    fitness_matrix = np.array([[0., 4.], [1., 2.], [3., 1.], [4., 0.]])
+    distances = crowding_distance(fitness_matrix)
+    assert np.isinf(distances[[0, 3]]).all()
+    assert np.allclose(distances[1:3], [3 / 4 + 3 / 4, 3 / 4 + 2 / 4])
+
+
+def test_nsga2_selection():
+    rng = np.random.default_rng(1)
+    population = get_multi_objective_population(rng.random((40, 2)))
+    requirements = GPAlgorithmParameters(selection_types=[SelectionTypesEnum.nsga2], pop_size=15)
+
+    selected_individuals = Selection(requirements)(population)
+
+    assert len(selected_individuals) == 15
+    assert len(set(map(id, selected_individuals))) == 15
+    first_front = fast_non_dominated_sort(np.array([ind.fitness.values for ind in population]))[0]
+    assert {id(population[i]) for i in first_front} <= set(map(id, selected_individuals))
+
+
+@pytest.mark.parametrize('batched, replace', [(False, False), (True, False), (False, True)])
+def test_tournament_selection_options(batched, replace):
+    population = get_population()
+    pop_size = 3
+
+    selected_individuals = tournament_selection(population, pop_size, batched=batched, replace=replace)
+
+    assert len(selected_individuals) == pop_size
+    assert all(ind in population for ind in selected_individuals)
+    if not replace:
+        assert len(set(map(id, selected_individuals))) == pop_size
+
+
+def test_tournament_selection_with_whole_population_in_tournament():
+    population = get_population()
+    best_individuals = sorted(population, key=lambda ind: ind.fitness, reverse=True)[:3]
+
+    selected_individuals = tournament_selection(population, 3, fraction=1.)
+
+    assert selected_individuals == best_individuals
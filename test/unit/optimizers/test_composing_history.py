@@ -1,4 +1,5 @@
 import itertools
+import json
 import os
 from pathlib import Path
 from random import random
@@ -15,8 +16,12 @@ from golem.core.optimisers.genetic.operators.crossover import CrossoverTypesEnum
 from golem.core.optimisers.genetic.operators.mutation import Mutation
 from golem.core.optimisers.graph import OptGraph, OptNode
 from golem.core.optimisers.objective import Objective, ObjectiveEvaluate
+from golem.core.optimisers.objective.objective import ObjectiveInfo
+from golem.core.optimisers.opt_history_objects.history_stream import HISTORY_STREAM_FILE, OptHistoryStreamReader, \
+    history_index_paths
 from golem.core.optimisers.opt_history_objects.individual import Individual
 from golem.core.optimisers.opt_history_objects.opt_history import OptHistory
+from golem.core.optimisers.opt_history_objects.opt_history_table import OptHistoryTable
 from golem.core.optimisers.opt_history_objects.parent_operator import ParentOperator
 from golem.core.optimisers.optimization_parameters import GraphRequirements
 from golem.core.optimisers.optimizer import GraphGenerationParams
@@ -260,6 +265,81 @@ def test_newly_generated_history(n_jobs: int):
     _test_individuals_in_history(loaded_history)
 
 
+def test_streamed_history_same_as_saved(tmp_path):
+    num_of_gens = 3
+    objective = Objective({'random_metric': RandomMetric.get_value})
+    init_graphs = [graph_first(), graph_second(), graph_third(), graph_fourth(), graph_fifth()]
+    requirements = GraphRequirements(num_of_generations=num_of_gens, history_dir=str(tmp_path), stream_history=True)
+    graph_generation_params = GraphGenerationParams(available_node_types=['a', 'b', 'c', 'd', 'e', 'f'])
+    opt = EvoGraphOptimizer(objective, init_graphs, requirements, graph_generation_params,
+                            GPAlgorithmParameters(pop_size=5))
+    opt.optimise(ObjectiveEvaluate(objective))
+    history = opt.history
+
+    # the whole history is kept in one file instead of the per-individual files
+    stream_path = tmp_path / HISTORY_STREAM_FILE
+    assert sorted(os.listdir(tmp_path)) == sorted(path.name for path in [stream_path,
+                                                                         *history_index_paths(stream_path)])
+    streamed_history = OptHistory.load_stream(tmp_path / HISTORY_STREAM_FILE)
+
+    assert streamed_history.objective.metric_names == history.objective.metric_names
+    assert [gen.label for gen in streamed_history.generations] == [gen.label for gen in history.generations]
+    assert streamed_history.generations == history.generations
+    assert streamed_history.archive_history == history.archive_history
+    # graphs are compared after the same serialization
+    reloaded_history = OptHistory.load(history.save())
+    for streamed_ind, ind in zip(itertools.chain(*streamed_history.generations),
+                                 itertools.chain(*reloaded_history.generations)):
+        assert streamed_ind.fitness == ind.fitness
+        assert streamed_ind.graph.descriptive_id == ind.graph.descriptive_id
+        assert [p.uid for p in streamed_ind.parents] == [p.uid for p in ind.parents]
+    _test_individuals_in_history(streamed_history)
+
+    generations = iter(OptHistoryStreamReader(tmp_path / HISTORY_STREAM_FILE))
+    first_generation, _ = next(generations)
+    assert first_generation == history.generations[0]
+
+    history_view = OptHistory.load_lazy(tmp_path / HISTORY_STREAM_FILE)
+    last_generation = history_view.generation(-1)
+    assert last_generation == history.generations[-1]
+    assert history_view.archive(-1) == history.archive_history[-1]
+    # parents of the lazily loaded individuals are loaded too
+    _test_individuals_in_history(history_view)
+
+
+@pytest.mark.parametrize('is_multi_objective', [False, True])
+def test_historical_fitness_of_invalid_individuals(tmp_path, is_multi_objective):
+    history = OptHistory(ObjectiveInfo(is_multi_objective))
+    history.add_to_history([create_individual(), create_individual(evaluated=False)])
+    history.save_stream(tmp_path / HISTORY_STREAM_FILE)
+    history_view = OptHistory.load_lazy(tmp_path / HISTORY_STREAM_FILE)
+
+    for historical_fitness in (history.historical_fitness, history_view.historical_fitness):
+        generation_fitness = historical_fitness[0][0] if is_multi_objective else historical_fitness[0]
+        assert isinstance(generation_fitness[0], float)
+        assert generation_fitness[1] is None
+
+
+@pytest.mark.parametrize('generate_history', [[3, 4, create_individual]], indirect=True)
+def test_lazy_history(tmp_path, generate_history):
+    history = generate_history
+    history.save_stream(tmp_path / HISTORY_STREAM_FILE)
+    history_view = OptHistory.load_lazy(tmp_path / HISTORY_STREAM_FILE)
+
+    # fitness is available without loading the generations
+    assert history_view.generations_count == len(history.generations)
+    assert np.allclose(history_view.all_historical_quality(1), history.all_historical_quality(1))
+    assert np.allclose(history_view.historical_fitness, history.historical_fitness)
+    assert not history_view._generations
+
+    assert history_view.generations[1] == history.generations[1]
+    assert history_view.generations[1] is history_view.generation(1)
+    assert [ind.fitness for ind in history_view.generation(1)] == [ind.fitness for ind in history.generations[1]]
+    assert list(history_view._generations) == [1]
+    assert history_view.archive(2) == history.archive_history[2]
+    assert history_view.to_history().generations == history.generations
+
+
 @pytest.mark.parametrize('generate_history', [[3, 4, create_individual],
                                               [3, 4, create_mock_graph_individual]],
                          indirect=True)
@@ -291,6 +371,26 @@ def test_extra_history_visualizer(tmp_path, generate_history):
     assert len(os.listdir(os.path.join(str(tmp_path), 'composing_history'))) == 3
 
 
+def test_history_table(tmp_path):
+    test_history_path = Path(__file__).parent.parent.parent
+    history = OptHistory.load(os.path.join(test_history_path, 'data', 'test_history.json'))
+    individuals = list(itertools.chain(*history.generations))
+
+    table = history.to_table()
+    assert len(table) == len(individuals)
+    assert table.generations_count == len(history.generations)
+    assert table.uid.tolist() == [ind.uid for ind in individuals]
+    assert np.array_equal(table.graph_depth, [ind.graph.depth for ind in individuals])
+    assert np.array_equal(table.graph_size, [ind.graph.length for ind in individuals])
+    assert np.allclose(table.generation_fitness(1), [ind.fitness.values for ind in history.generations[1]])
+    assert list(table.parents) == [tuple(p.uid for p in ind.parents) for ind in individuals]
+    assert list(table.operator) == [ind.parent_operator.type_ if ind.parent_operator else '' for ind in individuals]
+
+    table.save(tmp_path / 'table.npz')
+    loaded_table = OptHistoryTable.load(tmp_path / 'table.npz')
+    assert loaded_table.to_dataframe().equals(table.to_dataframe())
+
+
 def test_history_correct_serialization():
     test_history_path = Path(__file__).parent.parent.parent
     test_history_path = os.path.join(test_history_path, 'data', 'test_history.json')
@@ -304,6 +404,32 @@ def test_history_correct_serialization():
     _test_individuals_in_history(reloaded_history)
 
 
+def test_history_graphs_deduplication():
+    history = OptHistory()
+    initial_individuals = [create_individual() for _ in range(3)]
+    history.add_to_history(initial_individuals)
+    # unchanged copies of the graphs are stored once, while the same structure with other nodes is stored separately
+    copied_individuals = [Individual(ind.graph.clone()) for ind in initial_individuals]
+    history.add_to_history(copied_individuals)
+
+    dumped_history = json.loads(history.save())
+    loaded_history = OptHistory.load(history.save())
+
+    assert len(dumped_history['graphs_pool']) == len(initial_individuals)
+    for generation, loaded_generation in zip(history.generations, loaded_history.generations):
+        for ind, loaded_ind in zip(generation, loaded_generation):
+            assert [node.uid for node in loaded_ind.graph.nodes] == [node.uid for node in ind.graph.nodes]
+            assert loaded_ind.graph.descriptive_id == ind.graph.descriptive_id
+    for initial_ind, copied_ind in zip(*loaded_history.generations):
+        assert initial_ind.graph is copied_ind.graph
+    assert history.save() == loaded_history.save()
+
+    # graphs missing in the pool are not replaced silently
+    del dumped_history['graphs_pool'][dumped_history['individuals_pool'][0]['graph']]
+    with pytest.raises(ValueError):
+        OptHistory.load(json.dumps(dumped_history))
+
+
 def test_collect_intermediate_metric():
     metric = RandomMetric.get_value
     graph_gen_params = GraphGenerationParams(available_node_types=['a', 'b', 'c'],
@@ -358,7 +484,7 @@ def test_light_history_is_significantly_lighter(generate_history):
     history.save(json_file_path=os.path.join(path_to_dir, file_name_heavy), is_save_light=False)
     light_history_size = os.stat(os.path.join(path_to_dir, file_name_light)).st_size
     heavy_history_size = os.stat(os.path.join(path_to_dir, file_name_heavy)).st_size
-    assert light_history_size * 25 <= heavy_history_size
+    assert light_history_size * 20 <= heavy_history_size
     os.remove(path=os.path.join(path_to_dir, file_name_light))
     os.remove(path=os.path.join(path_to_dir, file_name_heavy))
 
@@ -1,17 +1,23 @@
 import datetime
+import os
 from functools import partial
+from typing import List, Sequence
 
 import pytest
 from joblib import cpu_count
 
 from golem.core.adapter import DirectAdapter
 from golem.core.dag.graph import Graph
-from golem.core.optimisers.fitness import Fitness, null_fitness
+from golem.core.optimisers.fitness import Fitness, SingleObjFitness, null_fitness
 from golem.core.optimisers.genetic.evaluation import MultiprocessingDispatcher, SequentialDispatcher, \
-    ObjectiveEvaluationDispatcher
+    ObjectiveEvaluationDispatcher, FitnessCache, AsyncDispatcher
+from golem.core.optimisers.genetic.gp_optimizer import EvoGraphOptimizer
+from golem.core.optimisers.genetic.gp_params import GPAlgorithmParameters
 from golem.core.optimisers.meta.surrogate_evaluator import SurrogateDispatcher
-from golem.core.optimisers.objective import Objective
+from golem.core.optimisers.objective import Objective, ObjectiveEvaluate
 from golem.core.optimisers.opt_history_objects.individual import Individual
+from golem.core.optimisers.optimization_parameters import GraphRequirements
+from golem.core.optimisers.optimizer import GraphGenerationParams
 from golem.core.optimisers.timer import OptimisationTimer
 from golem.utilities.utilities import determine_n_jobs
 from test.unit.utils import graph_first, graph_second, graph_third, graph_fourth, RandomMetric
@@ -37,7 +43,9 @@ def invalid_objective(graph: Graph) -> Fitness:
     'dispatcher',
     [SequentialDispatcher(DirectAdapter()),
      MultiprocessingDispatcher(DirectAdapter()),
-     MultiprocessingDispatcher(DirectAdapter(), n_jobs=-1)]
+     MultiprocessingDispatcher(DirectAdapter(), n_jobs=-1),
+     AsyncDispatcher(DirectAdapter()),
+     AsyncDispatcher(DirectAdapter(), n_jobs=2)]
 )
 def test_dispatchers_with_and_without_multiprocessing(dispatcher):
     _, population = set_up_tests()
@@ -56,7 +64,8 @@ def test_dispatchers_with_and_without_multiprocessing(dispatcher):
 @pytest.mark.parametrize(
     'dispatcher',
     [MultiprocessingDispatcher(DirectAdapter()),
-     SequentialDispatcher(DirectAdapter())]
+     SequentialDispatcher(DirectAdapter()),
+     AsyncDispatcher(DirectAdapter(), n_jobs=2)]
 )
 def test_dispatchers_with_faulty_objectives(objective, dispatcher):
     adapter, population = set_up_tests()
@@ -69,6 +78,7 @@ def test_dispatchers_with_faulty_objectives(objective, dispatcher):
     MultiprocessingDispatcher(DirectAdapter()),
     SequentialDispatcher(DirectAdapter()),
     SurrogateDispatcher(DirectAdapter()),
+    AsyncDispatcher(DirectAdapter()),
 ])
 def test_dispatcher_with_timeout(dispatcher: ObjectiveEvaluationDispatcher):
     adapter, population = set_up_tests()
@@ -92,6 +102,239 @@ def test_dispatcher_with_timeout(dispatcher: ObjectiveEvaluationDispatcher):
     assert len(population) == len(evaluated_population), "Not all graphs was evaluated"
 
 
+@pytest.mark.parametrize('dispatcher_type', [MultiprocessingDispatcher, AsyncDispatcher])
+def test_dispatcher_with_graph_eval_timeout(dispatcher_type):
+    adapter, population = set_up_tests()
+    # the first graph is evaluated too long
+    slow_graph_id = population[0].graph.descriptive_id
+    dispatcher = dispatcher_type(adapter, n_jobs=2, graph_eval_timeout=datetime.timedelta(seconds=2))
+
+    def objective(graph):
+        return get_objective(graph, delay=60 if graph.descriptive_id == slow_graph_id else 0)
+
+    evaluator = dispatcher.dispatch(objective)
+    evaluated_population = evaluator(population)
+    dispatcher.shutdown()
+
+    assert len(evaluated_population) == len(population) - 1
+    assert population[0] not in evaluated_population
+    assert not population[0].fitness.valid
+    assert population[0].metadata['evaluation_timeout']
+
+
+def pid_objective(graph: Graph) -> Fitness:
+    return SingleObjFitness(os.getpid())
+
+
+@pytest.mark.parametrize('dispatcher_type', [MultiprocessingDispatcher, AsyncDispatcher])
+def test_dispatcher_reuses_workers(dispatcher_type):
+    adapter, population = set_up_tests()
+    # time limit makes dispatcher use worker processes even if there is only one CPU
+    dispatcher = dispatcher_type(adapter, n_jobs=2, graph_eval_timeout=datetime.timedelta(minutes=5))
+    evaluator = dispatcher.dispatch(pid_objective)
+
+    first_pids = {ind.fitness.value for ind in evaluator(population)}
+    second_pids = {ind.fitness.value for ind in evaluator(set_up_tests()[1])}
+    dispatcher.shutdown()
+
+    assert os.getpid() not in first_pids
+    assert second_pids <= first_pids
+
+
+@pytest.mark.parametrize('dispatcher_type', [MultiprocessingDispatcher, AsyncDispatcher])
+def test_dispatcher_reuses_workers_on_new_dispatch(dispatcher_type):
+    adapter, population = set_up_tests()
+    dispatcher = dispatcher_type(adapter, n_jobs=2, graph_eval_timeout=datetime.timedelta(minutes=5))
+
+    first_pids = {ind.fitness.value for ind in dispatcher.dispatch(pid_objective)(population)}
+    # the objective and the timer are the same, so the workers aren't restarted
+    second_pids = {ind.fitness.value for ind in dispatcher.dispatch(pid_objective)(set_up_tests()[1])}
+    dispatcher.shutdown()
+
+    assert second_pids <= first_pids
+
+
+def params_setting_objective(graph: Graph) -> Fitness:
+    if graph.depth > 2:
+        graph.nodes[0].parameters = {'evaluated': True}
+    return SingleObjFitness(graph.length)
+
+
+def test_dispatcher_returns_graphs_changed_by_evaluation():
+    adapter, population = set_up_tests()
+    graphs = [ind.graph for ind in population]
+    dispatcher = MultiprocessingDispatcher(adapter, graph_eval_timeout=datetime.timedelta(minutes=5))
+    evaluated_population = dispatcher.dispatch(params_setting_objective)(population)
+    dispatcher.shutdown()
+
+    assert len(evaluated_population) == len(population)
+    for ind, graph in zip(population, graphs):
+        is_changed = graph.depth > 2
+        assert (ind.graph is not graph) == is_changed
+        assert ind.graph.nodes[0].parameters.get('evaluated', False) == is_changed
+
+
+class CountingObjective:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, graph: Graph) -> Fitness:
+        self.calls += 1
+        return Objective({'length': lambda g: g.length})(graph)
+
+
+@pytest.mark.parametrize('dispatcher_type', [SequentialDispatcher, MultiprocessingDispatcher, AsyncDispatcher])
+def test_dispatchers_with_fitness_cache(dispatcher_type):
+    adapter, population = set_up_tests()
+    objective = CountingObjective()
+    dispatcher = dispatcher_type(adapter, fitness_cache=FitnessCache())
+
+    evaluator = dispatcher.dispatch(objective)
+    evaluated_population = evaluator(population)
+    assert objective.calls == len(population)
+
+    # structurally identical graphs are not evaluated again
+    same_population = [Individual(ind.graph) for ind in set_up_tests()[1]]
+    evaluated_same_population = evaluator(same_population)
+    assert objective.calls == len(population)
+    assert len(evaluated_same_population) == len(same_population)
+    assert [ind.fitness for ind in evaluated_population] == [ind.fitness for ind in evaluated_same_population]
+    # individuals that got fitness from the cache have the evaluation metadata too
+    assert not any(ind.metadata.get('fitness_from_cache') for ind in evaluated_population)
+    for ind in evaluated_same_population:
+        assert ind.metadata['fitness_from_cache']
+        assert ind.metadata['computation_time_in_seconds'] == 0
+        assert ind.metadata['evaluation_time_iso']
+
+
+@pytest.mark.parametrize('n_jobs', [1, 2])
+def test_async_dispatcher_submit_and_collect(n_jobs):
+    adapter, population = set_up_tests()
+    dispatcher = AsyncDispatcher(adapter, n_jobs=n_jobs)
+    dispatcher.dispatch(get_objective)
+
+    assert dispatcher.submit(population) == []
+    assert dispatcher.num_in_flight == len(population)
+
+    evaluated_population = []
+    while dispatcher.num_in_flight > 0:
+        evaluated_population.extend(dispatcher.collect())
+    dispatcher.shutdown()
+
+    assert len(evaluated_population) == len(population)
+    assert all(ind.fitness.valid for ind in evaluated_population)
+    # already evaluated individuals are returned right away
+    assert len(dispatcher.submit(evaluated_population)) == len(population)
+    assert dispatcher.num_in_flight == 0
+
+
+class BatchLengthMetric:
+    def __init__(self):
+        self.batch_calls = 0
+
+    def __call__(self, graph: Graph) -> float:
+        return graph.length
+
+    def evaluate_batch(self, graphs: Sequence[Graph]) -> List[float]:
+        self.batch_calls += 1
+        return [graph.length for graph in graphs]
+
+
+def test_objective_batch_evaluation():
+    _, population = set_up_tests()
+    graphs = [ind.graph for ind in population]
+    metric = BatchLengthMetric()
+    objective = Objective({'length': metric, 'depth': lambda graph: graph.depth}, is_multi_objective=True)
+
+    assert objective.supports_batch_evaluation
+    assert ObjectiveEvaluate(objective).supports_batch_evaluation
+    assert not Objective({'depth': lambda graph: graph.depth}).supports_batch_evaluation
+    assert ObjectiveEvaluate(objective).evaluate_batch(graphs) == [objective(graph) for graph in graphs]
+    assert metric.batch_calls == 1
+
+
+@pytest.mark.parametrize('hard_graph_fit_timeout', [False, True])
+def test_optimizer_hard_graph_fit_timeout_is_opt_in(hard_graph_fit_timeout):
+    adapter, population = set_up_tests()
+    requirements = GraphRequirements(max_graph_fit_time=datetime.timedelta(seconds=10),
+                                     hard_graph_fit_timeout=hard_graph_fit_timeout, n_jobs=1)
+    optimizer = EvoGraphOptimizer(Objective({'random_metric': RandomMetric.get_value}),
+                                  [ind.graph for ind in population], requirements,
+                                  GraphGenerationParams(adapter=adapter), GPAlgorithmParameters())
+
+    # without the hard timeout graphs are evaluated in the main process
+    assert optimizer.eval_dispatcher._get_pool().is_in_process is not hard_graph_fit_timeout
+
+
+@pytest.mark.parametrize('dispatcher', [SequentialDispatcher(DirectAdapter()),
+                                        MultiprocessingDispatcher(DirectAdapter()),
+                                        AsyncDispatcher(DirectAdapter()),
+                                        MultiprocessingDispatcher(DirectAdapter(), n_jobs=2,
+                                                                  graph_eval_timeout=datetime.timedelta(minutes=1))])
+def test_dispatchers_with_batch_objective(dispatcher):
+    _, population = set_up_tests()
+    metric = BatchLengthMetric()
+    objective = ObjectiveEvaluate(Objective({'length': metric}))
+
+    evaluated_population = dispatcher.dispatch(objective)(population)
+    dispatcher.shutdown()
+
+    assert len(evaluated_population) == len(population)
+    assert all(ind.fitness == SingleObjFitness(ind.graph.length) for ind in evaluated_population)
+    if dispatcher._get_pool().is_in_process:
+        assert metric.batch_calls == 1
+
+
+def test_fitness_cache_eviction():
+    _, population = set_up_tests()
+    cache = FitnessCache(maxsize=2)
+    for i, ind in enumerate(population):
+        cache.put(ind.graph, SingleObjFitness(i))
+
+    assert len(cache) == 2
+    assert cache.get(population[0].graph) is None
+    assert cache.get(population[-1].graph) == SingleObjFitness(len(population) - 1)
+
+
+def test_fitness_cache_persistence(tmp_path):
+    _, population = set_up_tests()
+    cache_path = tmp_path / 'fitness_cache'
+    cache = FitnessCache(cache_path=cache_path, namespace='problem')
+    cache.put(population[0].graph, SingleObjFitness(1.))
+    cache.put(population[1].graph, null_fitness())
+    cache.close()
+
+    restored_cache = FitnessCache(cache_path=cache_path, namespace='problem')
+    assert restored_cache.get(population[0].graph) == SingleObjFitness(1.)
+    assert restored_cache.get(population[1].graph) is None
+    restored_cache.close()
+
+    # values of the other problem are not reused
+    other_cache = FitnessCache(cache_path=cache_path, namespace='other_problem')
+    assert other_cache.get(population[0].graph) is None
+    other_cache.close()
+
+    with pytest.raises(ValueError):
+        FitnessCache(cache_path=cache_path)
+
+
+@pytest.mark.parametrize('dispatcher_type', [SequentialDispatcher, MultiprocessingDispatcher, AsyncDispatcher])
+def test_fitness_cache_duplicates_in_batch(dispatcher_type):
+    adapter, population = set_up_tests()
+    objective = CountingObjective()
+    dispatcher = dispatcher_type(adapter, fitness_cache=FitnessCache())
+    # structurally identical graphs in the same population
+    population_with_duplicates = population + [Individual(ind.graph) for ind in set_up_tests()[1]]
+
+    evaluated_population = dispatcher.dispatch(objective)(population_with_duplicates)
+
+    assert objective.calls == len(population)
+    assert len(evaluated_population) == len(population_with_duplicates)
+    assert all(ind.fitness == SingleObjFitness(ind.graph.length) for ind in evaluated_population)
+    assert all('evaluation_time_iso' in ind.metadata for ind in evaluated_population)
+    assert sum(bool(ind.metadata.get('fitness_from_cache')) for ind in evaluated_population) == len(population)
+
+
 def test_n_jobs_for_dispatcher():
     for n_jobs in range(-cpu_count(), cpu_count() + 5):
         if n_jobs != 0:
@@ -1,7 +1,10 @@
 from typing import Sequence
 
-from golem.core.optimisers.archive import GenerationKeeper
-from golem.core.optimisers.fitness import Fitness, MultiObjFitness, null_fitness
+import numpy as np
+
+from golem.core.optimisers.archive import GenerationKeeper, HallOfFame, ParetoFront
+from golem.core.optimisers.archive.generation_keeper import _individuals_key, _individuals_same
+from golem.core.optimisers.fitness import Fitness, MultiObjFitness, SingleObjFitness, null_fitness
 from golem.core.optimisers.genetic.operators.operator import PopulationT
 from golem.core.optimisers.graph import OptGraph, OptNode
 from golem.core.optimisers.objective import Objective
@@ -74,3 +77,98 @@ def test_archive_multiobj_one_improvement():
     assert len(archive.best_individuals) == previous_size + 1
     assert archive.is_complexity_improved
     assert not archive.is_quality_improved
+
+
+def test_pareto_front_is_same_as_sequential_update():
+    rng = np.random.default_rng(1)
+    populations = [create_population([MultiObjFitness(tuple(values), weights=-1)
+                                      for values in np.round(rng.random((20, 2)) * 10)])
+                   for _ in range(5)]
+    # same individuals in different populations
+    populations.append(populations[0][:5])
+
+    front = ParetoFront(similar=_individuals_same)
+    sequential_front = ParetoFront(similar=_individuals_same)
+    for population in populations:
+        front.update(population)
+        sequential_front._update_one_by_one(population)
+
+        assert front.items == sequential_front.items
+
+
+def test_pareto_front_with_similarity_key_is_same_as_without_it():
+    rng = np.random.default_rng(2)
+    populations = [create_population([MultiObjFitness(tuple(values), weights=-1)
+                                      for values in np.round(rng.random((20, 2)) * 5)])
+                   for _ in range(5)]
+
+    front = ParetoFront(maxsize=6, similar=_individuals_same, similarity_key=_individuals_key)
+    front_without_key = ParetoFront(maxsize=6, similar=_individuals_same)
+    for population in populations:
+        front.update(population)
+        front_without_key.update(population)
+
+        assert front.items == front_without_key.items
+        assert sum(map(len, front._index.values())) == len(front)
+
+
+def test_similarity_key_consistent_with_similarity_criteria():
+    fitness = MultiObjFitness((1., 2.), weights=-1)
+    first = Individual(OptGraph([OptNode('a')]))
+    # graphs with the same set of root nodes are equal
+    second = Individual(OptGraph([OptNode('a'), OptNode('a')]))
+    third = Individual(OptGraph([OptNode('b')]))
+    for ind in (first, second, third):
+        ind.set_evaluation_result(fitness)
+
+    assert _individuals_same(first, second)
+    assert _individuals_key(first) == _individuals_key(second)
+    assert not _individuals_same(first, third)
+    assert _individuals_key(first) != _individuals_key(third)
+
+    front = ParetoFront(maxsize=6, similar=_individuals_same, similarity_key=_individuals_key)
+    front.update([first, second])
+    assert front.items == [first]
+
+
+def test_pareto_front_computes_similarity_key_only_for_same_fitness():
+    keyed_individuals = []
+
+    def similarity_key(ind: Individual):
+        keyed_individuals.append(ind)
+        return _individuals_key(ind)
+
+    front = ParetoFront(similar=_individuals_same, similarity_key=similarity_key)
+    population = create_population([MultiObjFitness((value, 5. - value), weights=-1) for value in range(5)])
+    front.update(population)
+    keyed_individuals.clear()
+
+    twin = create_individual(MultiObjFitness((0., 5.), weights=-1))
+    front.update(population + (twin,))
+
+    # only the new twin is checked by the key, keys of the front members are already known
+    assert keyed_individuals == [twin]
+    assert {ind.uid for ind in front.items} == {ind.uid for ind in population}
+
+
+def test_hall_of_fame_keeps_best_unique_individuals():
+    rng = np.random.default_rng(3)
+    all_values = rng.permutation(100)
+    populations = [create_population([SingleObjFitness(value) for value in values])
+                   for values in np.split(all_values, 5)]
+    # the same individuals can come again
+    populations.append(populations[-1])
+
+    hall_of_fame = HallOfFame(maxsize=5)
+    seen = []
+    for population in populations:
+        hall_of_fame.update(population)
+        seen.extend(ind for ind in population if ind not in seen)
+
+        expected = sorted(seen, key=lambda ind: ind.fitness, reverse=True)[:5]
+        assert hall_of_fame.items == expected
+        assert list(hall_of_fame) == expected
+        assert list(reversed(hall_of_fame)) == expected[::-1]
+        assert hall_of_fame[0] is expected[0] and hall_of_fame[-1] is expected[-1]
+        assert hall_of_fame.keys == [ind.fitness for ind in reversed(expected)]
+        assert set(hall_of_fame._index) == {ind.uid for ind in expected}
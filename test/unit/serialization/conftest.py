@@ -17,7 +17,7 @@ from .shared_data import TestClass, TestEnum, TestSerializableClass
 
 @pytest.fixture
 def get_class_fixture(monkeypatch):
-    def mock_get_class(json_obj: dict):
+    def mock_get_class(json_obj: dict, failed_imports=None):
         return json_obj[CLASS_PATH_KEY]
 
     monkeypatch.setattr(
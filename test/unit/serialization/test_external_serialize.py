@@ -1,3 +1,4 @@
+import json
 import os.path
 from itertools import chain
 
@@ -5,10 +6,13 @@ import pytest
 
 from golem.core.dag.graph import Graph
 from golem.core.dag.graph_node import GraphNode
+from golem.core.dag.linked_graph_node import LinkedGraphNode
 from golem.core.optimisers.fitness import Fitness
 from golem.core.optimisers.opt_history_objects.individual import Individual
 from golem.core.optimisers.opt_history_objects.opt_history import OptHistory
 from golem.core.paths import project_root
+from golem.serializers.serializer import CLASS_PATH_KEY, MODULE_X_NAME_DELIMITER, SERIALIZATION_BACKENDS, \
+    default_load
 
 
 @pytest.mark.parametrize('history_path', [
@@ -56,3 +60,28 @@ def history_plausible(history: OptHistory):
     assert all_historical_fitness_correct
     for individual in chain(*history.generations):
         individual_plausible(individual)
+
+
+@pytest.mark.parametrize('backend', SERIALIZATION_BACKENDS)
+def test_history_backends_round_trip(backend):
+    if backend == 'msgpack':
+        pytest.importorskip('msgpack')
+    history = OptHistory.load(project_root() / 'test/data/history_composite_bn_healthcare.json')
+
+    saved = history.save(backend=backend)
+    loaded_history = OptHistory.load(saved, backend=backend)
+
+    history_plausible(loaded_history)
+    assert loaded_history.save() == history.save()
+
+
+def test_failed_imports_are_not_remembered_between_loads(tmp_path, monkeypatch):
+    saved_node = json.dumps({CLASS_PATH_KEY: f'external_nodes{MODULE_X_NAME_DELIMITER}ExternalNode',
+                             'content': {'name': 'n1'}, '_nodes_from': [], 'uid': 'uid'})
+    # the module is unavailable, so the node is decoded as the base node
+    assert type(default_load(saved_node)) is LinkedGraphNode
+
+    (tmp_path / 'external_nodes.py').write_text('from golem.core.dag.linked_graph_node import LinkedGraphNode\n\n\n'
+                                                'class ExternalNode(LinkedGraphNode):\n    pass\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    assert type(default_load(saved_node)).__name__ == 'ExternalNode'
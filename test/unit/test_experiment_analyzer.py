@@ -0,0 +1,31 @@
+from experiments.experiment_analyzer import ExperimentAnalyzer
+from golem.core.optimisers.fitness import SingleObjFitness
+from golem.core.optimisers.graph import OptGraph, OptNode
+from golem.core.optimisers.opt_history_objects.individual import Individual
+from golem.core.optimisers.opt_history_objects.opt_history import OptHistory
+
+
+def create_history(fitness_per_generation, time_per_generation) -> OptHistory:
+    history = OptHistory()
+    for fitness_values, computation_time in zip(fitness_per_generation, time_per_generation):
+        generation = [Individual(OptGraph(OptNode('a')), fitness=SingleObjFitness(value),
+                                 metadata={'computation_time_in_seconds': computation_time})
+                      for value in fitness_values]
+        history.add_to_history(generation)
+    best_individual = min(history.generations[-1], key=lambda ind: ind.fitness.value)
+    history.add_to_history([best_individual], generation_label='final_choices')
+    return history
+
+
+def test_analyze_convergence(tmp_path):
+    # the best fitness is firstly obtained in the second generation
+    history = create_history(fitness_per_generation=[[3., 2.], [2., 1.], [1.]],
+                             time_per_generation=[1., 2., 4.])
+    history_dir = tmp_path / 'setup' / 'dataset' / 'launch' / 'history'
+    history_dir.mkdir(parents=True)
+    history.save(history_dir / 'history.json')
+
+    convergence = ExperimentAnalyzer(path_to_root=str(tmp_path)).analyze_convergence()
+
+    # only evaluations of the generations before the best one are counted
+    assert convergence == {'metric': {'setup': {'dataset': [2.]}}}
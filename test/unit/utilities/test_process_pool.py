@@ -0,0 +1,52 @@
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED
+
+import pytest
+
+from golem.utilities.process_pool import TaskTimeoutError, TimeoutProcessPool
+
+
+def sleepy_square(x: int, delay: float = 0.) -> int:
+    time.sleep(delay)
+    return x * x
+
+
+def get_pid() -> int:
+    return os.getpid()
+
+
+def test_pool_in_process():
+    pool = TimeoutProcessPool(n_workers=1)
+    futures = [pool.submit(sleepy_square, x) for x in range(3)]
+    assert all(future.done() for future in futures)
+    assert pool.submit(get_pid).result() == os.getpid()
+
+
+@pytest.mark.parametrize('n_workers', [1, 2])
+def test_pool_kills_stuck_tasks(n_workers):
+    pool = TimeoutProcessPool(n_workers=n_workers, task_timeout=2)
+    stuck_future = pool.submit(sleepy_square, 0, delay=60)
+    futures = [pool.submit(sleepy_square, x, delay=0.1) for x in range(1, 4)]
+
+    start_time = time.time()
+    done = pool.wait(futures + [stuck_future])
+    pool.shutdown()
+
+    assert len(done) == len(futures) + 1
+    assert time.time() - start_time < 30
+    assert [future.result() for future in futures] == [1, 4, 9]
+    with pytest.raises(TaskTimeoutError):
+        stuck_future.result()
+
+
+def test_pool_wait_first_completed():
+    pool = TimeoutProcessPool(n_workers=2)
+    slow_future = pool.submit(sleepy_square, 2, delay=3)
+    fast_future = pool.submit(sleepy_square, 3)
+
+    done = pool.wait([slow_future, fast_future], return_when=FIRST_COMPLETED)
+    assert done == {fast_future}
+    assert fast_future.result() == 9
+    assert pool.wait([slow_future], timeout=0) == set()
+    pool.shutdown()